@@ -0,0 +1,217 @@
+"""
+Módulo do refinamento adaptativo da malha (AMR). A cada `N` passos um
+indicador calculado sobre o campo marca as células que devem ser divididas ao
+meio ou juntadas com a sua irmã. As células da malha base têm nível `0` e cada
+divisão aumenta o nível em `1`. A transferência dos campos entre as malhas
+conserva a energia `ro * cp * dx * u` de cada célula.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from pyheat1d.mesh import Grading, Mesh
+
+
+def _gradient_indicator(u: np.ndarray) -> np.ndarray:
+    jump = np.abs(np.diff(u))
+    indicator = np.zeros_like(u)
+    indicator[:-1] = jump
+    indicator[1:] = np.maximum(indicator[1:], jump)
+    return indicator
+
+
+def _curvature_indicator(u: np.ndarray) -> np.ndarray:
+    indicator = np.zeros_like(u)
+    indicator[1:-1] = np.abs(u[2:] - 2.0 * u[1:-1] + u[:-2])
+    indicator[0], indicator[-1] = indicator[1], indicator[-2]
+    return indicator
+
+
+AMR_INDICATORS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "gradient": _gradient_indicator,
+    "curvature": _curvature_indicator,
+}
+
+
+@dataclass
+class AmrCriterion:
+    """
+    Critério do refinamento adaptativo.
+
+    Info:
+        Indicadores disponiveis, os dois têm a unidade do campo:
+
+        * `gradient` - Maior salto de `u` entre a célula e as suas vizinhas.
+        * `curvature` - Segunda diferença `|u[i+1] - 2 u[i] + u[i-1]|`.
+
+    Parameters:
+        every (int): Refaz a malha a cada `N` passos.
+        refine_tol (float): Células com o indicador maior que esse valor são divididas.
+        coarsen_tol (float): Pares de células irmãs com o indicador menor que esse valor são juntados.
+        max_level (int): Número máximo de divisões de uma célula da malha base.
+        indicator (str): Indicador do refinamento.
+    """
+
+    every: int
+    refine_tol: float
+    coarsen_tol: float
+    max_level: int = 3
+    indicator: str = "gradient"
+
+    def must_regrid(self, step: int) -> bool:
+        """
+        Verifica se a malha deve ser refeita no passo.
+
+        Parameters:
+            step: Passo de tempo.
+        """
+        return step % self.every == 0
+
+
+@dataclass
+class AmrTree:
+    """
+    Posição de cada célula na hierarquia de refinamento.
+
+    Parameters:
+        base (np.ndarray): Célula da malha base que contém a célula.
+        level (np.ndarray): Nível de refinamento.
+        path (np.ndarray): Posição da célula entre as `2**level` partes da célula base.
+    """
+
+    base: np.ndarray
+    level: np.ndarray
+    path: np.ndarray
+
+    @classmethod
+    def from_base(cls, n_cells: int) -> "AmrTree":
+        """Árvore da malha base, sem refinamento."""
+        zeros = np.zeros(n_cells, dtype=np.int64)
+        return cls(base=np.arange(n_cells, dtype=np.int64), level=zeros, path=zeros.copy())
+
+    def are_siblings(self, i: int) -> bool:
+        """Verifica se as células `i` e `i + 1` vieram da divisão da mesma célula."""
+        return bool(
+            self.level[i] > 0
+            and self.base[i] == self.base[i + 1]
+            and self.level[i] == self.level[i + 1]
+            and self.path[i] % 2 == 0
+            and self.path[i + 1] == self.path[i] + 1
+        )
+
+
+def _target_levels(tree: AmrTree, indicator: np.ndarray, criterion: AmrCriterion) -> np.ndarray:
+    """
+    Nível de cada célula depois da nova malha. A diferença de nível entre
+    células vizinhas fica limitada a `1`, cancelando junções ou dividindo mais
+    células quando necessário.
+    """
+
+    level, n = tree.level, len(tree.level)
+
+    target = level.copy()
+    target[(indicator > criterion.refine_tol) & (level < criterion.max_level)] += 1
+
+    coarsen = indicator < criterion.coarsen_tol
+    for i in range(n - 1):
+        if target[i] == level[i] and coarsen[i] and coarsen[i + 1] and tree.are_siblings(i):
+            if target[i + 1] == level[i + 1]:
+                target[i] = target[i + 1] = level[i] - 1
+
+    changed = True
+    while changed:
+        changed = False
+        for i in range(n - 1):
+            for fine, coarse in ((i, i + 1), (i + 1, i)):
+                if target[fine] - target[coarse] <= 1:
+                    continue
+                changed = True
+                if target[coarse] < level[coarse]:
+                    # ... cancela a junção da célula e da sua irmã
+                    sibling = coarse + 1 if coarse < n - 1 and tree.are_siblings(coarse) else coarse - 1
+                    target[coarse] = target[sibling] = level[coarse]
+                else:
+                    target[coarse] += 1
+
+    return target
+
+
+def regrid(mesh: Mesh, tree: AmrTree, criterion: AmrCriterion) -> tuple[Mesh, AmrTree]:
+    """
+    Refaz a malha dividindo e juntando células. As células filhas recebem o
+    campo e as propriedades da célula mãe. Na junção `ro` é a média pela
+    largura, `cp` a média pela massa, `u` a média pela capacidade térmica e
+    `k` a condutividade equivalente das duas células em série, assim a energia
+    de cada célula é conservada.
+
+    Parameters:
+        mesh: A malha atual.
+        tree: Hierarquia de refinamento da malha atual.
+        criterion: Critério do refinamento.
+
+    Returns:
+        Retorna a nova malha e a sua hierarquia de refinamento.
+    """
+
+    u, props, x = mesh.cells.results.u, mesh.cells.props, mesh.nodes.x
+    ro, cp, k, dx = props.ro, props.cp, props.k, mesh.dx
+
+    target = _target_levels(tree, AMR_INDICATORS[criterion.indicator](u), criterion)
+
+    nodes: list[float] = [x[0]]
+    cells: dict[str, list] = {name: [] for name in ("u", "ro", "cp", "k", "base", "level", "path")}
+
+    def append(**values) -> None:
+        for name, value in values.items():
+            cells[name].append(value)
+
+    i = 0
+    while i < mesh.n_cells:
+        base, level, path = tree.base[i], tree.level[i], tree.path[i]
+        if target[i] > level:
+            nodes.extend((0.5 * (x[i] + x[i + 1]), x[i + 1]))
+            for child in (0, 1):
+                append(u=u[i], ro=ro[i], cp=cp[i], k=k[i], base=base, level=level + 1, path=2 * path + child)
+            i += 1
+        elif target[i] < level:
+            j = i + 1
+            mass = ro[i] * dx[i] + ro[j] * dx[j]
+            capacity = ro[i] * cp[i] * dx[i] + ro[j] * cp[j] * dx[j]
+            width = dx[i] + dx[j]
+            nodes.append(x[j + 1])
+            append(
+                u=(ro[i] * cp[i] * dx[i] * u[i] + ro[j] * cp[j] * dx[j] * u[j]) / capacity,
+                ro=mass / width,
+                cp=capacity / mass,
+                k=width / (dx[i] / k[i] + dx[j] / k[j]),
+                base=base,
+                level=level - 1,
+                path=path // 2,
+            )
+            i += 2
+        else:
+            nodes.append(x[i + 1])
+            append(u=u[i], ro=ro[i], cp=cp[i], k=k[i], base=base, level=level, path=path)
+            i += 1
+
+    new_mesh = Mesh(
+        mesh.length,
+        len(nodes) - 1,
+        mesh.lbc,
+        mesh.rbc,
+        grading=Grading(type="nodes", params={"x": nodes}),
+    )
+    new_mesh.mk_grid()
+    for name in ("k", "cp", "ro"):
+        new_mesh.update_prop(prop_name=name, value=np.array(cells[name]))
+    new_mesh.update_cells_results(prop_name="u", value=np.array(cells["u"]))
+
+    new_tree = AmrTree(
+        base=np.array(cells["base"], dtype=np.int64),
+        level=np.array(cells["level"], dtype=np.int64),
+        path=np.array(cells["path"], dtype=np.int64),
+    )
+
+    return new_mesh, new_tree
@@ -0,0 +1,163 @@
+"""
+Módulo da animação do histórico de temperatura. Os quadros são desenhados em
+paralelo em um pool de processos, cada processo abre o seu próprio leitor dos
+resultados e lê apenas os passos do seu lote, então a memória de cada processo
+não depende do tamanho do histórico.
+"""
+
+import os
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from itertools import repeat
+from pathlib import Path
+from typing import TypeVar
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from pyheat1d.plotting import MAX_POINTS, downsample, load_xp, step_label, style_axes
+from pyheat1d.reader import open_results
+
+T = TypeVar("T")
+
+
+def _batches(rows: list[T], n_batches: int) -> list[list[T]]:
+    """Divide as linhas em lotes contíguos, para cada processo ler um trecho do arquivo."""
+
+    size = max(-(-len(rows) // n_batches), 1)
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
+def _rows_range(output_dir: Path, rows: list[int]) -> tuple[float, float]:
+    """Menor e maior temperatura de um lote de linhas."""
+
+    with open_results(output_dir) as reader:
+        lo, hi = np.inf, -np.inf
+        for i in rows:
+            u = reader.step(i)
+            lo, hi = min(lo, float(u.min())), max(hi, float(u.max()))
+    return lo, hi
+
+
+def _render_batch(
+    output_dir: Path,
+    frames: list[tuple[int, int]],
+    frames_dir: Path,
+    ylim: tuple[float, float],
+    max_points: int,
+) -> list[Path]:
+    """
+    Desenha um lote de quadros. A figura é criada uma vez por lote e apenas a
+    curva e a legenda são atualizadas a cada quadro.
+    """
+
+    xp = load_xp(output_dir)
+
+    paths = []
+    with open_results(output_dir) as reader:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        (line,) = ax.plot([], [], label=step_label(reader.t[frames[0][1]]))
+        ax.set_xlim(xp.min(), xp.max())
+        ax.set_ylim(*ylim)
+        style_axes(ax)
+
+        for iframe, i in frames:
+            line.set_data(*downsample(reader.centroids(i, xp), reader.step(i), max_points))
+            line.set_label(step_label(reader.t[i]))
+            ax.legend()
+            path = frames_dir / f"frame_{iframe:06d}.png"
+            fig.savefig(path)
+            paths.append(path)
+
+    return paths
+
+
+def render_frames(
+    output_dir: Path,
+    rows: list[int],
+    frames_dir: Path,
+    workers: int | None = None,
+    max_points: int = MAX_POINTS,
+    ylim: tuple[float, float] | None = None,
+) -> list[Path]:
+    """
+    Desenha um quadro `frame_NNNNNN.png` por linha guardada em um pool de processos.
+    Todos os quadros usam os mesmos limites no eixo y.
+
+    Parameters:
+        output_dir: Diretorio de saida.
+        rows: Linhas guardadas de cada quadro.
+        frames_dir: Diretorio dos quadros.
+        workers: Número de processos. O padrão é o número de CPUs.
+        max_points: Número máximo de pontos de cada curva.
+        ylim: Limites do eixo y. O padrão é a menor e a maior temperatura dos quadros.
+
+    Raises:
+        FileMeshNotFoundError: Arquivo `mesh.json` não achado.
+        FileResultshNotFoundError: Arquivo de resultados não achado.
+
+    Returns:
+        Retorna o caminho dos quadros em ordem.
+    """
+
+    frames_dir.mkdir(parents=True, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    # ... lotes menores que o número de processos equilibram a carga
+    row_batches = _batches(rows, 4 * workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ylim is None:
+            ranges = list(executor.map(_rows_range, repeat(output_dir), row_batches))
+            ylim = (min(lo for lo, _ in ranges), max(hi for _, hi in ranges))
+            if ylim[0] == ylim[1]:
+                ylim = (ylim[0] - 1.0, ylim[1] + 1.0)
+
+        frame_batches = _batches(list(enumerate(rows)), 4 * workers)
+        results = executor.map(
+            _render_batch,
+            repeat(output_dir),
+            frame_batches,
+            repeat(frames_dir),
+            repeat(ylim),
+            repeat(max_points),
+        )
+
+        return [path for paths in results for path in paths]
+
+
+def _open_frames(frames: list[Path]) -> Generator[Image.Image, None, None]:
+    """Abre os quadros um de cada vez, fechando cada arquivo antes de abrir o próximo."""
+
+    for frame in frames:
+        with Image.open(frame) as image:
+            image.load()
+            yield image
+
+
+def write_gif(frames: list[Path], path: Path, fps: float = 10.0) -> None:
+    """
+    Junta os quadros em um GIF. Os quadros são abertos um de cada vez e cada
+    arquivo é fechado antes do próximo ser aberto.
+
+    Parameters:
+        frames: Caminho dos quadros em ordem.
+        path: Caminho do GIF.
+        fps: Quadros por segundo.
+    """
+
+    first, *others = frames
+
+    with Image.open(first) as image, closing(_open_frames(others)) as append_images:
+        image.save(
+            path,
+            save_all=True,
+            append_images=append_images,
+            duration=1000.0 / fps,
+            loop=0,
+        )
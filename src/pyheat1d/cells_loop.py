@@ -1,7 +1,10 @@
 import numpy as np
 
+from pyheat1d.errors import CellsLoopEngineNotFoundError, FaceConductivityNotFoundError
+from pyheat1d.jit import compile_kernel
 from pyheat1d.mesh import BoundaryCondition, Mesh
 from pyheat1d.simulation_times import register_timer
+from pyheat1d.source import SourceTerms
 from pyheat1d.system import System
 
 
@@ -10,6 +13,8 @@ def loop_over_cells(
     system: System,
     mesh: Mesh,
     dt: float,
+    engine: str = "numba",
+    face_mean: str = "arithmetic",
 ) -> None:
     """
     Loop sobre todas as celulas.
@@ -18,7 +23,23 @@ def loop_over_cells(
         system: O Sistema de equações.
         mesh: A malha.
         dt: Passo de tempo.
+        engine: Implementação do loop (`python`, `numpy` ou `numba`).
+        face_mean: Média da condutividade nas faces (`arithmetic` ou `harmonic`).
+
+    Raises:
+        CellsLoopEngineNotFoundError: Implementação do loop não existe.
+        FaceConductivityNotFoundError: Média da condutividade nas faces não existe.
     """
+    try:
+        loop = CELLS_LOOP_ENGINES[engine]
+    except KeyError as e:
+        raise CellsLoopEngineNotFoundError(engine) from e
+
+    try:
+        mean = FACE_CONDUCTIVITIES[face_mean]
+    except KeyError as e:
+        raise FaceConductivityNotFoundError(face_mean) from e
+
     a, b = system.a, system.b
 
     ro, cp, k = mesh.cells.props.ro, mesh.cells.props.cp, mesh.cells.props.k
@@ -27,48 +48,106 @@ def loop_over_cells(
 
     lbc, rbc = mesh.lbc, mesh.rbc
 
-    n_cells, dx = mesh.n_cells, mesh.dx
+    n_cells, dx, dxf = mesh.n_cells, mesh.dx, mesh.dxf
 
-    _loop_over_cells(a, b, u, ro, cp, k, lbc, rbc, n_cells, dt, dx)
+    kf = mean(k, dx)
 
+    loop(a, b, u, ro, cp, k, kf, lbc, rbc, n_cells, dt, dx, dxf)
 
-def _loop_over_cells(
-    a: np.ndarray,
-    b: np.ndarray,
-    u: np.ndarray,
-    ro: np.ndarray,
-    cp: np.ndarray,
-    k: np.ndarray,
-    lbc: BoundaryCondition,
-    rbc: BoundaryCondition,
-    n_cells: int,
+    if mesh.source is not None:
+        _add_source(b, mesh.source, a)
+
+
+@register_timer("cell_loop")
+def rhs_over_cells(
+    system: System,
+    mesh: Mesh,
     dt: float,
-    dx: float,
 ) -> None:
     """
-    Loop sobre todas as celulas.
+    Atualiza apenas o vetor de forças, com operações vetorizadas. Usado
+    quando a matriz de coeficientes não muda entre os passos de tempo.
 
     Parameters:
-        a: Matriz de coeficientes.
-        b: Vetor de forças.
-        u: Valores do passo de termpo anterior.
-        ro: Massa específica.
-        cp: Calor específico.
-        lbc: Condição de contorno a esquerda.
-        rbc: Condição de contorno a direita.
-        n_cells: Número de celulas.
-        dx: Tamanho da célula.
+        system: O Sistema de equações.
+        mesh: A malha.
         dt: Passo de tempo.
     """
+    b = system.b
+
+    ro, cp, k = mesh.cells.props.ro, mesh.cells.props.cp, mesh.cells.props.k
+
+    u = mesh.cells.results.u
+
+    dx = mesh.dx
+
+    aP0 = ro * cp * dx / dt
+    b[:] = aP0 * u
+
+    _, sU = _boundary_coefs(mesh.lbc, k[..., 0], dx[0])
+    b[..., 0] = sU + b[..., 0]
+
+    _, sU = _boundary_coefs(mesh.rbc, k[..., -1], dx[-1])
+    b[..., -1] = sU + b[..., -1]
+
+    if mesh.source is not None:
+        _add_source(b, mesh.source)
+
+
+def _add_source(b: np.ndarray, source: SourceTerms, a: np.ndarray | None = None) -> None:
+    """
+    Soma o termo fonte linearizado `scale * (sc + sp * u)` de todas as células de uma vez,
+    `sc` no vetor de forças e `-sp` na diagonal principal da matriz.
+
+    Parameters:
+        b: Vetor de forças.
+        source: Termo fonte integrado em cada célula.
+        a: Matriz de coeficientes, `None` quando apenas o vetor de forças é atualizado.
+    """
+
+    # ... no ensemble o fator de escala de cada membro multiplica a sua linha
+    scale = np.asarray(source.scale)[..., np.newaxis]
+
+    b += scale * source.sc
+    if a is not None:
+        a[..., 1] -= scale * source.sp
+
+
+def _arithmetic_face_conductivity(k: np.ndarray, dx: np.ndarray) -> np.ndarray:
+    return np.asarray((k[..., :-1] + k[..., 1:]) * 0.5e0)
+
+
+def _harmonic_face_conductivity(k: np.ndarray, dx: np.ndarray) -> np.ndarray:
+    # ... as duas meias células em série, exata para k constante em cada célula
+    return np.asarray((dx[:-1] + dx[1:]) / (dx[:-1] / k[..., :-1] + dx[1:] / k[..., 1:]))
+
+
+FACE_CONDUCTIVITIES = {
+    "arithmetic": _arithmetic_face_conductivity,
+    "harmonic": _harmonic_face_conductivity,
+}
+
+
+def _boundary_coefs(
+    bc: BoundaryCondition, k: float | np.ndarray, dx: float
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """
+    Termos fontes da condição de contorno.
+
+    Parameters:
+        bc: Condição de contorno.
+        k: Condutividade térmica da célula do contorno.
+        dx: Tamanho da célula do contorno.
+
+    Returns:
+        Retorna os termos `sP` e `sU`.
+    """
 
-    type_, params = lbc.type, lbc.params
+    type_, params = bc.type, bc.params
     # temperatura pescrita
-    aP0 = ro[0] * cp[0] * dx / dt
-    kf = (k[0] + k[1]) * 0.5e0
-    aE = kf / dx
     if type_ == 1:
         value = params["value"]
-        sP = -2.0e0 * k[0] / dx
+        sP = -2.0e0 * k / dx
         sU = -sP * value
     # fluxo prescrito
     elif type_ == 2:
@@ -78,63 +157,252 @@ def _loop_over_cells(
     # lei de resfriamento
     elif type_ == 3:
         value, h = params["value"], params["h"]
-        tmp = 1.0e0 + (h * 2.0e0 * dx) / k[0]
+        tmp = 1.0e0 + (h * 2.0e0 * dx) / k
         tmp = h / tmp
         sP = -tmp
         sU = tmp * value
 
+    return sP, sU
+
+
+def _boundary_cells(
+    a: np.ndarray,
+    b: np.ndarray,
+    u: np.ndarray,
+    ro: np.ndarray,
+    cp: np.ndarray,
+    k: np.ndarray,
+    kf: np.ndarray,
+    lbc: BoundaryCondition,
+    rbc: BoundaryCondition,
+    dt: float,
+    dx: np.ndarray,
+    dxf: np.ndarray,
+) -> None:
+    """
+    Monta as equações das células do contorno. Os arrays podem ter um eixo
+    inicial de ensemble.
+
+    Parameters:
+        a: Matriz de coeficientes.
+        b: Vetor de forças.
+        u: Valores do passo de termpo anterior.
+        ro: Massa específica.
+        cp: Calor específico.
+        k: Condutividade térmica.
+        kf: Condutividade térmica de cada face interna.
+        lbc: Condição de contorno a esquerda.
+        rbc: Condição de contorno a direita.
+        dt: Passo de tempo.
+        dx: Tamanho de cada célula.
+        dxf: Distância entre os centroides das células vizinhas.
+    """
+
+    aP0 = ro[..., 0] * cp[..., 0] * dx[0] / dt
+    aE = kf[..., 0] / dxf[0]
+    sP, sU = _boundary_coefs(lbc, k[..., 0], dx[0])
+
     #  W
-    a[0, 0] = 0.0e0
+    a[..., 0, 0] = 0.0e0
     # p
-    a[0, 1] = aP0 + aE - sP
+    a[..., 0, 1] = aP0 + aE - sP
     # E
-    a[0, 2] = -aE
+    a[..., 0, 2] = -aE
     # b
-    b[0] = sU + aP0 * u[0]
+    b[..., 0] = sU + aP0 * u[..., 0]
 
-    type_, params = rbc.type, rbc.params
-    # ... temperatura pescrita
-    aP0 = ro[-1] * cp[-1] * dx / dt
-    kf = (k[-2] + k[-1]) * 0.5e0
-    aW = kf / dx
-    if type_ == 1:
-        value = params["value"]
-        sP = -2.0e0 * k[-1] / dx
-        sU = -sP * value
-    # ... fluxo prescrito
-    elif type_ == 2:
-        value = params["value"]
-        sP = 0.0e0
-        sU = -value
-    # ... lei de resfriamento
-    elif type_ == 3:
-        value, h = params["value"], params["h"]
-        tmp = 1.0e0 + (h * 2.0e0 * dx) / k[-1]
-        tmp = h / tmp
-        sP = -tmp
-        sU = tmp * value
+    aP0 = ro[..., -1] * cp[..., -1] * dx[-1] / dt
+    aW = kf[..., -1] / dxf[-1]
+    sP, sU = _boundary_coefs(rbc, k[..., -1], dx[-1])
 
     # W
-    a[-1, 0] = -aW
+    a[..., -1, 0] = -aW
     # p
-    a[-1, 1] = aP0 + aW - sP
+    a[..., -1, 1] = aP0 + aW - sP
     # E
-    a[-1, 2] = 0.0e0
+    a[..., -1, 2] = 0.0e0
     # b
-    b[-1] = sU + aP0 * u[-1]
+    b[..., -1] = sU + aP0 * u[..., -1]
+
+
+def _loop_over_cells(
+    a: np.ndarray,
+    b: np.ndarray,
+    u: np.ndarray,
+    ro: np.ndarray,
+    cp: np.ndarray,
+    k: np.ndarray,
+    kf: np.ndarray,
+    lbc: BoundaryCondition,
+    rbc: BoundaryCondition,
+    n_cells: int,
+    dt: float,
+    dx: np.ndarray,
+    dxf: np.ndarray,
+) -> None:
+    """
+    Loop sobre todas as celulas.
+
+    Parameters:
+        a: Matriz de coeficientes.
+        b: Vetor de forças.
+        u: Valores do passo de termpo anterior.
+        ro: Massa específica.
+        cp: Calor específico.
+        k: Condutividade térmica.
+        kf: Condutividade térmica de cada face interna.
+        lbc: Condição de contorno a esquerda.
+        rbc: Condição de contorno a direita.
+        n_cells: Número de celulas.
+        dx: Tamanho de cada célula.
+        dxf: Distância entre os centroides das células vizinhas.
+        dt: Passo de tempo.
+    """
+
+    _boundary_cells(a, b, u, ro, cp, k, kf, lbc, rbc, dt, dx, dxf)
+
+    _interior_cells(a, b, u, ro, cp, kf, n_cells, dt, dx, dxf)
+
+
+def _interior_cells(
+    a: np.ndarray,
+    b: np.ndarray,
+    u: np.ndarray,
+    ro: np.ndarray,
+    cp: np.ndarray,
+    kf: np.ndarray,
+    n_cells: int,
+    dt: float,
+    dx: np.ndarray,
+    dxf: np.ndarray,
+) -> None:
+    """
+    Loop sobre as celulas internas.
+
+    Parameters:
+        a: Matriz de coeficientes.
+        b: Vetor de forças.
+        u: Valores do passo de termpo anterior.
+        ro: Massa específica.
+        cp: Calor específico.
+        kf: Condutividade térmica de cada face interna.
+        n_cells: Número de celulas.
+        dx: Tamanho de cada célula.
+        dxf: Distância entre os centroides das células vizinhas.
+        dt: Passo de tempo.
+    """
 
-    #
     for i in range(1, n_cells - 1):
-        aP0 = ro[i] * cp[i] * dx / dt
-        # ... w
-        kf = (k[i - 1] + k[i]) * 0.5e0
-        aW = kf / dx
+        aP0 = ro[i] * cp[i] * dx[i] / dt
         # ... w
-        kf = (k[i] + k[i + 1]) * 0.5e0
-        aE = kf / dx
+        aW = kf[i - 1] / dxf[i - 1]
+        # ... e
+        aE = kf[i] / dxf[i]
         # ...
         a[i, 0] = -aW
         a[i, 1] = aP0 + aW + aE
         a[i, 2] = -aE
         # ...
         b[i] = aP0 * u[i]
+
+
+_interior_cells_compiled = compile_kernel(_interior_cells)
+
+
+def _loop_over_cells_numba(
+    a: np.ndarray,
+    b: np.ndarray,
+    u: np.ndarray,
+    ro: np.ndarray,
+    cp: np.ndarray,
+    k: np.ndarray,
+    kf: np.ndarray,
+    lbc: BoundaryCondition,
+    rbc: BoundaryCondition,
+    n_cells: int,
+    dt: float,
+    dx: np.ndarray,
+    dxf: np.ndarray,
+) -> None:
+    """
+    Loop sobre todas as celulas com o kernel compilado pelo `numba`. Sem o
+    `numba` instalado o loop em `python` é usado.
+
+    Parameters:
+        a: Matriz de coeficientes.
+        b: Vetor de forças.
+        u: Valores do passo de termpo anterior.
+        ro: Massa específica.
+        cp: Calor específico.
+        k: Condutividade térmica.
+        kf: Condutividade térmica de cada face interna.
+        lbc: Condição de contorno a esquerda.
+        rbc: Condição de contorno a direita.
+        n_cells: Número de celulas.
+        dx: Tamanho de cada célula.
+        dxf: Distância entre os centroides das células vizinhas.
+        dt: Passo de tempo.
+    """
+
+    _boundary_cells(a, b, u, ro, cp, k, kf, lbc, rbc, dt, dx, dxf)
+
+    _interior_cells_compiled(a, b, u, ro, cp, kf, n_cells, float(dt), dx, dxf)
+
+
+def _loop_over_cells_numpy(
+    a: np.ndarray,
+    b: np.ndarray,
+    u: np.ndarray,
+    ro: np.ndarray,
+    cp: np.ndarray,
+    k: np.ndarray,
+    kf: np.ndarray,
+    lbc: BoundaryCondition,
+    rbc: BoundaryCondition,
+    n_cells: int,
+    dt: float,
+    dx: np.ndarray,
+    dxf: np.ndarray,
+) -> None:
+    """
+    Montagem vetorizada com operações sobre arrays do `numpy`.
+
+    Info:
+        As operações são feitas na mesma ordem do loop em `python`, portanto
+        os resultados são identicos bit a bit. É a única implementação que
+        aceita o eixo inicial de ensemble.
+
+    Parameters:
+        a: Matriz de coeficientes.
+        b: Vetor de forças.
+        u: Valores do passo de termpo anterior.
+        ro: Massa específica.
+        cp: Calor específico.
+        k: Condutividade térmica.
+        kf: Condutividade térmica de cada face interna.
+        lbc: Condição de contorno a esquerda.
+        rbc: Condição de contorno a direita.
+        n_cells: Número de celulas.
+        dx: Tamanho de cada célula.
+        dxf: Distância entre os centroides das células vizinhas.
+        dt: Passo de tempo.
+    """
+
+    _boundary_cells(a, b, u, ro, cp, k, kf, lbc, rbc, dt, dx, dxf)
+
+    aP0 = ro[..., 1:-1] * cp[..., 1:-1] * dx[1:-1] / dt
+    # ... condutância em todas as faces internas
+    af = kf / dxf
+    aW, aE = af[..., :-1], af[..., 1:]
+
+    a[..., 1:-1, 0] = -aW
+    a[..., 1:-1, 1] = aP0 + aW + aE
+    a[..., 1:-1, 2] = -aE
+    b[..., 1:-1] = aP0 * u[..., 1:-1]
+
+
+CELLS_LOOP_ENGINES = {
+    "python": _loop_over_cells,
+    "numpy": _loop_over_cells_numpy,
+    "numba": _loop_over_cells_numba,
+}
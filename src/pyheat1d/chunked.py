@@ -0,0 +1,141 @@
+"""
+Módulo do formato de resultados em blocos comprimidos. O histórico
+`(passos guardados, células)` é dividido em blocos 2D, cada bloco é
+comprimido com o `zlib` e a sua posição no arquivo é guardada em um índice.
+Assim tanto o campo inteiro em um passo quanto a série temporal de uma
+célula são lidos descomprimindo apenas os blocos necessários.
+"""
+
+import json
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+CHUNKS_FILE = "results.chunks"
+INDEX_FILE = "results_index.json"
+
+
+def encode_chunk(block: np.ndarray, tolerance: float | None = None) -> tuple[bytes, str, float]:
+    """
+    Comprime um bloco do histórico. Com `tolerance` os valores são quantizados
+    em inteiros de 32 bits com passo `2 * tolerance`, então o erro absoluto da
+    leitura é no máximo `tolerance`. Antes da compressão os bytes de cada valor
+    são agrupados (byte shuffle), o que melhora muito a compressão de floats.
+
+    Parameters:
+        block: Bloco com a forma `(passos, células)`.
+        tolerance: Erro absoluto máximo da quantização.
+
+    Returns:
+        Retorna os bytes comprimidos, o tipo dos valores guardados e o valor base da quantização.
+    """
+
+    base = 0.0
+    data = block.astype("<f8")
+
+    if tolerance:
+        base = float(block.min())
+        q = np.rint((block - base) / (2.0 * tolerance))
+        # ... blocos com amplitude grande demais para int32 ficam sem quantização
+        if q.max() < np.iinfo(np.int32).max:
+            data = q.astype("<i4")
+
+    shuffled = np.ascontiguousarray(data).view(np.uint8).reshape(-1, data.itemsize).T
+
+    return zlib.compress(shuffled.tobytes(), level=6), data.dtype.str, base
+
+
+def decode_chunk(raw: bytes, entry: dict, tolerance: float | None = None) -> np.ndarray:
+    """
+    Descomprime um bloco do histórico.
+
+    Parameters:
+        raw: Bytes comprimidos.
+        entry: Entrada do bloco no índice.
+        tolerance: Erro absoluto máximo da quantização.
+
+    Returns:
+        Retorna o bloco com a forma `(passos, células)`.
+    """
+
+    dtype = np.dtype(entry["dtype"])
+    shuffled = np.frombuffer(zlib.decompress(raw), dtype=np.uint8).reshape(dtype.itemsize, -1)
+    data = np.ascontiguousarray(shuffled.T).view(dtype).reshape(entry["nrows"], entry["ncols"])
+
+    if dtype.kind == "i":
+        return entry["base"] + data * (2.0 * tolerance)  # type: ignore
+
+    return data.astype(np.float64)
+
+
+class ChunkedResults:
+    """
+    Leitura dos resultados em blocos comprimidos.
+
+    Parameters:
+        index (dict): Índice dos blocos.
+        istep (np.ndarray): Passo de tempo de cada linha guardada.
+        t (np.ndarray): Tempo de cada linha guardada.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        """
+        Parameters:
+            output_dir: Diretorio com os arquivos `results.chunks` e `results_index.json`.
+        """
+
+        with open(Path(output_dir) / INDEX_FILE, encoding="utf-8") as fp:
+            self.index = json.load(fp)
+
+        self.path = Path(output_dir) / CHUNKS_FILE
+        self.istep = np.array(self.index["istep"], dtype=np.int64)
+        self.t = np.array(self.index["t"], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.istep)
+
+    def _read(self, entries: list[dict]) -> list[np.ndarray]:
+        tolerance = self.index["tolerance"]
+        with open(self.path, mode="rb") as fp:
+            blocks = []
+            for entry in entries:
+                fp.seek(entry["offset"])
+                blocks.append(decode_chunk(fp.read(entry["nbytes"]), entry, tolerance))
+        return blocks
+
+    def step(self, i: int) -> np.ndarray:
+        """
+        Lê o campo inteiro de uma linha guardada.
+
+        Parameters:
+            i: Linha guardada.
+
+        Returns:
+            Retorna o campo com a forma `(células,)`.
+        """
+
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+
+        entries = [e for e in self.index["chunks"] if e["row"] <= i < e["row"] + e["nrows"]]
+
+        return np.concatenate([block[i - e["row"]] for e, block in zip(entries, self._read(entries))])
+
+    def cell(self, j: int) -> np.ndarray:
+        """
+        Lê a série temporal de uma célula.
+
+        Parameters:
+            j: Célula.
+
+        Returns:
+            Retorna a série temporal com a forma `(passos guardados,)`.
+        """
+
+        if not 0 <= j < self.index["n_cells"]:
+            raise IndexError(j)
+
+        entries = [e for e in self.index["chunks"] if e["col"] <= j < e["col"] + e["ncols"]]
+
+        return np.concatenate([block[:, j - e["col"]] for e, block in zip(entries, self._read(entries))])
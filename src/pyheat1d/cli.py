@@ -1,15 +1,27 @@
-import json
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 
 import matplotlib.pyplot as plt
 import typer
 from click import Context
 from rich.console import Console
 
+from pyheat1d.animate import render_frames, write_gif
 from pyheat1d.controllers import run as run_controller
-from pyheat1d.errors import FileMeshNotFoundError, FileResultshNotFoundError
+from pyheat1d.controllers import run_ensemble as run_ensemble_controller
+from pyheat1d.errors import (
+    EnsembleInputMismatchError,
+    EnsembleNotSupportedError,
+    FileMeshNotFoundError,
+    FileResultshNotFoundError,
+    SolverBackendNotAvailableError,
+    SolverBackendNotFoundError,
+    SweepAxisError,
+)
+from pyheat1d.plotting import MAX_POINTS, downsample, load_xp, parse_steps, render_steps, step_label, style_axes
+from pyheat1d.reader import open_results
 from pyheat1d.simulation_times import run_times
+from pyheat1d.sweep import run_sweep
 
 console = Console()
 
@@ -39,49 +51,166 @@ def typer_callback(
 
 
 @app.command()
-def run(input_file: Annotated[Path, typer.Argument(..., help="Caminho do arquivos de entra.")]):
+def run(
+    input_file: Annotated[Path, typer.Argument(..., help="Caminho do arquivos de entra.")],
+    solver: Annotated[
+        Optional[str], typer.Option(help="Solver: tdma, lapack ou cyclic_reduction. Sobrescreve o arquivo de entrada.")
+    ] = None,
+):
     """Rodando a analise."""
 
-    run_controller(input_file=input_file)
+    try:
+        run_controller(input_file=input_file, solver=solver)
+    except (SolverBackendNotFoundError, SolverBackendNotAvailableError) as e:
+        console.print(f"[red]Error[/red]: {e}")
+        raise typer.Exit(1) from e
+    run_times.print_stdout_simulation_times()
+
+
+@app.command()
+def ensemble(
+    input_files: Annotated[list[Path], typer.Argument(..., help="Caminho dos arquivos de entrada dos membros.")],
+    output_dir: Annotated[Path, typer.Option(..., help="Caminho do diretorio de saida.")],
+    solver: Annotated[
+        Optional[str], typer.Option(help="Solver: tdma, lapack ou cyclic_reduction. Sobrescreve o arquivo de entrada.")
+    ] = None,
+):
+    """Rodando um ensemble de analises no mesmo loop temporal."""
+
+    try:
+        run_ensemble_controller(input_files=input_files, output_dir=output_dir, solver=solver)
+    except (
+        EnsembleInputMismatchError,
+        EnsembleNotSupportedError,
+        SolverBackendNotFoundError,
+        SolverBackendNotAvailableError,
+    ) as e:
+        console.print(f"[red]Error[/red]: {e}")
+        raise typer.Exit(1) from e
     run_times.print_stdout_simulation_times()
 
 
+@app.command()
+def sweep(
+    base_file: Annotated[Path, typer.Argument(..., help="Caminho do arquivo de entrada base.")],
+    axis: Annotated[list[str], typer.Option(..., help="Eixo da varredura: chave=v1,v2,... (ex: prop.k=1.0,2.0).")],
+    output_dir: Annotated[
+        Optional[Path], typer.Option(help="Caminho do diretorio de saida. O padrão é <base>_sweep.")
+    ] = None,
+    workers: Annotated[Optional[int], typer.Option(help="Número de processos. O padrão é o número de CPUs.")] = None,
+):
+    """Rodando uma varredura de parametros em paralelo."""
+
+    if output_dir is None:
+        output_dir = base_file.parent / f"{base_file.stem}_sweep"
+
+    try:
+        summary = run_sweep(base_file=base_file, axes=axis, output_dir=output_dir, workers=workers)
+    except SweepAxisError as e:
+        console.print(f"[red]Error[/red]: {e}")
+        raise typer.Exit(1) from e
+
+    n_errors = sum(case["status"] != "ok" for case in summary)
+    console.print(f"Casos: {len(summary)}, erros: {n_errors}. Resumo em '{output_dir / 'sweep.json'}'.")
+
+
 @app.command()
 def plot(
     output_dir: Annotated[Path, typer.Argument(..., help="Caminho do diretorio de saida.")],
     steps: Annotated[str, typer.Option(prompt="Caminho do diretorio de saida.")],
+    max_points: Annotated[int, typer.Option(help="Número máximo de pontos de cada curva.")] = MAX_POINTS,
 ):
     """Plotando o resultado da analise."""
 
     try:
-        file_mesh = output_dir / "mesh.json"
-        file_results = output_dir / "results.json"
+        xp = load_xp(output_dir)
 
-        if not file_mesh.exists():
-            raise FileMeshNotFoundError()
+        fig, ax = plt.subplots()
+        with open_results(output_dir) as reader:
+            for istep in parse_steps(steps, len(reader)):
+                try:
+                    u = reader.step(istep)
+                    t = reader.t[istep]
+                    plt.plot(*downsample(reader.centroids(istep, xp), u, max_points), label=step_label(t))
+                except IndexError:
+                    console.print(f"O step {istep} não existe portando será ignorado. O Ultimo step é {len(reader)-1}.")
+                    break
+
+        style_axes(ax)
+        plt.show()
+    except (FileMeshNotFoundError, FileResultshNotFoundError) as e:
+        console.print(f"[red]Error[/red]: {e}")
+        raise typer.Exit(1) from e
 
-        if not file_results.exists():
-            raise FileResultshNotFoundError()
 
-        mesh = json.load(file_mesh.open())
-        results = json.load(file_results.open())
+@app.command()
+def export(
+    output_dirs: Annotated[list[Path], typer.Argument(..., help="Caminho dos diretorios de saida.")],
+    steps: Annotated[str, typer.Option(help="Passos: 0,10,20 ou inicio:fim:passo.")] = ":",
+    figures_dir: Annotated[Path, typer.Option(help="Diretorio das figuras.")] = Path("figures"),
+    fmt: Annotated[str, typer.Option("--format", help="Formato das figuras: png, svg, pdf ...")] = "png",
+    per_step: Annotated[bool, typer.Option(help="Uma figura por passo em vez de uma por diretorio.")] = False,
+    max_points: Annotated[int, typer.Option(help="Número máximo de pontos de cada curva.")] = MAX_POINTS,
+):
+    """Salvando os gráficos de vários passos ou diretorios sem abrir janela."""
+
+    figures_dir.mkdir(parents=True, exist_ok=True)
+
+    n_figures = 0
+    for output_dir in output_dirs:
+        try:
+            xp = load_xp(output_dir)
+            with open_results(output_dir) as reader:
+                selected = [i for i in parse_steps(steps, len(reader)) if -len(reader) <= i < len(reader)]
+                name = output_dir.resolve().name
+                if per_step:
+                    for i in selected:
+                        path = figures_dir / f"{name}_step_{reader.istep[i]:06d}.{fmt}"
+                        render_steps(xp, [(reader.t[i], reader.step(i), reader.centroids(i, xp))], path, max_points)
+                        n_figures += 1
+                else:
+                    fields = ((reader.t[i], reader.step(i), reader.centroids(i, xp)) for i in selected)
+                    render_steps(xp, fields, figures_dir / f"{name}.{fmt}", max_points)
+                    n_figures += 1
+        except (FileMeshNotFoundError, FileResultshNotFoundError) as e:
+            console.print(f"[red]Error[/red]: '{output_dir}': {e}")
+            raise typer.Exit(1) from e
+
+    console.print(f"{n_figures} figuras salvas em '{figures_dir}'.")
 
-        xp = mesh["xp"]
-        fig, ax = plt.subplots()
-        for istep in map(int, steps.split(",")):
-            try:
-                t = results[istep]["t"]
-                u = results[istep]["u"]
-                plt.plot(xp, u, label=f"time = {t} s")
-            except IndexError:
-                console.print(f"O step {istep} não existe portando será ignorado. O Ultimo step é {len(results)-1}.")
-                break
-
-        ax.set_xlabel("x")
-        ax.set_ylabel("T(°C)")
-        plt.legend()
-        plt.grid()
-        plt.show()
+
+@app.command()
+def animate(
+    output_dir: Annotated[Path, typer.Argument(..., help="Caminho do diretorio de saida.")],
+    steps: Annotated[str, typer.Option(help="Passos: 0,10,20 ou inicio:fim:passo.")] = ":",
+    frames_dir: Annotated[
+        Optional[Path], typer.Option(help="Diretorio dos quadros. O padrão é <output_dir>/frames.")
+    ] = None,
+    gif: Annotated[Optional[Path], typer.Option(help="Caminho do GIF.")] = None,
+    fps: Annotated[float, typer.Option(help="Quadros por segundo do GIF.")] = 10.0,
+    workers: Annotated[Optional[int], typer.Option(help="Número de processos. O padrão é o número de CPUs.")] = None,
+    max_points: Annotated[int, typer.Option(help="Número máximo de pontos de cada curva.")] = MAX_POINTS,
+):
+    """Animando o histórico de temperatura em paralelo."""
+
+    if frames_dir is None:
+        frames_dir = output_dir / "frames"
+
+    try:
+        with open_results(output_dir) as reader:
+            rows = [i % len(reader) for i in parse_steps(steps, len(reader)) if -len(reader) <= i < len(reader)]
+
+        if not rows:
+            console.print("[red]Error[/red]: Nenhum passo selecionado.")
+            raise typer.Exit(1)
+
+        frames = render_frames(output_dir, rows, frames_dir, workers=workers, max_points=max_points)
     except (FileMeshNotFoundError, FileResultshNotFoundError) as e:
         console.print(f"[red]Error[/red]: {e}")
         raise typer.Exit(1) from e
+
+    console.print(f"{len(frames)} quadros salvos em '{frames_dir}'.")
+
+    if gif is not None:
+        write_gif(frames, gif, fps)
+        console.print(f"GIF salvo em '{gif}'.")
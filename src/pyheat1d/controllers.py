@@ -2,17 +2,19 @@
 from pathlib import Path
 
 from pyheat1d.edp import Edp
+from pyheat1d.ensemble import EnsembleEdp, init_ensemble_mesh
 from pyheat1d.input_files import load_input_file
 from pyheat1d.mesh import init_mesh
 from pyheat1d.simulation_times import run_times
 from pyheat1d.writer import MeshWriter
 
 
-def run(input_file: Path) -> None:
+def run(input_file: Path, solver: str | None = None) -> None:
     """Controlador que executa a simulação
 
     Parameters:
         input_file: Caminho do arquivo de entrada
+        solver: Solver do sistema de equações. Sobrescreve o valor do arquivo de entrada.
     """
     input_file_path = input_file.absolute()
     base_dir_path = input_file_path.parent
@@ -21,6 +23,9 @@ def run(input_file: Path) -> None:
 
     input_data = load_input_file(input_file_path)
 
+    if solver is not None:
+        input_data.solver = solver
+
     mesh = init_mesh(
         input_data.length,
         input_data.ndiv,
@@ -28,6 +33,9 @@ def run(input_file: Path) -> None:
         input_data.rbc,
         input_data.prop,
         input_data.initialt,
+        input_data.grading,
+        input_data.layers,
+        input_data.source,
     )
 
     output = base_dir_path / "mesh.json"
@@ -38,3 +46,42 @@ def run(input_file: Path) -> None:
     edp.resolve()
 
     run_times.write_log_simulation_times(folder=base_dir_path)
+
+
+def run_ensemble(input_files: list[Path], output_dir: Path, solver: str | None = None) -> None:
+    """Controlador que executa um ensemble de simulações no mesmo loop temporal.
+
+    Info:
+        Os resultados de cada membro ficam em `output_dir/<nome do arquivo de entrada>`.
+
+    Parameters:
+        input_files: Caminho do arquivo de entrada de cada membro.
+        output_dir: Diretorio de saida.
+        solver: Solver do sistema de equações. Sobrescreve o valor do arquivo de entrada.
+    """
+
+    run_times.reset()
+
+    inputs = [load_input_file(input_file.absolute()) for input_file in input_files]
+
+    if solver is not None:
+        for in_ in inputs:
+            in_.solver = solver
+
+    names = [input_file.stem for input_file in input_files]
+    if len(set(names)) != len(names):
+        names = [f"{i:04d}_{name}" for i, name in enumerate(names)]
+
+    mesh = init_ensemble_mesh(inputs)
+
+    member_dirs = [output_dir / name for name in names]
+    for member_dir in member_dirs:
+        member_dir.mkdir(parents=True, exist_ok=True)
+        output = member_dir / "mesh.json"
+        MeshWriter(output, indent=2).dump(mesh.cells.nodes, mesh.cells.centroids, mesh.nodes.x)
+
+    edp = EnsembleEdp(inputs[0], mesh, output_dir, member_dirs)
+
+    edp.resolve()
+
+    run_times.write_log_simulation_times(folder=output_dir)
@@ -1,13 +1,32 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-from pyheat1d.cells_loop import loop_over_cells
+import numpy as np
+
+from pyheat1d.amr import AmrCriterion, AmrTree, regrid
+from pyheat1d.cells_loop import loop_over_cells, rhs_over_cells
+from pyheat1d.errors import NonlinearConvergenceError
 from pyheat1d.input_files import Input
-from pyheat1d.mesh import Mesh
-from pyheat1d.simulation_times import register_timer
+from pyheat1d.mesh import BoundaryCondition, Mesh
+from pyheat1d.modal import modal_decomposition
+from pyheat1d.properties import PropertyLaw
+from pyheat1d.simulation_times import register_timer, run_times
 from pyheat1d.solver import Solver
+from pyheat1d.source import SourceProfile, source_profile
+from pyheat1d.steady import SteadyCriterion, check_steady_bcs
 from pyheat1d.system import System
-from pyheat1d.writer import results_writer_strategy
+from pyheat1d.timeseries import TimeSeries
+from pyheat1d.writer import (
+    RESULTS_FILES,
+    AsyncResultsWriter,
+    EnsembleResultsWriter,
+    ResultsWriterChunked,
+    ResultsWriterEveryNSteps,
+    ResultsWriterEveryTime,
+    ResultsWriterJsonLines,
+    ResultsWriterNpy,
+    results_writer_strategy,
+)
 
 
 @dataclass
@@ -18,10 +37,29 @@ class TemporalInt:
     Parameters:
         nstep (int): Número de passos.
         dt (float): Passo de tempo.
+        adaptive_tol (float | None): Tolerância do erro local do passo de tempo adaptativo.
+        dt_min (float | None): Menor passo de tempo adaptativo.
+        dt_max (float | None): Maior passo de tempo adaptativo.
+        theta (float): Peso da parte implícita do método θ, `1` é o Euler implícito
+            e `0.5` é o Crank–Nicolson.
     """
 
     nstep: int
     dt: float
+    adaptive_tol: float | None = None
+    dt_min: float | None = None
+    dt_max: float | None = None
+    theta: float = 1.0
+
+    @property
+    def order(self) -> int:
+        """Ordem de precisão no tempo."""
+        return 2 if self.theta == 0.5 else 1
+
+    @property
+    def tend(self) -> float:
+        """Tempo final da simulação."""
+        return self.nstep * self.dt
 
 
 class Edp:
@@ -33,12 +71,56 @@ class Edp:
         mesh (Mesh): A malha.
         temporal_int (TemporalInt): Discretização temporal.
         output (Path): Diretorio de saida.
+        cells_loop_engine (str): Implementação do loop sobre as células.
+        face_conductivity (str): Média da condutividade nas faces.
+        factorize_once (bool): Fatora a matriz uma única vez quando ela não muda no tempo.
+        results_format (str): Formato do arquivo de resultados.
+        async_writer (bool): Escreve os resultados em uma thread em segundo plano.
+        writer_queue_size (int): Número de passos na fila da escrita em segundo plano.
+        chunk_steps (int): Número de passos guardados em cada bloco do formato `chunked`.
+        chunk_cells (int): Número de células em cada bloco do formato `chunked`.
+        results_tolerance (float | None): Erro absoluto máximo da quantização do formato `chunked`.
+        steady (SteadyCriterion | None): Critério de parada no regime permanente.
+        analysis (str): Tipo de analise, `transient`, `steady` ou `eigen`.
+        eigen_modes (int | None): Número de modos mais lentos da analise `eigen`.
+        amr (AmrCriterion | None): Critério da malha adaptativa.
+        amr_tree (AmrTree | None): Hierarquia de refinamento da malha adaptativa.
+        prop_laws (dict[str, PropertyLaw]): Propriedades que dependem da temperatura.
+        nonlinear_tol (float): Tolerância da variação de `u` entre duas iterações não lineares.
+        nonlinear_max_iter (int): Número máximo de iterações não lineares por passo.
+        nonlinear_lag_tol (float | None): Variação relativa das propriedades abaixo da qual a
+            matriz fatorada do passo anterior é reaproveitada.
+        time_series (dict[tuple[str, str], TimeSeries]): Parametros das condições de contorno e fator de
+            escala do termo fonte que dependem do tempo, com a chave `(contorno, parametro)` ou
+            `("source", "scale")`.
+        source_profile (SourceProfile | None): Perfil do termo fonte, integrado de novo nas células da
+            malha adaptativa.
     """
 
     solver: Solver
     mesh: Mesh
     temporal_int: TemporalInt
     output_dir: Path
+    cells_loop_engine: str
+    face_conductivity: str
+    factorize_once: bool
+    results_format: str
+    async_writer: bool
+    writer_queue_size: int
+    chunk_steps: int
+    chunk_cells: int
+    results_tolerance: float | None
+    steady: SteadyCriterion | None
+    analysis: str
+    eigen_modes: int | None
+    amr: AmrCriterion | None
+    amr_tree: AmrTree | None
+    prop_laws: dict[str, PropertyLaw]
+    nonlinear_tol: float
+    nonlinear_max_iter: int
+    nonlinear_lag_tol: float | None
+    time_series: dict[tuple[str, str], TimeSeries]
+    source_profile: SourceProfile | None
 
     def __init__(self, infos: Input, mesh: Mesh, output_dir: Path):
         """
@@ -49,32 +131,535 @@ class Edp:
         """
 
         self.output_dir = output_dir
-        self.temporal_int = TemporalInt(nstep=infos.nstep, dt=infos.dt)
+        self.temporal_int = TemporalInt(
+            nstep=infos.nstep,
+            dt=infos.dt,
+            adaptive_tol=infos.adaptive_tol,
+            dt_min=infos.dt_min,
+            dt_max=infos.dt_max,
+            theta=infos.theta,
+        )
         self.mesh = mesh
-        self.solver = Solver(System(self.mesh.n_cells))
+        self.solver = Solver(System(self.mesh.n_cells, self.mesh.n_batch), infos.solver)
         self.write_every_steps = infos.write_every_steps
+        self.cells_loop_engine = infos.cells_loop_engine
+        self.face_conductivity = infos.face_conductivity
+        self.factorize_once = infos.factorize_once
+        self.results_format = infos.results_format
+        self.async_writer = infos.async_writer
+        self.writer_queue_size = infos.writer_queue_size
+        self.chunk_steps = infos.chunk_steps
+        self.chunk_cells = infos.chunk_cells
+        self.results_tolerance = infos.results_tolerance
+        self.steady = (
+            SteadyCriterion(infos.steady_tol, infos.steady_norm, infos.steady_check_every)
+            if infos.steady_tol is not None
+            else None
+        )
+        self.analysis = infos.analysis
+        self.eigen_modes = infos.eigen_modes
+        self.amr, self.amr_tree = None, None
+        if infos.amr_every:
+            refine_tol: float = infos.amr_refine_tol  # type: ignore[assignment]
+            self.amr = AmrCriterion(
+                every=infos.amr_every,
+                refine_tol=refine_tol,
+                # ... sem o valor do arquivo as células são juntadas com um quarto do indicador do refinamento
+                coarsen_tol=infos.amr_coarsen_tol if infos.amr_coarsen_tol is not None else 0.25 * refine_tol,
+                max_level=infos.amr_max_level,
+                indicator=infos.amr_indicator,
+            )
+            self.amr_tree = AmrTree.from_base(self.mesh.n_cells)
+        self.prop_laws = infos.prop_laws
+        self.nonlinear_tol = infos.nonlinear_tol
+        self.nonlinear_max_iter = infos.nonlinear_max_iter
+        self.nonlinear_lag_tol = infos.nonlinear_lag_tol
+        # ... passo de tempo da matriz fatorada pelas iterações não lineares
+        self._lagged_dt: float | None = None
+        self.time_series = {
+            (side, key): value
+            for side in ("lbc", "rbc")
+            for key, value in getattr(mesh, side).params.items()
+            if isinstance(value, TimeSeries)
+        }
+        if self.time_series:
+            # ... cópias com os valores do passo atual, as séries ficam em `time_series`
+            self.mesh.lbc = BoundaryCondition(type=mesh.lbc.type, params=dict(mesh.lbc.params))
+            self.mesh.rbc = BoundaryCondition(type=mesh.rbc.type, params=dict(mesh.rbc.params))
+        if mesh.source is not None and isinstance(mesh.source.scale, TimeSeries):
+            self.time_series["source", "scale"] = mesh.source.scale
+            self.mesh.source = replace(mesh.source, scale=1.0)
+        self._series_at(0.0)
+        self.source_profile = (
+            source_profile(infos.source, mesh.nodes.x) if infos.source is not None and self.amr is not None else None
+        )
+
+    def is_operator_constant(self) -> bool:
+        """
+        Verifica se a matriz de coeficientes é invariante no tempo. Isso acontece
+        quando o passo de tempo, as propriedades do material, os parametros das
+        condições de contorno e a parte linear do termo fonte são constantes.
+
+        Returns:
+            Retorna `True` se a matriz não muda entre os passos de tempo.
+        """
+
+        return self.temporal_int.adaptive_tol is None and not self.prop_laws and self._is_series_operator_constant()
+
+    def _is_series_operator_constant(self) -> bool:
+        """
+        O coeficiente `h` da convecção e o fator de escala de um termo fonte com `sp` entram na matriz,
+        os outros parametros apenas no vetor de forças.
+        """
+        linear_source = self.mesh.source is not None and bool(np.any(self.mesh.source.sp))
+        return all(key != "h" and (side != "source" or not linear_source) for side, key in self.time_series)
+
+    def _series_tables(self, times: np.ndarray) -> dict[tuple[str, str], np.ndarray]:
+        """
+        Avalia as séries temporais em todos os tempos de uma vez.
+
+        Parameters:
+            times: Tempos de avaliação.
+
+        Returns:
+            Retorna a tabela de cada parametro, com o tempo no primeiro eixo.
+        """
+        return {name: series(times) for name, series in self.time_series.items()}
+
+    def _set_series(self, tables: dict[tuple[str, str], np.ndarray], i: int) -> None:
+        """
+        Atualiza os parametros das condições de contorno e o fator de escala do termo fonte
+        da malha com a linha `i` das tabelas.
+
+        Parameters:
+            tables: Tabelas dos parametros.
+            i: Linha das tabelas.
+        """
+        for (side, key), table in tables.items():
+            if side == "source":
+                self.mesh.source.scale = table[i]  # type: ignore[union-attr]
+            else:
+                getattr(self.mesh, side).params[key] = table[i]
+
+    def _series_at(self, t: float) -> None:
+        """Atualiza os parametros da malha no tempo `t`, usado quando os tempos não são conhecidos antes."""
+        if self.time_series:
+            self._set_series(self._series_tables(np.array([t])), 0)
+
+    def results_writer(
+        self,
+    ) -> (
+        ResultsWriterEveryTime
+        | ResultsWriterEveryNSteps
+        | ResultsWriterJsonLines
+        | ResultsWriterNpy
+        | ResultsWriterChunked
+        | AsyncResultsWriter
+        | EnsembleResultsWriter
+    ):
+        """Escritor dos resultados."""
+
+        output = self.output_dir / RESULTS_FILES[self.results_format]
+
+        writer = results_writer_strategy(
+            output,
+            indent=4,
+            write_every_steps=self.write_every_steps,
+            results_format=self.results_format,
+            nstep=self.temporal_int.nstep,
+            chunk_steps=self.chunk_steps,
+            chunk_cells=self.chunk_cells,
+            tolerance=self.results_tolerance,
+        )
+
+        if self.async_writer:
+            return AsyncResultsWriter(writer, self.writer_queue_size)
+
+        return writer
+
+    def _theta_combine(self, x: np.ndarray) -> np.ndarray:
+        """
+        Obtém o campo do método θ a partir da solução de um passo de Euler
+        implícito de tamanho `θ dt`. Com `M` a matriz de massa e `K` o operador
+        de difusão, essa solução é `u* = θ uⁿ⁺¹ + (1 - θ) uⁿ`, logo
+
+        `(M / dt + θ K) uⁿ⁺¹ = (M / dt - (1 - θ) K) uⁿ + s`,
+
+        ou seja, a parte explícita do balanço de fluxos entra no vetor de forças
+        sem mudar a estrutura tridiagonal nem o loop sobre as células.
+
+        Parameters:
+            x: Solução do passo de Euler implícito de tamanho `θ dt`.
+
+        Returns:
+            Retorna o campo no fim do passo.
+        """
+
+        theta = self.temporal_int.theta
+        if theta == 1.0:
+            return x
+
+        return np.asarray((x - (1.0 - theta) * self.mesh.cells.results.u) / theta)
+
+    def _can_lag(self, dt: float) -> bool:
+        """
+        Verifica se a matriz fatorada no passo anterior pode ser reaproveitada,
+        ou seja, se as propriedades avaliadas no campo atual mudaram menos que
+        `nonlinear_lag_tol` em relação às usadas na matriz.
+
+        Parameters:
+            dt: Passo de tempo da montagem.
+        """
+
+        if self.nonlinear_lag_tol is None or self._lagged_dt != dt or not self.solver.factorized:
+            return False
+
+        u, props = self.mesh.cells.results.u, self.mesh.cells.props
+        for name, law in self.prop_laws.items():
+            used = getattr(props, name)
+            if np.max(np.abs(law(u) - used)) > self.nonlinear_lag_tol * np.max(np.abs(used)):
+                return False
+
+        return True
+
+    def _picard(self, dt: float) -> np.ndarray:
+        """
+        Iterações de Picard do passo de Euler implícito com propriedades que
+        dependem da temperatura. Em cada iteração as propriedades são avaliadas
+        no último iterado, o sistema é montado, fatorado e resolvido, até a
+        variação entre dois iterados ser menor que `nonlinear_tol`. Com o método
+        θ o iterado é o campo em `tⁿ⁺θ`, então as propriedades são avaliadas no
+        meio do passo do Crank–Nicolson.
+
+        Parameters:
+            dt: Passo de tempo da montagem.
+
+        Raises:
+            NonlinearConvergenceError: Iterações não convergiram.
+
+        Returns:
+            Retorna a solução do passo de Euler implícito.
+        """
+
+        stats = run_times.stats
+
+        if self._can_lag(dt):
+            rhs_over_cells(self.solver.system, self.mesh, dt)
+            stats["lagged_steps"] = stats.get("lagged_steps", 0) + 1
+            return np.asarray(self.solver.solver_factorized())
+
+        x, it = self.mesh.cells.results.u, 0
+        while True:
+            it += 1
+            for name, law in self.prop_laws.items():
+                self.mesh.update_prop(name, law(x))
+            loop_over_cells(self.solver.system, self.mesh, dt, self.cells_loop_engine, self.face_conductivity)
+            self.solver.factorize()
+            x_new = np.asarray(self.solver.solver_factorized())
+            residual = float(np.max(np.abs(x_new - x)))
+            x = x_new
+            if residual <= self.nonlinear_tol:
+                break
+            if it == self.nonlinear_max_iter:
+                raise NonlinearConvergenceError(self.nonlinear_max_iter, residual)
+
+        self._lagged_dt = dt
+        stats["nonlinear_steps"] = stats.get("nonlinear_steps", 0) + 1
+        stats["nonlinear_iterations"] = stats.get("nonlinear_iterations", 0) + it
+        stats["nonlinear_max_iterations"] = max(stats.get("nonlinear_max_iterations", 0), it)
+
+        return x
+
+    def _solve_implicit(self, dt: float) -> np.ndarray:
+        """
+        Monta e resolve o passo de Euler implícito, com iterações não lineares
+        quando as propriedades dependem da temperatura.
+
+        Parameters:
+            dt: Passo de tempo da montagem.
+
+        Returns:
+            Retorna a solução do passo de Euler implícito.
+        """
+
+        if self.prop_laws:
+            return self._picard(dt)
+
+        loop_over_cells(self.solver.system, self.mesh, dt, self.cells_loop_engine, self.face_conductivity)
+        return np.asarray(self.solver.solver())
+
+    def _step(self, dt: float, t: float = 0.0) -> np.ndarray:
+        """
+        Um passo de tempo completo, sem atualizar o campo da malha.
+
+        Parameters:
+            dt: Passo de tempo.
+            t: Tempo no início do passo.
+
+        Returns:
+            Retorna o campo no fim do passo.
+        """
+
+        self._series_at(t + self.temporal_int.theta * dt)
+
+        return np.array(self._theta_combine(self._solve_implicit(self.temporal_int.theta * dt)))
+
+    def _two_half_steps(self, dt: float, t: float = 0.0) -> np.ndarray:
+        """
+        Dois meios passos de tempo. A matriz dos dois meios passos é a mesma,
+        então ela é fatorada uma vez. O campo da malha fica no fim do primeiro meio passo.
+
+        Parameters:
+            dt: Passo de tempo.
+            t: Tempo no início do passo.
+
+        Returns:
+            Retorna o campo no fim do segundo meio passo.
+        """
+
+        dt_impl = 0.5 * self.temporal_int.theta * dt
+
+        if self.prop_laws or not self._is_series_operator_constant():
+            self._series_at(t + dt_impl)
+            self.mesh.update_cells_results("u", self._theta_combine(self._solve_implicit(dt_impl)))
+            self._series_at(t + 0.5 * dt + dt_impl)
+            return np.asarray(self._theta_combine(self._solve_implicit(dt_impl)))
+
+        self._series_at(t + dt_impl)
+        loop_over_cells(self.solver.system, self.mesh, dt_impl, self.cells_loop_engine, self.face_conductivity)
+        self.solver.factorize()
+        self.mesh.update_cells_results("u", self._theta_combine(self.solver.solver_factorized()))
+        self._series_at(t + 0.5 * dt + dt_impl)
+        rhs_over_cells(self.solver.system, self.mesh, dt_impl)
+        return np.asarray(self._theta_combine(self.solver.solver_factorized()))
+
+    def _must_check_steady(self, step: int) -> bool:
+        """Verifica se o critério de regime permanente é avaliado no passo."""
+        return self.steady is not None and self.steady.must_check(step)
+
+    def _is_steady(self, step: int, u_prev: np.ndarray) -> bool:
+        """
+        Avalia o critério de regime permanente. A variação é guardada nas
+        estatísticas da analise e, quando o critério é satisfeito, o passo também.
+
+        Parameters:
+            step: Passo de tempo.
+            u_prev: Campo no passo anterior.
+
+        Returns:
+            Retorna `True` se o regime permanente foi atingido.
+        """
+
+        residual = self.steady.residual(self.mesh.cells.results.u, u_prev)  # type: ignore[union-attr]
+        run_times.stats.update(steady_residual=residual)
+
+        if residual <= self.steady.tol:  # type: ignore[union-attr]
+            run_times.stats.update(steady_step=step)
+            return True
+
+        return False
+
+    def _write(self, writer, step: int, t: float, force: bool = False) -> None:
+        """Guarda o passo, com a malha adaptativa as coordenadas nodais também são guardadas."""
+
+        if self.amr is None:
+            writer.append_in_buffer(step, t, self.mesh.cells.results.u, force=force)
+        else:
+            writer.append_in_buffer(step, t, self.mesh.cells.results.u, force=force, x=self.mesh.nodes.x)
+
+    def _regrid(self, factorized: bool, dt: float) -> None:
+        """
+        Refaz a malha adaptativa e o sistema de equações com o novo número de células.
+
+        Parameters:
+            factorized: A matriz é fatorada uma única vez entre as mudanças da malha.
+            dt: Passo de tempo da montagem.
+        """
+
+        source = self.mesh.source
+        self.mesh, self.amr_tree = regrid(self.mesh, self.amr_tree, self.amr)  # type: ignore[arg-type]
+        if source is not None and self.source_profile is not None:
+            sc, sp = self.source_profile.integrate(self.mesh.nodes.x)
+            self.mesh.source = replace(source, sc=sc, sp=sp)
+        self.solver = Solver(System(self.mesh.n_cells), self.solver.backend)
+
+        if factorized:
+            loop_over_cells(self.solver.system, self.mesh, dt, self.cells_loop_engine, self.face_conductivity)
+            self.solver.factorize()
+
+        stats = run_times.stats
+        stats["amr_regrids"] = stats.get("amr_regrids", 0) + 1
+        stats["amr_max_cells"] = max(stats.get("amr_max_cells", 0), self.mesh.n_cells)
+
+    def _resolve_adaptive(self, writer) -> None:
+        """
+        Loop temporal com passo de tempo adaptativo por step doubling. Cada
+        passo `dt` é comparado com dois meios passos `dt/2`; a diferença máxima
+        entre as duas soluções estima o erro local. O passo é aceito quando o
+        erro é menor que `adaptive_tol` e o próximo `dt` é escolhido pelo erro,
+        que escala com `dt^(p+1)` para um método de ordem `p`.
+
+        Parameters:
+            writer: Escritor dos resultados.
+        """
+
+        temporal_int = self.temporal_int
+        tol: float = temporal_int.adaptive_tol  # type: ignore[assignment]
+        tend = temporal_int.tend
+        dt_min = temporal_int.dt_min or 0.0
+        dt_max = temporal_int.dt_max or tend
+
+        t, dt, step, rejected = 0.0, temporal_int.dt, 0, 0
+        u0 = self.mesh.cells.results.u.copy()
+
+        while tend - t > 1.0e-12 * tend:
+            dt = min(dt, tend - t)
+
+            u_full = self._step(dt, t)
+            u_half = self._two_half_steps(dt, t)
+
+            err = float(np.max(np.abs(u_half - u_full)))
+
+            if err <= tol or dt <= dt_min:
+                step += 1
+                t += dt
+                self.mesh.update_cells_results("u", u_half)
+                steady = self._must_check_steady(step) and self._is_steady(step, u0)
+                u0[...] = u_half
+                writer.append_in_buffer(step, t, self.mesh.cells.results.u, force=steady)
+                if steady:
+                    break
+            else:
+                rejected += 1
+                self.mesh.update_cells_results("u", u0)
+
+            factor = 0.9 * (tol / err) ** (1.0 / (temporal_int.order + 1)) if err > 0.0 else 5.0
+            dt = min(max(dt * min(max(factor, 0.2), 5.0), dt_min), dt_max)
+
+        run_times.stats.update(accepted_steps=step, rejected_steps=rejected)
+
+    def _resolve_steady(self, writer) -> None:
+        """
+        Solução direta do regime permanente. Com `dt` infinito o termo
+        transiente `aP0 = ro * cp * dx / dt` é zero e o mesmo loop sobre as
+        células monta o sistema do regime permanente, resolvido uma única vez.
+
+        Parameters:
+            writer: Escritor dos resultados.
+
+        Raises:
+            SteadySingularError: Fluxo prescrito nos dois contornos.
+        """
+
+        check_steady_bcs(self.mesh.lbc.type, self.mesh.rbc.type)
+
+        self.mesh.update_cells_results("u", self._solve_implicit(np.inf))
+
+        writer.append_in_buffer(0, 0.0, self.mesh.cells.results.u)
+
+    def _resolve_eigen(self, writer) -> None:
+        """
+        Solução pela decomposição em autovetores. O sistema do regime permanente
+        é montado com `dt` infinito, decomposto uma única vez e o campo é avaliado
+        diretamente nos passos guardados, `0, N, 2N, ...` com `N = write_every_steps`,
+        então o custo não depende do número de passos de tempo. O resultado é a
+        solução exata no tempo do problema semi-discreto, sem o erro do Euler implícito.
+        Com `eigen_modes` apenas os modos mais lentos são calculados e o regime
+        permanente é resolvido com o solver tridiagonal.
+
+        Parameters:
+            writer: Escritor dos resultados.
+        """
+
+        nstep, dt = self.temporal_int.nstep, self.temporal_int.dt
+
+        loop_over_cells(self.solver.system, self.mesh, np.inf, self.cells_loop_engine, self.face_conductivity)
+
+        # ... com os modos truncados o regime permanente é resolvido diretamente
+        steady = self.solver.solver_factorized() if self.eigen_modes is not None else None
+
+        props = self.mesh.cells.props
+        modes = modal_decomposition(
+            self.solver.system.a,
+            self.solver.system.b,
+            props.ro * props.cp * self.mesh.dx,
+            self.mesh.cells.results.u,
+            n_modes=self.eigen_modes,
+            steady=steady,
+        )
+
+        for step in range(0, nstep + 1, self.write_every_steps or 1):
+            # ... os passos fora do intervalo de escrita não são calculados
+            u = modes.field(step * dt)
+            writer.append_in_buffer(step, step * dt, u, force=True)
+
+        self.mesh.update_cells_results("u", modes.field(self.temporal_int.tend))
 
     @register_timer("edp")
     def resolve(self) -> None:
         """Loop temporal."""
 
         t, nstep, dt = 0.0, self.temporal_int.nstep, self.temporal_int.dt
+        # ... passo do Euler implícito usado pelo método θ
+        dt_impl = self.temporal_int.theta * dt
+
+        ResultsWriter = self.results_writer()
 
-        output = self.output_dir / "results.json"
+        if self.analysis == "steady":
+            with ResultsWriter as writer:
+                self._resolve_steady(writer)
+                writer.dump()
+            return
 
-        ResultsWriter = results_writer_strategy(output, indent=4, write_every_steps=self.write_every_steps)
+        if self.analysis == "eigen":
+            with ResultsWriter as writer:
+                self._resolve_eigen(writer)
+                writer.dump()
+            return
+
+        if self.temporal_int.adaptive_tol is not None:
+            with ResultsWriter as writer:
+                writer.append_in_buffer(0, t, self.mesh.cells.results.u)
+                self._resolve_adaptive(writer)
+                writer.dump()
+            return
+
+        factorized = self.factorize_once and self.is_operator_constant()
+
+        # ... condições de contorno no tempo `tⁿ + θ dt` de cada passo, avaliadas de uma vez
+        series_tables = self._series_tables(dt * np.arange(nstep) + dt_impl)
 
         with ResultsWriter as writer:
-            writer.append_in_buffer(0, t, self.mesh.cells.results.u)
+            self._write(writer, 0, t)
+
+            if factorized:
+                loop_over_cells(self.solver.system, self.mesh, dt_impl, self.cells_loop_engine, self.face_conductivity)
+                self.solver.factorize()
+
             for step in range(1, nstep + 1):
-                loop_over_cells(self.solver.system, self.mesh, dt)
+                if check_steady := self._must_check_steady(step):
+                    u_prev = self.mesh.cells.results.u.copy()
 
-                x = self.solver.solver()
+                self._set_series(series_tables, step - 1)
 
-                self.mesh.update_cells_results("u", x)
+                if factorized:
+                    rhs_over_cells(self.solver.system, self.mesh, dt_impl)
+                    x = self.solver.solver_factorized()
+                else:
+                    x = self._solve_implicit(dt_impl)
+
+                self.mesh.update_cells_results("u", self._theta_combine(x))
 
                 t += dt
 
-                writer.append_in_buffer(step, t, self.mesh.cells.results.u)
+                steady = check_steady and self._is_steady(step, u_prev)
+
+                self._write(writer, step, t, force=steady)
+
+                if steady:
+                    break
+
+                if self.amr is not None and self.amr.must_regrid(step) and step < nstep:
+                    self._regrid(factorized, dt_impl)
 
             writer.dump()
@@ -0,0 +1,258 @@
+"""
+Módulo do ensemble: muitas simulações independentes avançadas juntas no mesmo
+loop temporal.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from pyheat1d.edp import Edp
+from pyheat1d.errors import (
+    AmrNotSupportedError,
+    EnsembleInputMismatchError,
+    EnsembleNotSupportedError,
+)
+from pyheat1d.input_files import Input
+from pyheat1d.mesh import BoundaryCondition, Mesh
+from pyheat1d.source import Source, SourceTerms, source_terms
+from pyheat1d.timeseries import TimeSeries, batch_time_series
+from pyheat1d.writer import EnsembleResultsWriter, results_writer_strategy
+
+SHARED_VALUES = (
+    "length",
+    "ndiv",
+    "dt",
+    "nstep",
+    "write_every_steps",
+    "adaptive_tol",
+    "dt_min",
+    "dt_max",
+    "steady_tol",
+    "steady_norm",
+    "steady_check_every",
+    "analysis",
+    "eigen_modes",
+    "theta",
+    "grading",
+    "face_conductivity",
+    "nonlinear_tol",
+    "nonlinear_max_iter",
+    "nonlinear_lag_tol",
+    "solver",
+    "factorize_once",
+    "cells_loop_engine",
+    "results_format",
+    "async_writer",
+    "writer_queue_size",
+    "chunk_steps",
+    "chunk_cells",
+    "results_tolerance",
+)
+
+
+def _validated_ensemble_options(ref: Input) -> None:
+    """
+    Valida as opções do ensemble que não dependem do membro.
+
+    Parameters:
+        ref: Informações do primeiro membro, as opções são as mesmas em todos.
+
+    Raises:
+        EnsembleNotSupportedError: Opção incompatível com o ensemble.
+    """
+
+    # ... a montagem vetorizada é a única que aceita o eixo de ensemble
+    if ref.cells_loop_engine != "numpy":
+        raise EnsembleNotSupportedError(f"o loop sobre as células '{ref.cells_loop_engine}'")
+
+    # ... os arquivos dos membros só são abertos no dump, um de cada vez
+    if ref.results_format != "json":
+        raise EnsembleNotSupportedError(f"o formato de resultados '{ref.results_format}'")
+
+    if ref.async_writer:
+        raise EnsembleNotSupportedError("a escrita em segundo plano")
+
+
+def validated_ensemble(inputs: list[Input]) -> None:
+    """
+    Valida se os membros do ensemble podem ser resolvidos juntos.
+
+    Parameters:
+        inputs: Informações de cada membro.
+
+    Raises:
+        EnsembleInputMismatchError: Valor diferente entre os membros do ensemble.
+        EnsembleNotSupportedError: Opção incompatível com o ensemble.
+    """
+
+    ref = inputs[0]
+
+    for key in SHARED_VALUES:
+        if any(getattr(in_, key) != getattr(ref, key) for in_ in inputs):
+            raise EnsembleInputMismatchError(key)
+
+    _validated_ensemble_options(ref)
+
+    for bc in ("lbc", "rbc"):
+        if any(getattr(in_, bc).type != getattr(ref, bc).type for in_ in inputs):
+            raise EnsembleInputMismatchError(f"{bc}.type")
+
+    # ... as séries dos membros são juntadas em uma única tabela
+    for bc in ("lbc", "rbc"):
+        for key in getattr(ref, bc).params:
+            values = [getattr(in_, bc).params[key] for in_ in inputs]
+            if len({value.kind for value in values if isinstance(value, TimeSeries)}) > 1:
+                raise EnsembleInputMismatchError(f"{bc}.params.{key}.kind")
+
+    scales = [in_.source.scale for in_ in inputs if in_.source is not None and in_.source.scale is not None]
+    if len({scale.kind for scale in scales}) > 1:
+        raise EnsembleInputMismatchError("source.scale.kind")
+
+    # ... as leis são avaliadas sobre todos os membros de uma vez
+    if any(in_.prop_laws != ref.prop_laws for in_ in inputs):
+        raise EnsembleInputMismatchError("prop")
+
+
+def _batch_bc(bcs: list[BoundaryCondition]) -> BoundaryCondition:
+    """
+    Junta as condições de contorno dos membros em uma só, com parametros no formato de array.
+    Os parametros que dependem do tempo viram uma série com um valor por membro.
+
+    Parameters:
+        bcs: Condição de contorno de cada membro.
+
+    Returns:
+        Retorna a condição de contorno do ensemble.
+    """
+
+    params: dict[str, np.ndarray | TimeSeries] = {}
+    for key in bcs[0].params:
+        values = [bc.params[key] for bc in bcs]
+        if any(isinstance(value, TimeSeries) for value in values):
+            params[key] = batch_time_series(values)
+        else:
+            params[key] = np.array(values, dtype=float)
+
+    return BoundaryCondition(type=bcs[0].type, params=params)
+
+
+def _batch_source(sources: list[Source | None], x: np.ndarray) -> SourceTerms:
+    """
+    Junta o termo fonte dos membros em um só, com uma linha por membro. Os membros
+    sem termo fonte ficam com zero e os fatores de escala viram uma série com um
+    valor por membro.
+
+    Parameters:
+        sources: Termo fonte de cada membro.
+        x: Coordenadas nodais da malha.
+
+    Returns:
+        Retorna o termo fonte do ensemble.
+    """
+
+    zeros = np.zeros(len(x) - 1)
+    terms = [source_terms(source, x) if source is not None else SourceTerms(sc=zeros, sp=zeros) for source in sources]
+
+    scales = [term.scale for term in terms]
+    if any(isinstance(scale, TimeSeries) for scale in scales):
+        scale: np.ndarray | TimeSeries = batch_time_series(scales)  # type: ignore[arg-type]
+    else:
+        scale = np.array(scales, dtype=float)
+
+    return SourceTerms(
+        sc=np.stack([term.sc for term in terms]),
+        sp=np.stack([term.sp for term in terms]),
+        scale=scale,
+    )
+
+
+def init_ensemble_mesh(inputs: list[Input]) -> Mesh:
+    """Inicializa a malha do ensemble com as informações lidas
+
+    Parameters:
+        inputs: Informações de cada membro.
+
+    Raises:
+        EnsembleInputMismatchError: Valor diferente entre os membros do ensemble.
+        EnsembleNotSupportedError: Opção incompatível com o ensemble.
+        AmrNotSupportedError: Ensemble com a malha adaptativa.
+
+    Returns:
+        Retorna a malha inicializada com o eixo de ensemble.
+    """
+
+    validated_ensemble(inputs)
+
+    ref = inputs[0]
+
+    # ... cada membro refinaria a sua malha de um jeito diferente
+    if ref.amr_every:
+        raise AmrNotSupportedError("o ensemble")
+
+    lbc = _batch_bc([in_.lbc for in_ in inputs])
+    rbc = _batch_bc([in_.rbc for in_ in inputs])
+
+    mesh = Mesh(ref.length, ref.ndiv, lbc, rbc, n_batch=len(inputs), grading=ref.grading)
+    mesh.mk_grid()
+
+    initialt = np.array([in_.initialt for in_ in inputs], dtype=float)
+    mesh.update_cells_results(prop_name="u", value=initialt[:, np.newaxis])
+
+    laws = ref.prop_laws
+    for name in ("k", "cp", "ro"):
+        if name in laws:
+            mesh.update_prop(prop_name=name, value=laws[name](mesh.cells.results.u))
+        else:
+            value = np.array([getattr(in_.prop, name) for in_ in inputs], dtype=float)
+            mesh.update_prop(prop_name=name, value=value[:, np.newaxis])
+
+    for member, in_ in enumerate(inputs):
+        if in_.layers:
+            mesh.update_layers(in_.layers, member=member)
+
+    if any(in_.source is not None for in_ in inputs):
+        mesh.source = _batch_source([in_.source for in_ in inputs], mesh.nodes.x)
+
+    return mesh
+
+
+class EnsembleEdp(Edp):
+    """
+    Solução de todos os membros do ensemble no mesmo loop temporal. A montagem
+    e o solver atuam sobre o eixo de ensemble, portanto o custo do interpretador
+    é pago uma vez por passo e não uma vez por membro.
+
+    Parameters:
+        member_dirs (list[Path]): Diretorio de saida de cada membro.
+    """
+
+    member_dirs: list[Path]
+
+    def __init__(self, infos: Input, mesh: Mesh, output_dir: Path, member_dirs: list[Path]):
+        """
+        Parameters:
+            infos: Informação da simulação do primeiro membro.
+            mesh: Malha com o eixo de ensemble.
+            output: Diretorio de saida.
+            member_dirs: Diretorio de saida de cada membro.
+        """
+
+        super().__init__(infos, mesh, output_dir)
+        self.member_dirs = member_dirs
+
+    def results_writer(self) -> EnsembleResultsWriter:
+        """
+        Escritor dos resultados de cada membro no seu próprio diretorio.
+
+        Info:
+            Só o formato `json` sem a escrita em segundo plano é aceito, o que é
+            garantido por `validated_ensemble`.
+        """
+
+        writers = [
+            results_writer_strategy(path / "results.json", indent=4, write_every_steps=self.write_every_steps)
+            for path in self.member_dirs
+        ]
+
+        return EnsembleResultsWriter(writers)
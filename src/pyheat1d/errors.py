@@ -67,3 +67,213 @@ class TimeLogWriteFileError(Pyheat1ErrorsBase):
     def __init__(self, file: str):
         msg = f"O arquivo '{file}' não pode ser escrito."
         super().__init__(msg)
+
+
+class CellsLoopEngineNotFoundError(Pyheat1ErrorsBase):
+    """Implementação do loop sobre as células não existe."""
+
+    errno = 9
+
+    def __init__(self, engine: str):
+        msg = f"A implementação '{engine}' do loop sobre as células não existe."
+        super().__init__(msg)
+
+
+class SolverBackendNotFoundError(Pyheat1ErrorsBase):
+    """Solver não existe."""
+
+    errno = 10
+
+    def __init__(self, backend: str):
+        msg = f"O solver '{backend}' não existe."
+        super().__init__(msg)
+
+
+class SolverBackendNotAvailableError(Pyheat1ErrorsBase):
+    """Dependência do solver não instalada."""
+
+    errno = 11
+
+    def __init__(self, backend: str, package: str):
+        msg = f"O solver '{backend}' precisa do pacote '{package}' instalado."
+        super().__init__(msg)
+
+
+class EnsembleInputMismatchError(Pyheat1ErrorsBase):
+    """Valor diferente entre os membros do ensemble."""
+
+    errno = 12
+
+    def __init__(self, key: str):
+        msg = f"O valor '{key}' deve ser o mesmo em todos os membros do ensemble."
+        super().__init__(msg)
+
+
+class SweepAxisError(Pyheat1ErrorsBase):
+    """Eixo da varredura inválido."""
+
+    errno = 13
+
+    def __init__(self, axis: str):
+        msg = f"O eixo '{axis}' da varredura é inválido."
+        super().__init__(msg)
+
+
+class ResultsFormatNotFoundError(Pyheat1ErrorsBase):
+    """Formato do arquivo de resultados não existe."""
+
+    errno = 14
+
+    def __init__(self, results_format: str):
+        msg = f"O formato de resultados '{results_format}' não existe."
+        super().__init__(msg)
+
+
+class SteadyNormNotFoundError(Pyheat1ErrorsBase):
+    """Norma do critério de regime permanente não existe."""
+
+    errno = 15
+
+    def __init__(self, norm: str):
+        msg = f"A norma '{norm}' do critério de regime permanente não existe."
+        super().__init__(msg)
+
+
+class AnalysisTypeNotFoundError(Pyheat1ErrorsBase):
+    """Tipo de analise não existe."""
+
+    errno = 16
+
+    def __init__(self, analysis: str):
+        msg = f"O tipo de analise '{analysis}' não existe."
+        super().__init__(msg)
+
+
+class SteadySingularError(Pyheat1ErrorsBase):
+    """Regime permanente com fluxo prescrito nos dois contornos."""
+
+    errno = 17
+
+    def __init__(self):
+        msg = "A analise 'steady' precisa de pelo menos uma condição de contorno do tipo 1 ou 3."
+        super().__init__(msg)
+
+
+class ThetaOutOfRangeError(Pyheat1ErrorsBase):
+    """Peso do método θ fora do intervalo."""
+
+    errno = 18
+
+    def __init__(self, theta: float):
+        msg = f"O peso do método θ deve estar no intervalo (0, 1], valor {theta}."
+        super().__init__(msg)
+
+
+class GradingNotFoundError(Pyheat1ErrorsBase):
+    """Tipo de distribuição dos tamanhos das células não existe."""
+
+    errno = 19
+
+    def __init__(self, grading: str):
+        msg = f"A distribuição '{grading}' dos tamanhos das células não existe."
+        super().__init__(msg)
+
+
+class MeshNodesError(Pyheat1ErrorsBase):
+    """Coordenadas nodais inválidas."""
+
+    errno = 20
+
+
+class AmrNotSupportedError(Pyheat1ErrorsBase):
+    """Opção incompatível com a malha adaptativa."""
+
+    errno = 21
+
+    def __init__(self, option: str):
+        msg = f"A malha adaptativa não aceita {option}."
+        super().__init__(msg)
+
+
+class AmrIndicatorNotFoundError(Pyheat1ErrorsBase):
+    """Indicador do refinamento adaptativo não existe."""
+
+    errno = 22
+
+    def __init__(self, indicator: str):
+        msg = f"O indicador '{indicator}' do refinamento adaptativo não existe."
+        super().__init__(msg)
+
+
+class PropertyLawError(Pyheat1ErrorsBase):
+    """Lei da propriedade do material inválida."""
+
+    errno = 23
+
+
+class NonlinearConvergenceError(Pyheat1ErrorsBase):
+    """Iterações não lineares não convergiram."""
+
+    errno = 24
+
+    def __init__(self, max_iter: int, residual: float):
+        msg = f"As iterações não lineares não convergiram em {max_iter} iterações, variação {residual}."
+        super().__init__(msg)
+
+
+class EigenAnalysisError(Pyheat1ErrorsBase):
+    """Opção incompatível com a analise `eigen`."""
+
+    errno = 25
+
+    def __init__(self, option: str):
+        msg = f"A analise 'eigen' não aceita {option}."
+        super().__init__(msg)
+
+
+class LayerError(Pyheat1ErrorsBase):
+    """Camada de material inválida."""
+
+    errno = 26
+
+
+class FaceConductivityNotFoundError(Pyheat1ErrorsBase):
+    """Média da condutividade nas faces não existe."""
+
+    errno = 27
+
+    def __init__(self, mean: str):
+        msg = f"A média '{mean}' da condutividade nas faces não existe."
+        super().__init__(msg)
+
+
+class BoundarySeriesError(Pyheat1ErrorsBase):
+    """Série temporal de uma condição de contorno inválida."""
+
+    errno = 28
+
+
+class SourceError(Pyheat1ErrorsBase):
+    """Termo fonte inválido."""
+
+    errno = 29
+
+
+class AsyncWriterNotSupportedError(Pyheat1ErrorsBase):
+    """Opção incompatível com a escrita em segundo plano."""
+
+    errno = 30
+
+    def __init__(self, option: str):
+        msg = f"A escrita em segundo plano não aceita {option}."
+        super().__init__(msg)
+
+
+class EnsembleNotSupportedError(Pyheat1ErrorsBase):
+    """Opção incompatível com o ensemble."""
+
+    errno = 31
+
+    def __init__(self, option: str):
+        msg = f"O ensemble não aceita {option}."
+        super().__init__(msg)
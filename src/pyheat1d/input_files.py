@@ -5,13 +5,35 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from pyheat1d.amr import AMR_INDICATORS
+from pyheat1d.cells_loop import CELLS_LOOP_ENGINES, FACE_CONDUCTIVITIES
 from pyheat1d.errors import (
+    AmrIndicatorNotFoundError,
+    AmrNotSupportedError,
+    AnalysisTypeNotFoundError,
+    AsyncWriterNotSupportedError,
     BoundaryConditionMissingKeyError,
+    BoundarySeriesError,
+    CellsLoopEngineNotFoundError,
+    EigenAnalysisError,
+    FaceConductivityNotFoundError,
     InputFileNotFoundError,
+    LayerError,
     MatPropsMissingKeyError,
     MissingInputInfoError,
+    ResultsFormatNotFoundError,
+    SolverBackendNotFoundError,
+    SourceError,
+    SteadyNormNotFoundError,
+    ThetaOutOfRangeError,
 )
-from pyheat1d.mesh import BoundaryCondition, MatProps, MatPropsRef
+from pyheat1d.mesh import BoundaryCondition, Grading, Layer, MatProps, MatPropsRef, cell_widths
+from pyheat1d.properties import PropertyLaw, property_law
+from pyheat1d.solver import SOLVER_BACKENDS
+from pyheat1d.source import Source, check_source, load_source
+from pyheat1d.steady import ANALYSIS_TYPES, STEADY_NORMS, check_steady_bcs
+from pyheat1d.timeseries import SERIES_KINDS, time_series
+from pyheat1d.writer import RESULTS_FILES
 
 
 @dataclass
@@ -27,6 +49,38 @@ class Input:
         rbc (BoundaryCondition): Condição de contorno a direita.
         prop (PropRef): Propriedades iniciais.
         initialt (float): Temperatura inicial
+        write_every_steps (int | None): Escreve os resultados a cada `N` passos.
+        cells_loop_engine (str): Implementação do loop sobre as células.
+        factorize_once (bool): Fatora a matriz uma única vez quando ela não muda no tempo.
+        solver (str): Solver do sistema de equações.
+        results_format (str): Formato do arquivo de resultados.
+        async_writer (bool): Escreve os resultados em uma thread em segundo plano.
+        writer_queue_size (int): Número de passos na fila da escrita em segundo plano.
+        chunk_steps (int): Número de passos guardados em cada bloco do formato `chunked`.
+        chunk_cells (int): Número de células em cada bloco do formato `chunked`.
+        results_tolerance (float | None): Erro absoluto máximo da quantização do formato `chunked`.
+        adaptive_tol (float | None): Tolerância do erro local do passo de tempo adaptativo.
+        dt_min (float | None): Menor passo de tempo adaptativo.
+        dt_max (float | None): Maior passo de tempo adaptativo.
+        steady_tol (float | None): Tolerância da variação entre dois passos para parar no regime permanente.
+        steady_norm (str): Norma da variação entre dois passos.
+        steady_check_every (int): Verifica o regime permanente a cada `N` passos.
+        analysis (str): Tipo de analise, `transient`, `steady` ou `eigen`.
+        eigen_modes (int | None): Número de modos mais lentos da analise `eigen`. O padrão são todos os modos.
+        theta (float): Peso da parte implícita do método θ, `1` é o Euler implícito e `0.5` é o Crank–Nicolson.
+        grading (Grading | None): Distribuição dos tamanhos das células.
+        amr_every (int | None): Refaz a malha adaptativa a cada `N` passos.
+        amr_refine_tol (float | None): Valor do indicador acima do qual as células são divididas.
+        amr_coarsen_tol (float | None): Valor do indicador abaixo do qual as células irmãs são juntadas.
+        amr_max_level (int): Número máximo de divisões de uma célula da malha base.
+        amr_indicator (str): Indicador do refinamento, `gradient` ou `curvature`.
+        nonlinear_tol (float): Tolerância da variação de `u` entre duas iterações não lineares.
+        nonlinear_max_iter (int): Número máximo de iterações não lineares por passo.
+        nonlinear_lag_tol (float | None): Variação relativa das propriedades abaixo da qual a matriz
+            do passo anterior é reaproveitada, sem iterações.
+        layers (list[Layer] | None): Camadas de material sobre as propriedades iniciais.
+        face_conductivity (str): Média da condutividade nas faces, `arithmetic` ou `harmonic`.
+        source (Source | None): Termo fonte volumétrico.
     """
 
     length: float
@@ -38,6 +92,41 @@ class Input:
     initialt: float
     prop: MatPropsRef
     write_every_steps: Optional[int] = None
+    cells_loop_engine: str = "numba"
+    factorize_once: bool = True
+    solver: str = "tdma"
+    results_format: str = "json"
+    async_writer: bool = False
+    writer_queue_size: int = 8
+    chunk_steps: int = 64
+    chunk_cells: int = 4096
+    results_tolerance: Optional[float] = None
+    adaptive_tol: Optional[float] = None
+    dt_min: Optional[float] = None
+    dt_max: Optional[float] = None
+    steady_tol: Optional[float] = None
+    steady_norm: str = "inf"
+    steady_check_every: int = 1
+    analysis: str = "transient"
+    eigen_modes: Optional[int] = None
+    theta: float = 1.0
+    grading: Optional[Grading] = None
+    amr_every: Optional[int] = None
+    amr_refine_tol: Optional[float] = None
+    amr_coarsen_tol: Optional[float] = None
+    amr_max_level: int = 3
+    amr_indicator: str = "gradient"
+    nonlinear_tol: float = 1.0e-6
+    nonlinear_max_iter: int = 50
+    nonlinear_lag_tol: Optional[float] = None
+    layers: Optional[list[Layer]] = None
+    face_conductivity: str = "arithmetic"
+    source: Optional[Source] = None
+
+    @property
+    def prop_laws(self) -> dict[str, PropertyLaw]:
+        """Propriedades que dependem da temperatura."""
+        return {name: law for name in ("k", "cp") if isinstance(law := getattr(self.prop, name), PropertyLaw)}
 
 
 def load_input_file(path: Path) -> Input:
@@ -62,9 +151,22 @@ def load_input_file(path: Path) -> Input:
 
     validated(dict_)
 
-    lbc = BoundaryCondition(**dict_.pop("lbc"))
-    rbc = BoundaryCondition(**dict_.pop("rbc"))
-    prop = MatPropsRef(**dict_.pop("prop"))
+    lbc = _boundary_condition(dict_.pop("lbc"), path.parent)
+    rbc = _boundary_condition(dict_.pop("rbc"), path.parent)
+    props = {name: property_law(name, value) for name, value in dict_.pop("prop").items()}
+    prop = MatPropsRef(**props)  # type: ignore[arg-type]
+
+    if "grading" in dict_:
+        dict_["grading"] = Grading(**dict_.pop("grading"))
+
+    if "layers" in dict_:
+        dict_["layers"] = [
+            Layer(start=layer["start"], end=layer["end"], prop=MatPropsRef(**layer["prop"]))
+            for layer in dict_["layers"]
+        ]
+
+    if "source" in dict_:
+        dict_["source"] = load_source(dict_["source"], dict_["length"], dict_["ndiv"], path.parent)
 
     in_ = Input(
         **dict_,
@@ -75,6 +177,28 @@ def load_input_file(path: Path) -> Input:
     return in_
 
 
+def _boundary_condition(bc: dict, base_dir: Path) -> BoundaryCondition:
+    """
+    Cria a condição de contorno, os parametros escritos como séries temporais viram `TimeSeries`.
+
+    Parameters:
+        bc: Condição de contorno do arquivo de entrada.
+        base_dir: Diretorio dos arquivos das séries temporais com caminho relativo.
+
+    Raises:
+        BoundarySeriesError: Série temporal inválida.
+
+    Returns:
+        Retorna a condição de contorno.
+    """
+
+    params = {
+        key: time_series(value, base_dir) if isinstance(value, dict) else value for key, value in bc["params"].items()
+    }
+
+    return BoundaryCondition(type=bc["type"], params=params)
+
+
 LIST_VALUES = (
     "length",
     "nstep",
@@ -96,6 +220,23 @@ def validated(infos: dict) -> None:
 
     Raises:
         MissingInputInfoError: Valor faltando no arquivo de entrada.
+        CellsLoopEngineNotFoundError: Implementação do loop sobre as células não existe.
+        SolverBackendNotFoundError: Solver não existe.
+        ResultsFormatNotFoundError: Formato do arquivo de resultados não existe.
+        SteadyNormNotFoundError: Norma do critério de regime permanente não existe.
+        AnalysisTypeNotFoundError: Tipo de analise não existe.
+        SteadySingularError: Analise `steady` com fluxo prescrito nos dois contornos.
+        ThetaOutOfRangeError: Peso do método θ fora do intervalo (0, 1].
+        GradingNotFoundError: Tipo de distribuição dos tamanhos das células não existe.
+        MeshNodesError: Coordenadas nodais inválidas.
+        AmrIndicatorNotFoundError: Indicador do refinamento adaptativo não existe.
+        AmrNotSupportedError: Opção incompatível com a malha adaptativa.
+        PropertyLawError: Lei da propriedade do material inválida.
+        EigenAnalysisError: Analise `eigen` com propriedades ou condições de contorno que dependem
+            da temperatura ou do tempo.
+        LayerError: Camada de material inválida.
+        FaceConductivityNotFoundError: Média da condutividade nas faces não existe.
+        BoundarySeriesError: Série temporal de uma condição de contorno inválida.
     """
 
     for k in LIST_VALUES:
@@ -119,3 +260,235 @@ def validated(infos: dict) -> None:
     except TypeError as e:
         key = find.group() if (find := re.search("(?<=').+(?=')", e.args[0])) else e.args[0]
         raise MatPropsMissingKeyError(key=key) from e
+
+    _validated_eigen(infos)
+
+    _validated_options(infos)
+
+    _validated_async_writer(infos)
+
+    _validated_bc_series(infos)
+
+    if infos.get("layers"):
+        _validated_layers(infos)
+
+    if "source" in infos:
+        _validated_source(infos)
+
+    if infos.get("amr_every"):
+        _validated_amr(infos)
+
+
+def _validated_options(infos: dict) -> None:
+    """
+    Valida as opções do arquivo de entrada.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        CellsLoopEngineNotFoundError: Implementação do loop sobre as células não existe.
+        SolverBackendNotFoundError: Solver não existe.
+        ResultsFormatNotFoundError: Formato do arquivo de resultados não existe.
+        SteadyNormNotFoundError: Norma do critério de regime permanente não existe.
+        AnalysisTypeNotFoundError: Tipo de analise não existe.
+        SteadySingularError: Analise `steady` com fluxo prescrito nos dois contornos.
+        ThetaOutOfRangeError: Peso do método θ fora do intervalo (0, 1].
+        GradingNotFoundError: Tipo de distribuição dos tamanhos das células não existe.
+        MeshNodesError: Coordenadas nodais inválidas.
+        FaceConductivityNotFoundError: Média da condutividade nas faces não existe.
+    """
+
+    if (engine := infos.get("cells_loop_engine", "numba")) not in CELLS_LOOP_ENGINES:
+        raise CellsLoopEngineNotFoundError(engine)
+
+    if (mean := infos.get("face_conductivity", "arithmetic")) not in FACE_CONDUCTIVITIES:
+        raise FaceConductivityNotFoundError(mean)
+
+    if (backend := infos.get("solver", "tdma")) not in SOLVER_BACKENDS:
+        raise SolverBackendNotFoundError(backend)
+
+    if (results_format := infos.get("results_format", "json")) not in RESULTS_FILES:
+        raise ResultsFormatNotFoundError(results_format)
+
+    if (norm := infos.get("steady_norm", "inf")) not in STEADY_NORMS:
+        raise SteadyNormNotFoundError(norm)
+
+    if (analysis := infos.get("analysis", "transient")) not in ANALYSIS_TYPES:
+        raise AnalysisTypeNotFoundError(analysis)
+
+    if analysis == "steady":
+        check_steady_bcs(infos["lbc"]["type"], infos["rbc"]["type"])
+
+    if not 0.0 < (theta := infos.get("theta", 1.0)) <= 1.0:
+        raise ThetaOutOfRangeError(theta)
+
+    if (grading := infos.get("grading")) is not None:
+        cell_widths(infos["length"], infos["ndiv"], Grading(**grading))
+
+
+def _validated_eigen(infos: dict) -> None:
+    """
+    Valida as opções da analise `eigen`. Com `eigen_modes` os modos decompõem
+    apenas a diferença para o regime permanente, que precisa ter solução única.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        PropertyLawError: Lei da propriedade do material inválida.
+        EigenAnalysisError: Analise `eigen` com propriedades dependentes da temperatura ou `eigen_modes` inválido.
+    """
+
+    laws = {name: property_law(name, value) for name, value in infos["prop"].items()}
+    if infos.get("analysis") == "eigen" and any(isinstance(law, PropertyLaw) for law in laws.values()):
+        raise EigenAnalysisError("propriedades dependentes da temperatura")
+
+    if (n_modes := infos.get("eigen_modes")) is None:
+        return
+
+    if n_modes < 1:
+        raise EigenAnalysisError("'eigen_modes' menor que 1")
+
+    if infos["lbc"]["type"] == 2 and infos["rbc"]["type"] == 2:
+        raise EigenAnalysisError("'eigen_modes' com fluxo prescrito nos dois contornos")
+
+
+def _validated_async_writer(infos: dict) -> None:
+    """
+    Valida a escrita em segundo plano. O formato `json` serializa todos os
+    passos no `dump`, depois do loop temporal, então não há o que sobrepor.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        AsyncWriterNotSupportedError: Escrita em segundo plano com o formato `json`.
+    """
+
+    if infos.get("async_writer", False) and infos.get("results_format", "json") == "json":
+        raise AsyncWriterNotSupportedError("o formato de resultados 'json'")
+
+
+def _validated_bc_series(infos: dict) -> None:
+    """
+    Valida as séries temporais das condições de contorno. Os arquivos das
+    séries são lidos apenas na leitura do arquivo de entrada. As analises
+    `steady` e `eigen` não têm tempo, então não aceitam séries temporais.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        BoundarySeriesError: Série temporal inválida ou analise `steady`.
+        EigenAnalysisError: Analise `eigen` com séries temporais.
+    """
+
+    specs = [value for bc in ("lbc", "rbc") for value in infos[bc]["params"].values() if isinstance(value, dict)]
+    if not specs:
+        return
+
+    for spec in specs:
+        if "file" not in spec:
+            time_series(spec)
+        elif (kind := spec.get("kind", "linear")) not in SERIES_KINDS:
+            raise BoundarySeriesError(f"A interpolação '{kind}' da série temporal não existe.")
+
+    analysis = infos.get("analysis", "transient")
+    if analysis == "steady":
+        raise BoundarySeriesError("A analise 'steady' não aceita condições de contorno que dependem do tempo.")
+    if analysis == "eigen":
+        raise EigenAnalysisError("condições de contorno que dependem do tempo")
+
+
+def _validated_layers(infos: dict) -> None:
+    """
+    Valida as camadas de material. As propriedades das camadas são constantes,
+    então as leis dependentes da temperatura não são aceitas com camadas.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        LayerError: Camada de material inválida.
+        MatPropsMissingKeyError: Propriedade faltando em uma camada.
+    """
+
+    length = infos["length"]
+
+    for i, layer in enumerate(infos["layers"]):
+        if not {"start", "end", "prop"} <= layer.keys():
+            raise LayerError(f"A camada {i} precisa de 'start', 'end' e 'prop'.")
+
+        if not 0.0 <= layer["start"] < layer["end"] <= length:
+            raise LayerError(f"A camada {i} deve ter 0 <= start < end <= {length}.")
+
+        try:
+            MatProps(**layer["prop"])
+        except TypeError as e:
+            key = find.group() if (find := re.search("(?<=').+(?=')", e.args[0])) else e.args[0]
+            raise MatPropsMissingKeyError(key=key) from e
+
+        if any(isinstance(value, dict) for value in (*layer["prop"].values(), *infos["prop"].values())):
+            raise LayerError("As camadas não aceitam propriedades dependentes da temperatura.")
+
+
+def _validated_source(infos: dict) -> None:
+    """
+    Valida o termo fonte. Os arquivos são lidos apenas na leitura do arquivo
+    de entrada. As analises `steady` e `eigen` não têm tempo, então não aceitam
+    o fator de escala que depende do tempo.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        SourceError: Termo fonte inválido ou analise `steady` com fator de escala.
+        BoundarySeriesError: Série temporal do fator de escala inválida.
+        EigenAnalysisError: Analise `eigen` com fator de escala.
+    """
+
+    check_source(infos["source"], infos["length"], infos["ndiv"])
+
+    if "scale" not in infos["source"]:
+        return
+
+    analysis = infos.get("analysis", "transient")
+    if analysis == "steady":
+        raise SourceError("A analise 'steady' não aceita termo fonte que depende do tempo.")
+    if analysis == "eigen":
+        raise EigenAnalysisError("termo fonte que depende do tempo")
+
+
+def _validated_amr(infos: dict) -> None:
+    """
+    Valida as opções da malha adaptativa. A malha adaptativa muda o número de
+    células durante a simulação, então precisa de um formato de resultados que
+    guarde a geometria de cada passo e do loop temporal com passo fixo.
+
+    Parameters:
+        infos: Informações lidas no arquivo de entrada.
+
+    Raises:
+        MissingInputInfoError: Valor `amr_refine_tol` faltando no arquivo de entrada.
+        AmrIndicatorNotFoundError: Indicador do refinamento adaptativo não existe.
+        AmrNotSupportedError: Opção incompatível com a malha adaptativa.
+    """
+
+    if infos.get("amr_refine_tol") is None:
+        raise MissingInputInfoError("amr_refine_tol")
+
+    if (indicator := infos.get("amr_indicator", "gradient")) not in AMR_INDICATORS:
+        raise AmrIndicatorNotFoundError(indicator)
+
+    if (results_format := infos.get("results_format", "json")) not in ("json", "jsonl"):
+        raise AmrNotSupportedError(f"o formato de resultados '{results_format}'")
+
+    if infos.get("async_writer", False):
+        raise AmrNotSupportedError("a escrita em segundo plano")
+
+    if infos.get("analysis", "transient") != "transient":
+        raise AmrNotSupportedError(f"a analise '{infos['analysis']}'")
+
+    if infos.get("adaptive_tol") is not None:
+        raise AmrNotSupportedError("o passo de tempo adaptativo")
@@ -0,0 +1,37 @@
+"""Compilação opcional dos kernels numéricos com o `numba`."""
+
+from collections.abc import Callable
+from typing import TypeVar, cast
+
+try:
+    import numba  # type: ignore
+except ImportError:  # pragma: no cover
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+F = TypeVar("F", bound=Callable)
+
+
+def compile_kernel(func: F) -> F:
+    """
+    Compila o kernel com o `numba` quando ele está instalado. Caso contrario a
+    própria função `python` é retornada.
+
+    Info:
+        O código compilado é guardado em disco (`cache=True`), portanto o custo
+        da compilação é pago apenas na primeira execução. O diretório do cache
+        pode ser alterado pela variável de ambiente `NUMBA_CACHE_DIR` e a
+        compilação desligada com `NUMBA_DISABLE_JIT=1`.
+
+    Parameters:
+        func: Kernel escrito em `python` com operações sobre arrays `numpy`.
+
+    Returns:
+        Retorna o kernel compilado ou a função original.
+    """
+
+    if numba is None:
+        return func
+
+    return cast(F, numba.njit(cache=True)(func))
@@ -4,10 +4,13 @@ Módulo com representação da Malha
 
 
 from dataclasses import dataclass
+from types import EllipsisType
 
 import numpy as np
 
-from pyheat1d.singleton import Singleton
+from pyheat1d.errors import GradingNotFoundError, MeshNodesError
+from pyheat1d.properties import PropertyLaw
+from pyheat1d.source import Source, SourceTerms, source_terms
 
 
 @dataclass
@@ -25,26 +28,135 @@ class BoundaryCondition:
         * 1 - Valor constante.
         * 2 - Fluxo de calor constante.
         * 3 - Fluxo de calor por Convecção.
+
+        Os parametros podem ser séries temporais (`TimeSeries`).
     """
 
     type: int
     params: dict
 
 
+@dataclass
+class Grading:
+    """
+    Distribuição dos tamanhos das células.
+
+    Parameters:
+        type (str): Tipo da distribuição.
+        params (dict): Parametros da distribuição.
+
+    Info:
+        Tipos de distribuição disponiveis:
+
+        * `uniform` - Células do mesmo tamanho.
+        * `geometric` - Cada célula é `ratio` vezes a anterior. Com `symmetric`
+            a progressão começa nos dois contornos.
+        * `tanh` - Células concentradas nos dois contornos, `beta` controla a concentração.
+        * `nodes` - Coordenadas nodais `x` explicitas.
+    """
+
+    type: str
+    params: dict
+
+
+def _geometric_nodes(length: float, n_div: int, params: dict) -> np.ndarray:
+    i = np.arange(n_div)
+    if params.get("symmetric", False):
+        i = np.minimum(i, n_div - 1 - i)
+    widths = params["ratio"] ** i.astype(float)
+    return np.asarray(np.concatenate(([0.0], np.cumsum(widths))) * (length / widths.sum()))
+
+
+def _tanh_nodes(length: float, n_div: int, params: dict) -> np.ndarray:
+    beta = params["beta"]
+    xi = np.linspace(-1.0, 1.0, n_div + 1)
+    return np.asarray(0.5 * length * (1.0 + np.tanh(beta * xi) / np.tanh(beta)))
+
+
+def _explicit_nodes(length: float, n_div: int, params: dict) -> np.ndarray:
+    x = np.asarray(params["x"], dtype=float)
+    if x.shape != (n_div + 1,):
+        raise MeshNodesError(f"São necessárias {n_div + 1} coordenadas nodais, foram dadas {x.size}.")
+    if x[0] != 0.0 or not np.isclose(x[-1], length):
+        raise MeshNodesError(f"As coordenadas nodais devem ir de 0 até {length}.")
+    if np.any(np.diff(x) <= 0.0):
+        raise MeshNodesError("As coordenadas nodais devem ser crescentes.")
+    return x
+
+
+GRADINGS = {
+    "uniform": None,
+    "geometric": _geometric_nodes,
+    "tanh": _tanh_nodes,
+    "nodes": _explicit_nodes,
+}
+
+
+def cell_widths(length: float, n_div: int, grading: Grading | None = None) -> np.ndarray:
+    """
+    Calcula o tamanho de cada célula.
+
+    Parameters:
+        length: Dimensão do domínio.
+        n_div: Número de divisões.
+        grading: Distribuição dos tamanhos das células. O padrão é a malha uniforme.
+
+    Raises:
+        GradingNotFoundError: Tipo de distribuição não existe.
+        MeshNodesError: Coordenadas nodais inválidas.
+
+    Returns:
+        Retorna o tamanho de cada célula.
+    """
+
+    if grading is None:
+        return np.full(n_div, length / n_div)
+
+    try:
+        mk_nodes = GRADINGS[grading.type]
+    except KeyError as e:
+        raise GradingNotFoundError(grading.type) from e
+
+    if mk_nodes is None:
+        return np.full(n_div, length / n_div)
+
+    return np.diff(mk_nodes(length, n_div, grading.params))
+
+
 @dataclass
 class MatPropsRef:
     """
     Propriedades do material.
 
     Parameters:
-        k (float|np.ndarray): Condutividade térmica.
+        k (float|np.ndarray|PropertyLaw): Condutividade térmica.
         ro (float|np.ndarray): Massa específica.
-        cp (float|np.ndarray): Calor específico.
+        cp (float|np.ndarray|PropertyLaw): Calor específico.
+
+    Info:
+        `k` e `cp` podem ser leis dependentes da temperatura.
     """
 
-    k: float
+    k: float | PropertyLaw
     ro: float
-    cp: float
+    cp: float | PropertyLaw
+
+
+@dataclass
+class Layer:
+    """
+    Camada de material no intervalo `[start, end]`, sobre as propriedades
+    iniciais das células.
+
+    Parameters:
+        start (float): Coordenada do início da camada.
+        end (float): Coordenada do fim da camada.
+        prop (MatPropsRef): Propriedades do material da camada.
+    """
+
+    start: float
+    end: float
+    prop: MatPropsRef
 
 
 @dataclass
@@ -56,6 +168,9 @@ class MatProps:
         k (float|np.ndarray): Condutividade térmica.
         ro (float|np.ndarray): Massa específica.
         cp (float|np.ndarray): Calor específico.
+
+    Info:
+        Em um ensemble os arrays têm a forma `(n_batch, n_cells)`.
     """
 
     k: np.ndarray
@@ -82,6 +197,9 @@ class ResultFields:
 
     Parameters:
         u (np.ndarray): Valores do campo escalar.
+
+    Info:
+        Em um ensemble o array tem a forma `(n_batch, n_cells)`.
     """
 
     u: np.ndarray
@@ -105,7 +223,7 @@ class Cells:
     results: ResultFields
 
 
-class Mesh(metaclass=Singleton):
+class Mesh:
     """
     Classe que representa a malha.
 
@@ -113,21 +231,34 @@ class Mesh(metaclass=Singleton):
         length (float): Dimensão do domínio.
         n_cells (int): Número de celulas.
         n_points (int): Número de pontos.
-        dx (float): Tamanho da célula.
+        dx (np.ndarray): Tamanho de cada célula.
+        dxf (np.ndarray): Distância entre os centroides das células vizinhas, uma por face interna.
         cells (Cells): Células da malha.
         nodes (Nodes): Nos da malha.
         lbc (BoundaryCondition): Condição de contorno a esquerda.
         rbc (BoundaryCondition): Condição de contorno a direita.
+        n_batch (int | None): Número de membros de um ensemble.
+        grading (Grading | None): Distribuição dos tamanhos das células.
+        source (SourceTerms | None): Termo fonte integrado em cada célula.
+
+    Info:
+        Com `n_batch` as propriedades e os resultados das células ganham um
+        eixo inicial e têm a forma `(n_batch, n_cells)`. Os parametros das
+        condições de contorno podem ser arrays com a forma `(n_batch,)`.
     """
 
     length: float
     n_cells: int
     n_points: int
-    dx: float
+    dx: np.ndarray
+    dxf: np.ndarray
     cells: Cells
     nodes: Nodes
     lbc: BoundaryCondition
     rbc: BoundaryCondition
+    n_batch: int | None
+    grading: Grading | None
+    source: SourceTerms | None
 
     def __init__(
         self,
@@ -135,6 +266,8 @@ class Mesh(metaclass=Singleton):
         n_div: int,
         lbc: BoundaryCondition,
         rbc: BoundaryCondition,
+        n_batch: int | None = None,
+        grading: Grading | None = None,
     ) -> None:
         """
         Parameters:
@@ -142,24 +275,37 @@ class Mesh(metaclass=Singleton):
             n_div: Número de divisões.
             lbc: Condição de contorno a esquerda.
             rbc: Condição de contorno a direita.
+            n_batch: Número de membros de um ensemble.
+            grading: Distribuição dos tamanhos das células. O padrão é a malha uniforme.
+
+        Raises:
+            GradingNotFoundError: Tipo de distribuição não existe.
+            MeshNodesError: Coordenadas nodais inválidas.
         """
 
         self.length = length
         self.n_cells = n_div
         self.n_points = n_div + 1
-        self.dx = length / n_div
+        self.grading = grading
+        self.dx = cell_widths(length, n_div, grading)
+        # ... na malha uniforme a distância é exatamente dx
+        self.dxf = 0.5 * (self.dx[:-1] + self.dx[1:])
         self.lbc = lbc
         self.rbc = rbc
+        self.n_batch = n_batch
+        self.source = None
+
+        shape = (self.n_cells,) if n_batch is None else (n_batch, self.n_cells)
 
         self.cells = Cells(
             nodes=np.zeros((self.n_cells, 2), dtype=int),
             centroids=np.zeros(self.n_cells, dtype=float),
             props=MatProps(
-                k=np.zeros(self.n_cells, dtype=float),
-                ro=np.zeros(self.n_cells, dtype=float),
-                cp=np.zeros(self.n_cells, dtype=float),
+                k=np.zeros(shape, dtype=float),
+                ro=np.zeros(shape, dtype=float),
+                cp=np.zeros(shape, dtype=float),
             ),
-            results=ResultFields(u=np.zeros(self.n_cells, dtype=float)),
+            results=ResultFields(u=np.zeros(shape, dtype=float)),
         )
 
         self.nodes = Nodes(
@@ -170,7 +316,7 @@ class Mesh(metaclass=Singleton):
         """Método que gera os pontos do grid."""
 
         for i in range(1, self.n_points - 1):
-            self.nodes.x[i] = self.nodes.x[i - 1] + self.dx
+            self.nodes.x[i] = self.nodes.x[i - 1] + self.dx[i - 1]
         self.nodes.x[-1] = self.length
 
     def _mk_cells(self) -> None:
@@ -196,13 +342,13 @@ class Mesh(metaclass=Singleton):
     def infos(self) -> dict[str, float | int]:
         """Retorna as principais informações da malha."""
         return {
-            "dx": self.dx,
+            "dx": float(self.dx.min()),
             "n_points": self.n_points,
             "n_cells": self.n_cells,
             "length": self.length,
         }
 
-    def update_prop(self, prop_name: str, value: float) -> None:
+    def update_prop(self, prop_name: str, value: float | np.ndarray) -> None:
         """Atualiza a propriedade desejada
 
         Parameters:
@@ -212,6 +358,38 @@ class Mesh(metaclass=Singleton):
         vector = getattr(self.cells.props, prop_name)
         vector[:] = value
 
+    def update_layers(self, layers: list[Layer], member: int | None = None) -> None:
+        """Atribui as propriedades das camadas às células. Uma célula cortada
+        pela interface recebe a mistura dos dois materiais pela fração `f` da
+        célula dentro da camada: `ro` e `ro * cp` são médias pela largura e `k`
+        é a condutividade equivalente em série, `1/k = (1 - f)/k0 + f/k1`.
+
+        Parameters:
+            layers: Camadas de material, as últimas sobrescrevem as primeiras.
+            member: Membro do ensemble. O padrão são todas as linhas.
+        """
+        x, props = self.nodes.x, self.cells.props
+        index: EllipsisType | int = Ellipsis if member is None else member
+        for layer in layers:
+            overlap = np.minimum(x[1:], layer.end) - np.maximum(x[:-1], layer.start)
+            f = np.clip(overlap / self.dx, 0.0, 1.0)
+            # ... o erro de arredondamento das coordenadas nodais não mistura células alinhadas com a camada
+            f[np.isclose(f, 0.0, rtol=0.0, atol=1.0e-12)] = 0.0
+            f[np.isclose(f, 1.0, rtol=0.0, atol=1.0e-12)] = 1.0
+            ro, cp, k = props.ro[index], props.cp[index], props.k[index]
+            # ... as camadas têm propriedades constantes
+            layer_ro, layer_cp, layer_k = (float(getattr(layer.prop, name)) for name in ("ro", "cp", "k"))
+            mixed_ro = (1.0 - f) * ro + f * layer_ro
+            mixed_cp = ((1.0 - f) * ro * cp + f * layer_ro * layer_cp) / mixed_ro
+            mixed_k = 1.0 / ((1.0 - f) / k + f / layer_k)
+            # ... células inteiras dentro ou fora da camada ficam com os valores exatos
+            for name, old, value, mixed in (
+                ("ro", ro, layer_ro, mixed_ro),
+                ("cp", cp, layer_cp, mixed_cp),
+                ("k", k, layer_k, mixed_k),
+            ):
+                getattr(props, name)[index] = np.where(f >= 1.0, value, np.where(f <= 0.0, old, mixed))
+
     def update_cells_results(self, prop_name: str, value: float | np.ndarray) -> None:
         """Atualiza o resultado das células
 
@@ -231,6 +409,9 @@ def init_mesh(
     rbc: BoundaryCondition,
     prop: MatPropsRef,
     initialt: float | np.ndarray,
+    grading: Grading | None = None,
+    layers: list[Layer] | None = None,
+    source: Source | None = None,
 ) -> Mesh:
     """Inicializa a malha com as informações lidas
 
@@ -241,18 +422,29 @@ def init_mesh(
         rbc: Condição de contorno a direita.
         prop: Propriedades iniciais.
         initialt: Temperatura inicial.
+        grading: Distribuição dos tamanhos das células.
+        layers: Camadas de material sobre as propriedades iniciais.
+        source: Termo fonte volumétrico.
 
     Returns:
         Retorna a malha inicializada
     """
 
-    mesh = Mesh(length, n_div, lbc, rbc)
+    mesh = Mesh(length, n_div, lbc, rbc, grading=grading)
     mesh.mk_grid()
 
-    mesh.update_prop(prop_name="k", value=prop.k)
-    mesh.update_prop(prop_name="cp", value=prop.cp)
-    mesh.update_prop(prop_name="ro", value=prop.ro)
-
     mesh.update_cells_results(prop_name="u", value=initialt)
 
+    for name in ("k", "cp", "ro"):
+        value = getattr(prop, name)
+        if isinstance(value, PropertyLaw):
+            value = value(mesh.cells.results.u)
+        mesh.update_prop(prop_name=name, value=value)
+
+    if layers:
+        mesh.update_layers(layers)
+
+    if source is not None:
+        mesh.source = source_terms(source, mesh.nodes.x)
+
     return mesh
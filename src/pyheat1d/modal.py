@@ -0,0 +1,183 @@
+"""
+Módulo da solução por decomposição em autovetores. Com propriedades e
+condições de contorno constantes o sistema semi-discreto
+
+`M du/dt = -K u + s`
+
+é linear e invariante no tempo, onde `M = ro * cp * dx` é a matriz de massa
+diagonal, `K` é a matriz tridiagonal do regime permanente e `s` o vetor de
+forças das condições de contorno. Com a mudança de variáveis `z = Vᵀ M^½ u`,
+onde `V` são os autovetores da matriz simétrica `M^-½ K M^-½`, cada modo é
+independente e tem solução fechada, então o campo é avaliado em qualquer tempo
+sem marchar no tempo.
+
+A matriz `M^-½ K M^-½` é simétrica e tridiagonal, então apenas as suas duas
+diagonais são passadas para o `eigh_tridiagonal` do `scipy`. Os autovetores
+ocupam `O(n m)` de memória para `m` modos; com todos os modos isso é `O(n²)`,
+por isso apenas os modos mais lentos podem ser calculados.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from pyheat1d.errors import EigenAnalysisError
+
+try:
+    from scipy.linalg import eigh_tridiagonal  # type: ignore
+except ImportError:  # pragma: no cover
+    eigh_tridiagonal = None
+
+# ... sem o scipy a matriz cheia é decomposta, O(n²) de memória e O(n³) de tempo
+DENSE_MAX_CELLS = 4096
+
+
+def tridiagonal_to_dense(a: np.ndarray) -> np.ndarray:
+    """
+    Monta a matriz cheia a partir das três diagonais.
+
+    Parameters:
+        a: Matriz de coeficientes com a forma `(..., células, 3)`.
+
+    Returns:
+        Retorna a matriz com a forma `(..., células, células)`.
+    """
+
+    n = a.shape[-2]
+    i = np.arange(n)
+
+    dense = np.zeros(a.shape[:-2] + (n, n))
+    dense[..., i, i] = a[..., 1]
+    dense[..., i[1:], i[:-1]] = a[..., 1:, 0]
+    dense[..., i[:-1], i[1:]] = a[..., :-1, 2]
+
+    return dense
+
+
+@dataclass
+class ModalDecomposition:
+    """
+    Decomposição do sistema semi-discreto nos seus modos. Os arrays podem ter
+    um eixo inicial de ensemble.
+
+    Parameters:
+        eigenvalues (np.ndarray): Taxa de decaimento de cada modo.
+        eigenvectors (np.ndarray): Autovetores de `M^-½ K M^-½` nas colunas.
+        scale (np.ndarray): Raiz da massa de cada célula, `M^½`.
+        z0 (np.ndarray): Amplitude de cada modo no tempo inicial.
+        g (np.ndarray): Força de cada modo.
+        steady (np.ndarray | float): Regime permanente somado ao campo dos modos. Com todos os modos ele é
+            `0` e o regime permanente vem da força `g` dos próprios modos.
+    """
+
+    eigenvalues: np.ndarray
+    eigenvectors: np.ndarray
+    scale: np.ndarray
+    z0: np.ndarray
+    g: np.ndarray
+    steady: np.ndarray | float = 0.0
+
+    def field(self, t: float) -> np.ndarray:
+        """
+        Avalia o campo em um tempo. Cada modo vale
+        `z(t) = z0 exp(-λt) + g (1 - exp(-λt)) / λ`, e `z0 + g t` para o modo de
+        autovalor nulo que aparece com fluxo prescrito nos dois contornos.
+
+        Parameters:
+            t: Tempo.
+
+        Returns:
+            Retorna o campo com a forma `(..., células)`.
+        """
+
+        lam = self.eigenvalues
+        # ... autovalores da ordem do erro de arredondamento são tratados como nulos
+        null = np.abs(lam) <= 1.0e-12 * np.max(np.abs(lam), axis=-1, keepdims=True)
+        safe = np.where(null, 1.0, lam)
+        growth = np.where(null, t, -np.expm1(-safe * t) / safe)
+
+        z = self.z0 * np.exp(-lam * t) + self.g * growth
+
+        return np.asarray(self.steady + np.einsum("...ij,...j->...i", self.eigenvectors, z) / self.scale)
+
+
+def _eigh_tridiagonal(d: np.ndarray, e: np.ndarray, n_modes: int | None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Autovalores e autovetores de uma matriz simétrica tridiagonal.
+
+    Parameters:
+        d: Diagonal principal, com a forma `(células,)`.
+        e: Diagonal secundária, com a forma `(células - 1,)`.
+        n_modes: Número de modos mais lentos. O padrão são todos os modos.
+
+    Raises:
+        EigenAnalysisError: Malha grande demais para a matriz cheia, sem o `scipy`.
+
+    Returns:
+        Retorna os autovalores crescentes e os autovetores nas colunas.
+    """
+
+    n = len(d)
+    select, select_range = ("a", None) if n_modes is None or n_modes >= n else ("i", (0, n_modes - 1))
+
+    if eigh_tridiagonal is not None:
+        eigenvalues, eigenvectors = eigh_tridiagonal(d, e, select=select, select_range=select_range)
+        return np.asarray(eigenvalues), np.asarray(eigenvectors)
+
+    if n > DENSE_MAX_CELLS:
+        raise EigenAnalysisError(f"malhas com mais de {DENSE_MAX_CELLS} células sem o scipy")
+
+    dense = np.diag(d) + np.diag(e, 1) + np.diag(e, -1)
+    eigenvalues, eigenvectors = np.linalg.eigh(dense)
+    m = n if n_modes is None else min(n_modes, n)
+
+    return eigenvalues[:m], eigenvectors[:, :m]
+
+
+def modal_decomposition(
+    a: np.ndarray,
+    b: np.ndarray,
+    mass: np.ndarray,
+    u0: np.ndarray,
+    n_modes: int | None = None,
+    steady: np.ndarray | None = None,
+) -> ModalDecomposition:
+    """
+    Calcula a decomposição uma única vez a partir do sistema do regime permanente.
+
+    Parameters:
+        a: Matriz de coeficientes do regime permanente, `K`.
+        b: Vetor de forças do regime permanente, `s`.
+        mass: Massa de cada célula, `ro * cp * dx`.
+        u0: Campo inicial.
+        n_modes: Número de modos mais lentos. O padrão são todos os modos.
+        steady: Regime permanente `K⁻¹ s`, necessário com `n_modes`. Os modos
+            decompõem apenas a diferença `u0 - steady`, que decai no tempo, então
+            os modos rápidos descartados só afetam o início do transiente.
+
+    Raises:
+        EigenAnalysisError: Malha grande demais para a matriz cheia, sem o `scipy`.
+
+    Returns:
+        Retorna a decomposição.
+    """
+
+    scale = np.sqrt(mass)
+
+    # ... diagonais da matriz simétrica M^-½ K M^-½
+    d = a[..., 1] / mass
+    e = a[..., :-1, 2] / (scale[..., :-1] * scale[..., 1:])
+
+    batch = a.shape[:-2]
+    pairs = [_eigh_tridiagonal(d[index], e[index], n_modes) for index in np.ndindex(batch)]
+    eigenvalues = np.stack([values for values, _ in pairs]).reshape(batch + pairs[0][0].shape)
+    eigenvectors = np.stack([vectors for _, vectors in pairs]).reshape(batch + pairs[0][1].shape)
+
+    if steady is None:
+        z0 = np.einsum("...ji,...j->...i", eigenvectors, scale * u0)
+        g = np.einsum("...ji,...j->...i", eigenvectors, b / scale)
+        return ModalDecomposition(eigenvalues, eigenvectors, scale, z0, g)
+
+    z0 = np.einsum("...ji,...j->...i", eigenvectors, scale * (u0 - steady))
+
+    return ModalDecomposition(eigenvalues, eigenvectors, scale, z0, np.zeros_like(z0), steady)
@@ -0,0 +1,156 @@
+"""
+Módulo dos gráficos dos resultados. As funções daqui são compartilhadas pelos
+comandos `plot`, `export` e `animate`, garantindo os mesmos eixos e legendas.
+"""
+
+import json
+import mmap
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from pyheat1d.errors import FileMeshNotFoundError
+
+MAX_POINTS = 2000
+
+# ... início do array `xp` do `mesh.json`, os valores não têm colchetes
+RE_XP = re.compile(rb'"xp":\s*\[')
+
+
+def parse_steps(steps: str, n: int | None = None) -> list[int]:
+    """
+    Lê os passos pedidos no formato `"0, 10, 20"`. Intervalos no formato
+    `início:fim:passo` também são aceitos quando o número de passos é conhecido,
+    por exemplo `"0:100:10"` ou `":"` para todos.
+
+    Parameters:
+        steps: Passos pedidos.
+        n: Número de passos guardados.
+
+    Returns:
+        Retorna a lista dos passos.
+    """
+
+    out: list[int] = []
+    for item in steps.split(","):
+        if ":" in item and n is not None:
+            bounds = [int(v) if v.strip() else None for v in item.split(":")]
+            out.extend(range(n)[slice(*bounds)])
+        else:
+            out.append(int(item))
+    return out
+
+
+def load_xp(output_dir: Path) -> np.ndarray:
+    """
+    Lê os centroides das células do `mesh.json`. Apenas o array `xp` é
+    convertido, a conectividade e as coordenadas nodais não são lidas.
+
+    Parameters:
+        output_dir: Diretorio de saida.
+
+    Raises:
+        FileMeshNotFoundError: Arquivo `mesh.json` não achado.
+
+    Returns:
+        Retorna os centroides das células.
+    """
+
+    file_mesh = Path(output_dir) / "mesh.json"
+
+    if not file_mesh.exists():
+        raise FileMeshNotFoundError()
+
+    with open(file_mesh, mode="rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if (m := RE_XP.search(mm)) is None:
+            # ... arquivo escrito fora do `MeshWriter`, o documento inteiro é lido
+            return np.asarray(json.loads(mm[:])["xp"], dtype=float)
+        start = m.end() - 1
+        return np.asarray(json.loads(mm[start : mm.find(b"]", start) + 1]), dtype=float)
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int = MAX_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduz o número de pontos da curva preservando a sua forma. Os pontos são
+    divididos em `max_points // 2` grupos e de cada grupo são mantidos o mínimo
+    e o máximo, na ordem em que aparecem, então picos e vales continuam visíveis.
+
+    Parameters:
+        x: Coordenadas.
+        y: Valores.
+        max_points: Número máximo de pontos.
+
+    Returns:
+        Retorna as coordenadas e os valores reduzidos.
+    """
+
+    n = len(y)
+    if n <= max_points:
+        return x, y
+
+    nbuckets = max(max_points // 2, 1)
+    edges = np.linspace(0, n, nbuckets + 1).astype(np.int64)
+
+    idx = np.empty(2 * nbuckets, dtype=np.int64)
+    for i, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        bucket = y[start:end]
+        imin, imax = start + np.argmin(bucket), start + np.argmax(bucket)
+        idx[2 * i], idx[2 * i + 1] = min(imin, imax), max(imin, imax)
+
+    return x[idx], y[idx]
+
+
+def step_label(t: float) -> str:
+    """Legenda da curva de um passo."""
+    return f"time = {t} s"
+
+
+def style_axes(ax: Axes) -> None:
+    """Eixos, legenda e grade dos gráficos dos resultados. A legenda só é criada quando há curvas com rótulo."""
+    ax.set_xlabel("x")
+    ax.set_ylabel("T(°C)")
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend()
+    ax.grid()
+
+
+def render_steps(
+    xp: np.ndarray,
+    fields: Iterable[tuple[float, np.ndarray] | tuple[float, np.ndarray, np.ndarray]],
+    path: Path,
+    max_points: int = MAX_POINTS,
+    ylim: tuple[float, float] | None = None,
+) -> None:
+    """
+    Desenha os passos em uma figura e salva no arquivo, sem janela. A figura
+    usa o canvas `Agg` diretamente, sem o `pyplot`, então pode ser usada em
+    servidores e em processos em paralelo. O formato é definido pela extensão
+    do arquivo (`.png`, `.svg`, ...).
+
+    Parameters:
+        xp: Centroides das células.
+        fields: Tempo e campo de cada passo, opcionalmente seguidos dos centroides
+            do passo na malha adaptativa. Pode ser um gerador, assim apenas um
+            passo completo fica em memória de cada vez.
+        path: Caminho do arquivo.
+        max_points: Número máximo de pontos de cada curva.
+        ylim: Limites do eixo y.
+    """
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+
+    for t, u, *x in fields:
+        ax.plot(*downsample(x[0] if x else xp, np.asarray(u), max_points), label=step_label(t))
+
+    if ylim is not None:
+        ax.set_ylim(*ylim)
+
+    style_axes(ax)
+    fig.savefig(path)
@@ -0,0 +1,101 @@
+"""
+Módulo das propriedades do material que dependem da temperatura. As leis são
+avaliadas de forma vetorizada sobre o campo de todas as células, inclusive com
+o eixo de ensemble.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from pyheat1d.errors import PropertyLawError
+
+
+def _table(u: np.ndarray, params: dict) -> np.ndarray:
+    return np.interp(u, params["T"], params["values"])
+
+
+def _poly(u: np.ndarray, params: dict) -> np.ndarray:
+    return np.asarray(np.polynomial.polynomial.polyval(u, params["coefs"]))
+
+
+PROPERTY_LAWS: dict[str, Callable[[np.ndarray, dict], np.ndarray]] = {
+    "table": _table,
+    "poly": _poly,
+}
+
+# ... a massa específica fica constante, assim a massa de cada célula não muda
+TEMPERATURE_DEPENDENT_PROPS = ("k", "cp")
+
+
+@dataclass
+class PropertyLaw:
+    """
+    Propriedade do material que depende da temperatura.
+
+    Parameters:
+        type (str): Tipo da lei.
+        params (dict): Parametros da lei.
+
+    Info:
+        Tipos de leis disponiveis:
+
+        * `table` - Interpolação linear da tabela `T` e `values`. Fora da tabela
+            os valores das pontas são usados.
+        * `poly` - Polinômio `coefs[0] + coefs[1] * T + coefs[2] * T**2 + ...`.
+    """
+
+    type: str
+    params: dict
+
+    def __call__(self, u: np.ndarray | float) -> np.ndarray:
+        """
+        Avalia a propriedade.
+
+        Parameters:
+            u: Temperatura de cada célula.
+
+        Returns:
+            Retorna a propriedade de cada célula.
+        """
+        return PROPERTY_LAWS[self.type](np.asarray(u, dtype=float), self.params)
+
+
+def property_law(name: str, value: float | dict) -> float | PropertyLaw:
+    """
+    Lê o valor de uma propriedade do arquivo de entrada.
+
+    Parameters:
+        name: Nome da propriedade.
+        value: Valor constante ou lei `{"type": ..., "params": ...}`.
+
+    Raises:
+        PropertyLawError: Lei inválida.
+
+    Returns:
+        Retorna o valor constante ou a lei.
+    """
+
+    if not isinstance(value, dict):
+        return value
+
+    if name not in TEMPERATURE_DEPENDENT_PROPS:
+        raise PropertyLawError(f"A propriedade '{name}' não aceita leis dependentes da temperatura.")
+
+    try:
+        law = PropertyLaw(**value)
+    except TypeError as e:
+        raise PropertyLawError(f"A lei da propriedade '{name}' precisa de 'type' e 'params'.") from e
+
+    if law.type not in PROPERTY_LAWS:
+        raise PropertyLawError(f"A lei '{law.type}' da propriedade '{name}' não existe.")
+
+    if law.type == "table" and (
+        len(law.params["T"]) != len(law.params["values"]) or np.any(np.diff(law.params["T"]) <= 0)
+    ):
+        raise PropertyLawError(
+            f"A tabela da propriedade '{name}' precisa de temperaturas crescentes e um valor por temperatura."
+        )
+
+    return law
@@ -0,0 +1,304 @@
+"""
+Módulo da leitura dos resultados. Os leitores constroem, ou leem, um índice
+com a posição de cada passo guardado, assim um passo, um intervalo de passos
+ou a série temporal de uma célula são lidos sem carregar o arquivo inteiro.
+"""
+
+import json
+import mmap
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+from pyheat1d.chunked import ChunkedResults
+from pyheat1d.errors import FileResultshNotFoundError
+from pyheat1d.writer import RESULTS_FILES
+
+# ... início de cada passo até o array de `u`, os valores de `u` não têm chaves
+RE_JSON_STEP = re.compile(rb"\{[^{}\[]*")
+RE_ISTEP = re.compile(rb'"istep":\s*(-?\d+)')
+RE_T = re.compile(rb'"t":\s*([^,\s}]+)')
+
+
+class ResultsReader(ABC):
+    """
+    Leitura indexada dos resultados. As linhas guardadas são numeradas de
+    `0` a `len(reader) - 1`, indices negativos contam a partir do final.
+
+    Parameters:
+        istep (np.ndarray): Passo de tempo de cada linha guardada.
+        t (np.ndarray): Tempo de cada linha guardada.
+    """
+
+    istep: np.ndarray
+    t: np.ndarray
+
+    @abstractmethod
+    def __init__(self, path: Path) -> None:
+        ...
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.istep)
+
+    def close(self) -> None:  # noqa: B027
+        """Fecha os arquivos abertos."""
+
+    def _normalize(self, i: int) -> int:
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError(f"O step {i} não existe. O Ultimo step é {n - 1}.")
+        return i % n
+
+    @abstractmethod
+    def _read_row(self, i: int) -> np.ndarray:
+        ...
+
+    def step(self, i: int) -> np.ndarray:
+        """
+        Lê o campo de uma linha guardada.
+
+        Parameters:
+            i: Linha guardada.
+
+        Raises:
+            IndexError: Linha não existe.
+
+        Returns:
+            Retorna o campo com a forma `(células,)`.
+        """
+
+        return self._read_row(self._normalize(i))
+
+    def steps(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """
+        Lê o campo de um intervalo de linhas guardadas.
+
+        Parameters:
+            start: Primeira linha.
+            stop: Linha final (exclusiva). O padrão é a última linha.
+
+        Returns:
+            Retorna os campos com a forma `(linhas, células)`.
+        """
+
+        rows = range(len(self))[start:stop]
+
+        return np.array([self._read_row(i) for i in rows])
+
+    def index_of(self, istep: int) -> int:
+        """
+        Procura a linha guardada de um passo de tempo.
+
+        Parameters:
+            istep: Passo de tempo.
+
+        Raises:
+            IndexError: Passo não foi guardado.
+
+        Returns:
+            Retorna a linha guardada.
+        """
+
+        i = int(np.searchsorted(self.istep, istep))
+        if i == len(self) or self.istep[i] != istep:
+            raise IndexError(f"O passo {istep} não foi guardado.")
+        return i
+
+    def nearest(self, t: float) -> int:
+        """
+        Procura a linha guardada com o tempo mais próximo.
+
+        Parameters:
+            t: Tempo.
+
+        Returns:
+            Retorna a linha guardada.
+        """
+
+        i = int(np.searchsorted(self.t, t))
+        if i == len(self) or (i > 0 and t - self.t[i - 1] <= self.t[i] - t):
+            i -= 1
+        return i
+
+    def at_time(self, t: float) -> np.ndarray:
+        """
+        Lê o campo da linha guardada com o tempo mais próximo.
+
+        Parameters:
+            t: Tempo.
+
+        Returns:
+            Retorna o campo com a forma `(células,)`.
+        """
+
+        return self.step(self.nearest(t))
+
+    def cell(self, j: int) -> np.ndarray:
+        """
+        Lê a série temporal de uma célula.
+
+        Parameters:
+            j: Célula.
+
+        Returns:
+            Retorna a série temporal com a forma `(linhas,)`.
+        """
+
+        return np.array([self._read_row(i)[j] for i in range(len(self))])
+
+    def centroids(self, i: int, xp: np.ndarray) -> np.ndarray:
+        """
+        Lê os centroides das células de uma linha guardada. Com a malha
+        adaptativa cada passo guarda as suas coordenadas nodais, nos outros
+        casos a malha não muda e os centroides dados são retornados.
+
+        Parameters:
+            i: Linha guardada.
+            xp: Centroides da malha inicial.
+
+        Returns:
+            Retorna os centroides com a forma `(células,)`.
+        """
+
+        return xp
+
+
+class JsonResultsReader(ResultsReader):
+    """
+    Leitura do `results.json`. O arquivo é mapeado em memória e o índice com a
+    posição do objeto de cada passo é construído com uma expressão regular, sem
+    converter os valores de `u`.
+    """
+
+    end = b"}"
+
+    def __init__(self, path: Path) -> None:
+        """
+        Parameters:
+            path: Caminho do arquivo.
+        """
+
+        self.fp = open(path, mode="rb")
+        self.mm = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ) if Path(path).stat().st_size else None
+
+        matches = list(RE_JSON_STEP.finditer(self.mm)) if self.mm is not None else []
+        self.offsets = np.array([m.start() for m in matches], dtype=np.int64)
+        self.istep = np.empty(len(matches), dtype=np.int64)
+        self.t = np.empty(len(matches), dtype=np.float64)
+        for i, m in enumerate(matches):
+            head = m[0]
+            if (istep := RE_ISTEP.search(head)) is None or (t := RE_T.search(head)) is None:
+                # ... arquivos antigos sem o `istep` ou com outra ordem das chaves
+                obj = self._read_obj(i)
+                self.istep[i], self.t[i] = obj.get("istep", i), obj["t"]
+            else:
+                self.istep[i], self.t[i] = int(istep[1]), float(t[1])
+
+    def close(self) -> None:
+        if self.mm is not None:
+            self.mm.close()
+        self.fp.close()
+
+    def _read_obj(self, i: int) -> dict:
+        start = int(self.offsets[i])
+        end = self.mm.find(self.end, start)  # type: ignore
+        end = len(self.mm) if end < 0 else end + 1  # type: ignore
+        return json.loads(self.mm[start:end])  # type: ignore
+
+    def _read_row(self, i: int) -> np.ndarray:
+        return np.array(self._read_obj(i)["u"])
+
+    def centroids(self, i: int, xp: np.ndarray) -> np.ndarray:
+        if (x := self._read_obj(self._normalize(i)).get("x")) is None:
+            return xp
+        x = np.asarray(x)
+        return np.asarray(0.5 * (x[:-1] + x[1:]))
+
+
+class JsonLinesResultsReader(JsonResultsReader):
+    """Leitura do `results.jsonl`, o índice guarda a posição de cada linha."""
+
+    end = b"\n"
+
+
+class NpyResultsReader(ResultsReader):
+    """Leitura do `results.npy` mapeado em memória, sem cópia."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Parameters:
+            path: Caminho do arquivo.
+        """
+
+        path = Path(path)
+        saved = np.load(path.parent / "results_steps.npy")
+        n = int(np.count_nonzero(saved["istep"] >= 0))
+        self.u: np.ndarray = np.load(path, mmap_mode="r")[:n]
+        self.istep = saved["istep"][:n]
+        self.t = saved["t"][:n]
+
+    def _read_row(self, i: int) -> np.ndarray:
+        return np.asarray(self.u[i])
+
+    def steps(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        return self.u[start:stop]
+
+    def cell(self, j: int) -> np.ndarray:
+        return self.u[:, j]
+
+
+class ChunkedResultsReader(ResultsReader):
+    """Leitura do `results.chunks`, usando o índice dos blocos."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Parameters:
+            path: Caminho do arquivo.
+        """
+
+        self.chunked = ChunkedResults(Path(path).parent)
+        self.istep = self.chunked.istep
+        self.t = self.chunked.t
+
+    def _read_row(self, i: int) -> np.ndarray:
+        return self.chunked.step(i)
+
+    def cell(self, j: int) -> np.ndarray:
+        return self.chunked.cell(j)
+
+
+RESULTS_READERS: dict[str, type[ResultsReader]] = {
+    "json": JsonResultsReader,
+    "jsonl": JsonLinesResultsReader,
+    "npy": NpyResultsReader,
+    "chunked": ChunkedResultsReader,
+}
+
+
+def open_results(output_dir: Path) -> ResultsReader:
+    """
+    Abre os resultados de um diretorio de saida com o leitor do formato achado.
+
+    Parameters:
+        output_dir: Diretorio de saida.
+
+    Raises:
+        FileResultshNotFoundError: Arquivo de resultados não achado.
+
+    Returns:
+        Retorna o leitor dos resultados.
+    """
+
+    for results_format, file_name in RESULTS_FILES.items():
+        if (path := Path(output_dir) / file_name).exists():
+            return RESULTS_READERS[results_format](path)
+
+    raise FileResultshNotFoundError()
@@ -1,9 +1,10 @@
 """Módulo com as funcionalidades de medição de tempos da analise."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import wraps
 from json import dump as json_dump
 from pathlib import Path
+from threading import local
 from time import perf_counter
 
 from rich.console import Console
@@ -12,18 +13,29 @@ from pyheat1d.errors import TimeLogWriteFileError
 
 
 @dataclass
-class Times:
-    """Class com os tempos da analise."""
+class Times(local):
+    """Class com os tempos da analise.
+
+    Info:
+        Cada thread tem os seus próprios tempos, portanto simulações rodando
+        em threads diferentes não misturam as medições.
+
+    Parameters:
+        stats (dict): Estatísticas da analise, como o número de passos
+            rejeitados, escritas junto com os tempos.
+    """
 
     cell_loop: float = 0.0
     solver: float = 0.0
     edp: float = 0.0
+    stats: dict = field(default_factory=dict)
 
     def reset(self):
         """Zera todos os tempos."""
         self.cell_loop = 0.0
         self.solver = 0.0
         self.edp = 0.0
+        self.stats.clear()
 
     def print_stdout_simulation_times(self) -> None:
         """Escreve os tempos no console."""
@@ -48,6 +60,7 @@ class Times:
                     "edp": self.edp,
                     "solver": self.solver,
                     "cell_loop": self.cell_loop,
+                    **self.stats,
                 },
                 new_file.open(mode="w", encoding="utf8"),
             )
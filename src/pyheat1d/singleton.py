@@ -1,7 +0,0 @@
-class Singleton(type):
-    _instances = {}  # type: ignore
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
@@ -1,52 +1,536 @@
 """Módulo dos solvers"""
 
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 
 import numpy as np
 
+from pyheat1d.errors import SolverBackendNotAvailableError, SolverBackendNotFoundError
+from pyheat1d.jit import compile_kernel
 from pyheat1d.simulation_times import register_timer
 from pyheat1d.system import System
 
+try:
+    from scipy.linalg import lapack  # type: ignore
+except ImportError:  # pragma: no cover
+    lapack = None
+
+
+def _tdma(a: np.ndarray, b0: np.ndarray) -> np.ndarray:
+    """
+    Kernel do `TDMA`. A diagonal superior de `a` é modificada.
+
+    Parameters:
+        a: Matriz de coeficientes.
+        b0: Vetor de forças.
+
+    Returns:
+        Vetor de solução do sistema.
+    """
+
+    neq = b0.shape[0]
+
+    lower = a[:, 0]
+    diag = a[:, 1]
+    upper = a[:, 2]
+    b = b0.copy()
+
+    x = np.empty_like(b)
+
+    upper[0] /= diag[0]
+    b[0] /= diag[0]
+    for i in range(1, neq - 1):
+        upper[i] /= diag[i] - upper[i - 1] * lower[i]
+        b[i] = (b[i] - b[i - 1] * lower[i]) / (diag[i] - upper[i - 1] * lower[i])
+    b[-1] = (b[-1] - b[-2] * lower[-1]) / (diag[-1] - upper[-2] * lower[-1])
+
+    x[-1] = b[-1]
+    for i in range(neq - 2, -1, -1):
+        x[i] = b[i] - upper[i] * x[i + 1]
+
+    return x
+
+
+def _tdma_factorize(a: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kernel da eliminação da diagonal superior do `TDMA`.
+
+    Parameters:
+        a: Matriz de coeficientes.
+
+    Returns:
+        Retorna a diagonal inferior, a diagonal superior modificada e os pivôs.
+    """
+
+    neq = a.shape[0]
+
+    lower = a[:, 0].copy()
+    diag = a[:, 1]
+    upper = a[:, 2].copy()
+    denom = np.empty(neq, dtype=np.float64)
+
+    denom[0] = diag[0]
+    upper[0] /= denom[0]
+    for i in range(1, neq - 1):
+        denom[i] = diag[i] - upper[i - 1] * lower[i]
+        upper[i] /= denom[i]
+    denom[-1] = diag[-1] - upper[-2] * lower[-1]
+
+    return lower, upper, denom
+
+
+def _tdma_substitution(lower: np.ndarray, upper: np.ndarray, denom: np.ndarray, b0: np.ndarray) -> np.ndarray:
+    """
+    Kernel das substituições do `TDMA` com a matriz já fatorada.
+
+    Parameters:
+        lower: Diagonal inferior.
+        upper: Diagonal superior modificada.
+        denom: Pivôs da eliminação.
+        b0: Vetor de forças.
+
+    Returns:
+        Vetor de solução do sistema.
+    """
+
+    neq = b0.shape[0]
+
+    b = b0.copy()
+    x = np.empty_like(b)
+
+    b[0] /= denom[0]
+    for i in range(1, neq):
+        b[i] = (b[i] - b[i - 1] * lower[i]) / denom[i]
+
+    x[-1] = b[-1]
+    for i in range(neq - 2, -1, -1):
+        x[i] = b[i] - upper[i] * x[i + 1]
+
+    return x
+
+
+def _tdma_batched(a: np.ndarray, b0: np.ndarray) -> np.ndarray:
+    """
+    `TDMA` vetorizado sobre o eixo de ensemble. A diagonal superior de `a` é modificada.
+
+    Parameters:
+        a: Matrizes de coeficientes com a forma `(nbatch, neq, 3)`.
+        b0: Vetores de forças com a forma `(nbatch, neq)`.
+
+    Returns:
+        Vetores de solução dos sistemas.
+    """
+
+    neq = b0.shape[-1]
+
+    lower = a[..., 0]
+    diag = a[..., 1]
+    upper = a[..., 2]
+    b = b0.copy()
+
+    x = np.empty_like(b)
+
+    upper[:, 0] /= diag[:, 0]
+    b[:, 0] /= diag[:, 0]
+    for i in range(1, neq - 1):
+        upper[:, i] /= diag[:, i] - upper[:, i - 1] * lower[:, i]
+        b[:, i] = (b[:, i] - b[:, i - 1] * lower[:, i]) / (diag[:, i] - upper[:, i - 1] * lower[:, i])
+    b[:, -1] = (b[:, -1] - b[:, -2] * lower[:, -1]) / (diag[:, -1] - upper[:, -2] * lower[:, -1])
+
+    x[:, -1] = b[:, -1]
+    for i in range(neq - 2, -1, -1):
+        x[:, i] = b[:, i] - upper[:, i] * x[:, i + 1]
+
+    return x
+
+
+def _tdma_factorize_batched(a: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Eliminação da diagonal superior do `TDMA` vetorizada sobre o eixo de ensemble.
+
+    Parameters:
+        a: Matrizes de coeficientes com a forma `(nbatch, neq, 3)`.
+
+    Returns:
+        Retorna a diagonal inferior, a diagonal superior modificada e os pivôs.
+    """
+
+    neq = a.shape[-2]
+
+    lower = a[..., 0].copy()
+    diag = a[..., 1]
+    upper = a[..., 2].copy()
+    denom = np.empty_like(diag)
+
+    denom[:, 0] = diag[:, 0]
+    upper[:, 0] /= denom[:, 0]
+    for i in range(1, neq - 1):
+        denom[:, i] = diag[:, i] - upper[:, i - 1] * lower[:, i]
+        upper[:, i] /= denom[:, i]
+    denom[:, -1] = diag[:, -1] - upper[:, -2] * lower[:, -1]
+
+    return lower, upper, denom
+
+
+def _tdma_substitution_batched(lower: np.ndarray, upper: np.ndarray, denom: np.ndarray, b0: np.ndarray) -> np.ndarray:
+    """
+    Substituições do `TDMA` vetorizadas sobre o eixo de ensemble.
+
+    Parameters:
+        lower: Diagonais inferiores.
+        upper: Diagonais superiores modificadas.
+        denom: Pivôs da eliminação.
+        b0: Vetores de forças com a forma `(nbatch, neq)`.
+
+    Returns:
+        Vetores de solução dos sistemas.
+    """
+
+    neq = b0.shape[-1]
+
+    b = b0.copy()
+    x = np.empty_like(b)
+
+    b[:, 0] /= denom[:, 0]
+    for i in range(1, neq):
+        b[:, i] = (b[:, i] - b[:, i - 1] * lower[:, i]) / denom[:, i]
+
+    x[:, -1] = b[:, -1]
+    for i in range(neq - 2, -1, -1):
+        x[:, i] = b[:, i] - upper[:, i] * x[:, i + 1]
+
+    return x
+
+
+_tdma_compiled = compile_kernel(_tdma)
+_tdma_factorize_compiled = compile_kernel(_tdma_factorize)
+_tdma_substitution_compiled = compile_kernel(_tdma_substitution)
+
+
+def _cyclic_reduction_factorize(a: np.ndarray) -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Redução das diagonais da redução cíclica. O sistema é completado com
+    equações identidade até `2**m - 1` equações. A matriz pode ter um eixo
+    inicial de ensemble.
+
+    Parameters:
+        a: Matriz de coeficientes.
+
+    Returns:
+        Retorna os multiplicadores de cada nível e as diagonais reduzidas.
+    """
+
+    neq = a.shape[-2]
+    n = 2 ** int(np.ceil(np.log2(neq + 1))) - 1
+    shape = (*a.shape[:-2], n)
+
+    lower, diag, upper = np.zeros(shape), np.ones(shape), np.zeros(shape)
+    lower[..., :neq], diag[..., :neq], upper[..., :neq] = a[..., 0], a[..., 1], a[..., 2]
+    lower[..., 0], upper[..., neq - 1] = 0.0e0, 0.0e0
+
+    levels = []
+    h = 1
+    while 2 * h - 1 < n:
+        i = np.arange(2 * h - 1, n, 2 * h)
+        alpha = -lower[..., i] / diag[..., i - h]
+        gamma = -upper[..., i] / diag[..., i + h]
+        diag[..., i] += alpha * upper[..., i - h] + gamma * lower[..., i + h]
+        lower[..., i] = alpha * lower[..., i - h]
+        upper[..., i] = gamma * upper[..., i + h]
+        levels.append((h, alpha, gamma))
+        h *= 2
+
+    return levels, lower, diag, upper
+
+
+def _cyclic_reduction_substitution(
+    levels: list, lower: np.ndarray, diag: np.ndarray, upper: np.ndarray, b0: np.ndarray
+) -> np.ndarray:
+    """
+    Redução do vetor de forças e retro-substituição da redução cíclica.
+
+    Parameters:
+        levels: Multiplicadores de cada nível.
+        lower: Diagonal inferior reduzida.
+        diag: Diagonal principal reduzida.
+        upper: Diagonal superior reduzida.
+        b0: Vetor de forças.
+
+    Returns:
+        Vetor de solução do sistema.
+    """
+
+    neq, n = b0.shape[-1], diag.shape[-1]
+
+    b = np.zeros(diag.shape)
+    b[..., :neq] = b0
+
+    for h, alpha, gamma in levels:
+        i = np.arange(2 * h - 1, n, 2 * h)
+        b[..., i] += alpha * b[..., i - h] + gamma * b[..., i + h]
+
+    # ... x[0] e x[n + 1] são zeros auxiliares
+    x = np.zeros((*diag.shape[:-1], n + 2))
+    h = (n + 1) // 2
+    while h >= 1:
+        i = np.arange(h - 1, n, 2 * h)
+        x[..., i + 1] = (b[..., i] - lower[..., i] * x[..., i + 1 - h] - upper[..., i] * x[..., i + 1 + h]) / diag[
+            ..., i
+        ]
+        h //= 2
+
+    return x[..., 1 : neq + 1]
+
+
+class SolverBackend(ABC):
+    """Solução do sistema tridiagonal com a matriz no formato `System.a` (n,3)."""
+
+    @abstractmethod
+    def solve(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Resolve o sistema.
+
+        Parameters:
+            a: Matriz de coeficientes.
+            b: Vetor de forças.
+
+        Returns:
+            Vetor de solução do sistema.
+        """
+
+    @abstractmethod
+    def factorize(self, a: np.ndarray) -> None:
+        """
+        Fatora a matriz de coeficientes.
+
+        Parameters:
+            a: Matriz de coeficientes.
+        """
+
+    @abstractmethod
+    def solve_factorized(self, b: np.ndarray) -> np.ndarray:
+        """
+        Resolve o sistema com a matriz já fatorada.
+
+        Parameters:
+            b: Vetor de forças.
+
+        Returns:
+            Vetor de solução do sistema.
+        """
+
+
+SOLVER_BACKENDS: dict[str, type[SolverBackend]] = {}
+
+
+def register_solver_backend(name: str):
+    """Registra o solver que pode ser escolhido pelo nome.
+
+    Parameters:
+        name: O nome do solver.
+    """
+
+    def decorator_register_solver_backend(cls: type[SolverBackend]) -> type[SolverBackend]:
+        SOLVER_BACKENDS[name] = cls
+        return cls
+
+    return decorator_register_solver_backend
+
+
+@dataclass
+class TDMAFactors:
+    """
+    Fatoração do sistema tridiagonal usada pelo `TDMA`.
+
+    Parameters:
+        lower (np.ndarray): Diagonal inferior.
+        upper (np.ndarray): Diagonal superior modificada pela eliminação.
+        denom (np.ndarray): Pivôs da eliminação.
+    """
+
+    lower: np.ndarray
+    upper: np.ndarray
+    denom: np.ndarray
+
+
+@register_solver_backend("tdma")
+class TDMABackend(SolverBackend):
+    """
+    Método `TDMA` [[ref]](https://en.wikipedia.org/wiki/Tridiagonal_matrix_algorithm).
+    Sistemas com eixo de ensemble são resolvidos com operações vetorizadas sobre esse eixo.
+    """
+
+    factors: TDMAFactors
+
+    def solve(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        if a.ndim == 3:
+            return _tdma_batched(a, b)
+        return _tdma_compiled(a, b)
+
+    def factorize(self, a: np.ndarray) -> None:
+        if a.ndim == 3:
+            self.factors = TDMAFactors(*_tdma_factorize_batched(a))
+        else:
+            self.factors = TDMAFactors(*_tdma_factorize_compiled(a))
+
+    def solve_factorized(self, b: np.ndarray) -> np.ndarray:
+        factors = self.factors
+        if b.ndim == 2:
+            return _tdma_substitution_batched(factors.lower, factors.upper, factors.denom, b)
+        return _tdma_substitution_compiled(factors.lower, factors.upper, factors.denom, b)
+
+
+@register_solver_backend("lapack")
+class LapackBackend(SolverBackend):
+    """
+    Rotinas tridiagonais `?gtsv`, `?gttrf` e `?gttrs` do LAPACK via `scipy`.
+    Sistemas com eixo de ensemble são resolvidos um a um.
+    """
+
+    factors: list[tuple]
+
+    def __init__(self) -> None:
+        if lapack is None:
+            raise SolverBackendNotAvailableError("lapack", "scipy")
+
+    @staticmethod
+    def _check(info: int) -> None:
+        if info != 0:
+            raise np.linalg.LinAlgError(f"LAPACK retornou info = {info}.")
+
+    def solve(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        if a.ndim == 3:
+            return np.stack([self._solve(a_m, b_m) for a_m, b_m in zip(a, b)])
+        return self._solve(a, b)
+
+    def factorize(self, a: np.ndarray) -> None:
+        self.factors = [self._factorize(a_m) for a_m in a] if a.ndim == 3 else [self._factorize(a)]
+
+    def solve_factorized(self, b: np.ndarray) -> np.ndarray:
+        if b.ndim == 2:
+            return np.stack([self._solve_factorized(f, b_m) for f, b_m in zip(self.factors, b)])
+        return self._solve_factorized(self.factors[0], b)
+
+    def _solve(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        *_, x, info = lapack.dgtsv(a[1:, 0], a[:, 1], a[:-1, 2], b)
+        self._check(info)
+        return np.asarray(x)
+
+    def _factorize(self, a: np.ndarray) -> tuple:
+        # ... o wrapper do dgttrf do scipy não aceita sistemas com menos de 3 equações
+        if a.shape[0] < 3:
+            return (a.copy(),)
+        *factors, info = lapack.dgttrf(a[1:, 0], a[:, 1], a[:-1, 2])
+        self._check(info)
+        return tuple(factors)
+
+    def _solve_factorized(self, factors: tuple, b: np.ndarray) -> np.ndarray:
+        if len(factors) == 1:
+            return self._solve(factors[0], b)
+        x, info = lapack.dgttrs(*factors, b)
+        self._check(info)
+        return np.asarray(x)
+
+
+@register_solver_backend("cyclic_reduction")
+class CyclicReductionBackend(SolverBackend):
+    """
+    Redução cíclica vetorizada com o `numpy`. Cada nível é resolvido com operações
+    sobre arrays, inclusive sobre o eixo de ensemble.
+    """
+
+    factors: tuple[list, np.ndarray, np.ndarray, np.ndarray]
+
+    def solve(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return _cyclic_reduction_substitution(*_cyclic_reduction_factorize(a), b)
+
+    def factorize(self, a: np.ndarray) -> None:
+        self.factors = _cyclic_reduction_factorize(a)
+
+    def solve_factorized(self, b: np.ndarray) -> np.ndarray:
+        return _cyclic_reduction_substitution(*self.factors, b)
+
+
+def solver_backend_strategy(name: str) -> SolverBackend:
+    """
+    Seleciona o solver pelo nome.
+
+    Parameters:
+        name: Nome do solver.
+
+    Raises:
+        SolverBackendNotFoundError: Solver não existe.
+        SolverBackendNotAvailableError: Dependência do solver não instalada.
+    """
+
+    try:
+        cls = SOLVER_BACKENDS[name]
+    except KeyError as e:
+        raise SolverBackendNotFoundError(name) from e
+
+    return cls()
+
 
 @dataclass
 class Solver:
     """
     Classe solver.
 
+    Info:
+        Solvers disponiveis:
+
+        * `tdma` - Método `TDMA`, compilado com o `numba` quando ele está instalado.
+        * `lapack` - Rotinas tridiagonais do LAPACK, precisa do `scipy`.
+        * `cyclic_reduction` - Redução cíclica vetorizada com o `numpy`.
+
     Parameters:
         system (System): Sistema de equações a ser resolvido.
+        backend (str): Nome do solver.
+        factorized (bool): A matriz já foi fatorada.
     """
 
     system: System
+    backend: str = "tdma"
+    factorized: bool = field(default=False, init=False)
+    _backend: SolverBackend = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._backend = solver_backend_strategy(self.backend)
 
     @register_timer("solver")
     def solver(self) -> np.ndarray:
         """
-        Resolução de sistemas tridiagonais pelo método `TDMA` [[ref]](https://en.wikipedia.org/wiki/Tridiagonal_matrix_algorithm).
+        Resolução do sistema tridiagonal.
 
         Returns:
             Vetor de solução do sistema.
 
         """
 
-        a, b0, neq = self.system.a, self.system.b, self.system.neq
+        return self._backend.solve(self.system.a, self.system.b)
 
-        lower = a[:, 0]
-        diag = a[:, 1]
-        upper = a[:, 2]
-        b = b0.copy()
+    @register_timer("solver")
+    def factorize(self) -> None:
+        """
+        Fatora a matriz de coeficientes. A fatoração é feita uma única vez e a
+        matriz `system.a` não é alterada.
+        """
 
-        x = np.empty_like(b)
+        self._backend.factorize(self.system.a)
+        self.factorized = True
 
-        upper[0] /= diag[0]
-        b[0] /= diag[0]
-        for i in range(1, neq - 1):
-            upper[i] /= diag[i] - upper[i - 1] * lower[i]
-            b[i] = (b[i] - b[i - 1] * lower[i]) / (diag[i] - upper[i - 1] * lower[i])
-        b[-1] = (b[-1] - b[-2] * lower[-1]) / (diag[-1] - upper[-2] * lower[-1])
+    @register_timer("solver")
+    def solver_factorized(self) -> np.ndarray:
+        """
+        Resolução do sistema usando a fatoração obtida em `factorize`. Apenas
+        as substituições do vetor de forças são feitas.
+
+        Returns:
+            Vetor de solução do sistema.
+        """
 
-        x[-1] = b[-1]
-        for i in range(neq - 2, -1, -1):
-            x[i] = b[i] - upper[i] * x[i + 1]
+        if not self.factorized:
+            self._backend.factorize(self.system.a)
+            self.factorized = True
 
-        return x.copy()
+        return self._backend.solve_factorized(self.system.b)
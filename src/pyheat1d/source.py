@@ -0,0 +1,259 @@
+"""
+Módulo do termo fonte volumétrico. O termo fonte é linearizado,
+`S = scale(t) * (sc + sp * u)`, com `sp <= 0`, e descrito como uma função
+constante por trechos da coordenada. A integral do perfil em cada célula é
+calculada com operações sobre arrays inteiros, uma única vez por malha; no
+loop temporal `sc` entra no vetor de forças e `-sp` na diagonal da matriz.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from pyheat1d.errors import BoundarySeriesError, SourceError
+from pyheat1d.timeseries import SERIES_KINDS, TimeSeries, time_series
+
+SOURCE_TYPES = ("uniform", "regions", "cells")
+
+
+@dataclass
+class Source:
+    """
+    Termo fonte do arquivo de entrada.
+
+    Parameters:
+        type (str): Tipo do termo fonte.
+        params (dict): Parametros do termo fonte.
+        scale (TimeSeries | None): Fator de escala que depende do tempo.
+
+    Info:
+        Tipos de termo fonte disponiveis, `sp` é opcional e o padrão é `0`:
+
+        * `uniform` - Mesmo `value` e `sp` em todo o domínio.
+        * `regions` - Lista `regions` de intervalos `start`, `end` com `value` e `sp`. As regiões que se
+            sobrepõem são somadas.
+        * `cells` - Um valor por célula da malha inicial, em `values` ou lido de um arquivo `file`, e `sp`
+            constante ou um valor por célula.
+    """
+
+    type: str
+    params: dict
+    scale: TimeSeries | None = None
+
+
+@dataclass
+class SourceProfile:
+    """
+    Termo fonte constante por trechos.
+
+    Parameters:
+        edges (np.ndarray): Coordenadas das pontas dos trechos, crescentes.
+        sc (np.ndarray): Parte constante do termo fonte em cada trecho.
+        sp (np.ndarray): Coeficiente da parte linear em cada trecho.
+    """
+
+    edges: np.ndarray
+    sc: np.ndarray
+    sp: np.ndarray
+
+    def integrate(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Integra o perfil em cada célula.
+
+        Parameters:
+            x: Coordenadas nodais da malha.
+
+        Returns:
+            Retorna as integrais de `sc` e `sp` em cada célula.
+        """
+
+        edges, last = self.edges, len(self.sc) - 1
+        a, b = x[:-1], x[1:]
+
+        # ... trecho do começo e do fim de cada célula
+        ia = np.clip(np.searchsorted(edges, a, side="right") - 1, 0, last)
+        ib = np.clip(np.searchsorted(edges, b, side="left") - 1, 0, last)
+        same = ia == ib
+
+        def integral(q: np.ndarray) -> np.ndarray:
+            cumulative = np.concatenate(([0.0], np.cumsum(q * np.diff(edges))))
+            split = q[ia] * (edges[ia + 1] - a) + (cumulative[ib] - cumulative[ia + 1]) + q[ib] * (b - edges[ib])
+            return np.asarray(np.where(same, q[ia] * (b - a), split))
+
+        return integral(self.sc), integral(self.sp)
+
+
+@dataclass
+class SourceTerms:
+    """
+    Termo fonte integrado em cada célula.
+
+    Parameters:
+        sc (np.ndarray): Integral da parte constante em cada célula.
+        sp (np.ndarray): Integral do coeficiente da parte linear em cada célula.
+        scale (float | np.ndarray | TimeSeries): Fator de escala atual ou a sua série temporal.
+
+    Info:
+        Em um ensemble `sc` e `sp` têm a forma `(n_batch, n_cells)` e o fator de escala a forma `(n_batch,)`.
+    """
+
+    sc: np.ndarray
+    sp: np.ndarray
+    scale: float | np.ndarray | TimeSeries = 1.0
+
+
+def _per_cell(value: float | list | np.ndarray, n_cells: int, name: str) -> np.ndarray:
+    values = np.broadcast_to(np.asarray(value, dtype=float), (n_cells,)) if np.ndim(value) == 0 else np.asarray(value)
+    if values.shape != (n_cells,):
+        raise SourceError(f"O termo fonte 'cells' precisa de {n_cells} valores em '{name}', foram dados {values.size}.")
+    return values.astype(float)
+
+
+def _linear_coefs(type_: str, params: dict, length: float, n_cells: int) -> list[float]:
+    """Valida os parametros de cada tipo de termo fonte e retorna os coeficientes `sp` dados."""
+
+    if type_ == "uniform":
+        if "value" not in params:
+            raise SourceError("O termo fonte 'uniform' precisa de 'value'.")
+        return [params.get("sp", 0.0)]
+
+    if type_ == "regions":
+        for i, region in enumerate(params.get("regions", [])):
+            if not {"start", "end", "value"} <= region.keys():
+                raise SourceError(f"A região {i} do termo fonte precisa de 'start', 'end' e 'value'.")
+            if not 0.0 <= region["start"] < region["end"] <= length:
+                raise SourceError(f"A região {i} do termo fonte deve ter 0 <= start < end <= {length}.")
+        return [region.get("sp", 0.0) for region in params.get("regions", [])]
+
+    if "values" not in params and "file" not in params:
+        raise SourceError("O termo fonte 'cells' precisa de 'values' ou 'file'.")
+    if "values" in params:
+        _per_cell(params["values"], n_cells, "values")
+    return list(_per_cell(params.get("sp", 0.0), n_cells, "sp"))
+
+
+def check_source(spec: dict, length: float, n_cells: int) -> None:
+    """
+    Valida o termo fonte do arquivo de entrada. Os arquivos não são lidos.
+
+    Parameters:
+        spec: Termo fonte no formato `{"type": ..., "params": ..., "scale": ...}`.
+        length: Dimensão do domínio.
+        n_cells: Número de células da malha inicial.
+
+    Raises:
+        SourceError: Termo fonte inválido.
+        BoundarySeriesError: Série temporal do fator de escala inválida.
+    """
+
+    if not {"type", "params"} <= spec.keys():
+        raise SourceError("O termo fonte precisa de 'type' e 'params'.")
+
+    if (type_ := spec["type"]) not in SOURCE_TYPES:
+        raise SourceError(f"O tipo '{type_}' do termo fonte não existe.")
+
+    if any(value > 0.0 for value in _linear_coefs(type_, spec["params"], length, n_cells)):
+        raise SourceError("O coeficiente 'sp' do termo fonte linearizado deve ser menor ou igual a zero.")
+
+    if (scale := spec.get("scale")) is not None:
+        if "file" not in scale:
+            time_series(scale)
+        elif (kind := scale.get("kind", "linear")) not in SERIES_KINDS:
+            raise BoundarySeriesError(f"A interpolação '{kind}' da série temporal não existe.")
+
+
+def _read_values(path: Path) -> np.ndarray:
+    """Lê um valor por célula de um arquivo `.npy` ou de uma coluna de um `.csv`, ignorando as linhas não numéricas."""
+
+    if not path.exists():
+        raise SourceError(f"O arquivo do termo fonte não foi achado: {path}.")
+
+    if path.suffix == ".npy":
+        return np.asarray(np.load(path), dtype=float).ravel()
+
+    values = np.genfromtxt(path, delimiter=",").ravel()
+    return np.asarray(values[~np.isnan(values)])
+
+
+def load_source(spec: dict, length: float, n_cells: int, base_dir: Path | None = None) -> Source:
+    """
+    Lê o termo fonte do arquivo de entrada.
+
+    Parameters:
+        spec: Termo fonte no formato `{"type": ..., "params": ..., "scale": ...}`.
+        length: Dimensão do domínio.
+        n_cells: Número de células da malha inicial.
+        base_dir: Diretorio dos arquivos com caminho relativo.
+
+    Raises:
+        SourceError: Termo fonte inválido.
+        BoundarySeriesError: Série temporal do fator de escala inválida.
+
+    Returns:
+        Retorna o termo fonte.
+    """
+
+    check_source(spec, length, n_cells)
+
+    params = dict(spec["params"])
+    if "file" in params:
+        path = Path(params.pop("file"))
+        if base_dir is not None and not path.is_absolute():
+            path = base_dir / path
+        params["values"] = _per_cell(_read_values(path), n_cells, "file")
+
+    scale = time_series(spec["scale"], base_dir) if "scale" in spec else None
+
+    return Source(type=spec["type"], params=params, scale=scale)
+
+
+def source_profile(source: Source, x: np.ndarray) -> SourceProfile:
+    """
+    Monta o perfil constante por trechos do termo fonte.
+
+    Parameters:
+        source: Termo fonte.
+        x: Coordenadas nodais da malha inicial, usadas pelo tipo `cells`.
+
+    Returns:
+        Retorna o perfil do termo fonte.
+    """
+
+    params, n_cells = source.params, len(x) - 1
+
+    if source.type == "uniform":
+        edges = np.array([x[0], x[-1]])
+        return SourceProfile(edges, np.array([float(params["value"])]), np.array([float(params.get("sp", 0.0))]))
+
+    if source.type == "cells":
+        sc = _per_cell(params["values"], n_cells, "values")
+        return SourceProfile(np.asarray(x, dtype=float), sc, _per_cell(params.get("sp", 0.0), n_cells, "sp"))
+
+    regions = params.get("regions", [])
+    edges = np.unique(np.concatenate(([x[0], x[-1]], [r["start"] for r in regions], [r["end"] for r in regions])))
+    mid = 0.5 * (edges[:-1] + edges[1:])
+    sc, sp = np.zeros_like(mid), np.zeros_like(mid)
+    for region in regions:
+        inside = (mid > region["start"]) & (mid < region["end"])
+        sc[inside] += region["value"]
+        sp[inside] += region.get("sp", 0.0)
+
+    return SourceProfile(edges, sc, sp)
+
+
+def source_terms(source: Source, x: np.ndarray) -> SourceTerms:
+    """
+    Integra o termo fonte nas células da malha.
+
+    Parameters:
+        source: Termo fonte.
+        x: Coordenadas nodais da malha inicial.
+
+    Returns:
+        Retorna o termo fonte de cada célula.
+    """
+
+    sc, sp = source_profile(source, x).integrate(x)
+
+    return SourceTerms(sc=sc, sp=sp, scale=source.scale if source.scale is not None else 1.0)
@@ -0,0 +1,79 @@
+"""Módulo do regime permanente."""
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from pyheat1d.errors import SteadySingularError
+
+ANALYSIS_TYPES = ("transient", "steady", "eigen")
+
+STEADY_NORMS: dict[str, Callable[[np.ndarray], float]] = {
+    "inf": lambda du: float(np.max(np.abs(du))),
+    "l2": lambda du: float(np.sqrt(np.mean(du * du))),
+    "l1": lambda du: float(np.mean(np.abs(du))),
+}
+
+
+@dataclass
+class SteadyCriterion:
+    """
+    Critério de parada do loop temporal quando o campo não muda mais entre
+    os passos de tempo.
+
+    Info:
+        Normas disponiveis, as normas `l2` e `l1` são médias para não dependerem do número de células:
+
+        * `inf` - Maior variação absoluta.
+        * `l2` - Raiz da média dos quadrados das variações.
+        * `l1` - Média das variações absolutas.
+
+    Parameters:
+        tol (float): Tolerância da variação entre dois passos.
+        norm (str): Norma da variação.
+        check_every (int): Verifica o critério a cada `N` passos.
+    """
+
+    tol: float
+    norm: str = "inf"
+    check_every: int = 1
+
+    def must_check(self, step: int) -> bool:
+        """
+        Verifica se o critério deve ser avaliado no passo.
+
+        Parameters:
+            step: Passo de tempo.
+        """
+        return step % self.check_every == 0
+
+    def residual(self, u: np.ndarray, u_prev: np.ndarray) -> float:
+        """
+        Calcula a variação entre dois passos.
+
+        Parameters:
+            u: Campo no passo atual.
+            u_prev: Campo no passo anterior.
+
+        Returns:
+            Retorna a norma da variação.
+        """
+        return STEADY_NORMS[self.norm](u - u_prev)
+
+
+def check_steady_bcs(lbc_type: int, rbc_type: int) -> None:
+    """
+    Verifica se o regime permanente tem solução única. Com fluxo prescrito nos
+    dois contornos a temperatura é definida a menos de uma constante e a matriz é singular.
+
+    Parameters:
+        lbc_type: Tipo da condição de contorno a esquerda.
+        rbc_type: Tipo da condição de contorno a direita.
+
+    Raises:
+        SteadySingularError: Fluxo prescrito nos dois contornos.
+    """
+
+    if lbc_type == 2 and rbc_type == 2:
+        raise SteadySingularError()
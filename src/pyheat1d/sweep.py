@@ -0,0 +1,192 @@
+"""Módulo da varredura de parametros."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import fields
+from itertools import product
+from pathlib import Path
+
+from pyheat1d.controllers import run
+from pyheat1d.errors import InputFileNotFoundError, Pyheat1ErrorsBase, SweepAxisError
+from pyheat1d.input_files import Input
+from pyheat1d.simulation_times import run_times
+
+INPUT_KEYS = {field.name for field in fields(Input)}
+
+
+def parse_axis(axis: str) -> tuple[str, list]:
+    """
+    Le um eixo da varredura no formato `chave=v1,v2,...`. A chave pode ser
+    aninhada com `.`, por exemplo `prop.k=1.0,2.0` ou `rbc.params.h=1.0,5.0`.
+
+    Parameters:
+        axis: Eixo da varredura.
+
+    Raises:
+        SweepAxisError: Eixo da varredura inválido.
+
+    Returns:
+        Retorna a chave e os valores do eixo.
+    """
+
+    key, sep, values = axis.partition("=")
+    key = key.strip()
+
+    if not sep or not key or not values.strip():
+        raise SweepAxisError(axis)
+
+    try:
+        return key, [json.loads(v) for v in values.split(",")]
+    except json.JSONDecodeError as e:
+        raise SweepAxisError(axis) from e
+
+
+def _set_value(infos: dict, key: str, value) -> None:
+    """
+    Altera o valor de uma chave aninhada com `.`. As chaves opcionais do
+    primeiro nível, como `theta`, podem não estar no arquivo de entrada base.
+
+    Parameters:
+        infos: Informações do arquivo de entrada.
+        key: Chave aninhada.
+        value: Novo valor.
+
+    Raises:
+        SweepAxisError: Chave não existe no arquivo de entrada.
+    """
+
+    *parents, leaf = key.split(".")
+
+    node = infos
+    for parent in parents:
+        child = node.get(parent)
+        if not isinstance(child, dict):
+            raise SweepAxisError(key)
+        node = child
+
+    if leaf not in node and (parents or leaf not in INPUT_KEYS):
+        raise SweepAxisError(key)
+
+    node[leaf] = value
+
+
+def expand_grid(base: dict, axes: list[tuple[str, list]]) -> list[tuple[dict, dict]]:
+    """
+    Gera todas as combinações dos eixos da varredura.
+
+    Parameters:
+        base: Informações do arquivo de entrada base.
+        axes: Eixos da varredura.
+
+    Raises:
+        SweepAxisError: Chave não existe no arquivo de entrada.
+
+    Returns:
+        Retorna a lista com os parametros e as informações de entrada de cada caso.
+    """
+
+    keys = [key for key, _ in axes]
+
+    cases = []
+    for values in product(*(values for _, values in axes)):
+        params = dict(zip(keys, values))
+        infos = deepcopy(base)
+        for key, value in params.items():
+            _set_value(infos, key, value)
+        cases.append((params, infos))
+
+    return cases
+
+
+def _absolute_series_files(infos: dict, base_dir: Path) -> None:
+    """
+    Troca os caminhos relativos dos arquivos das séries temporais das condições
+    de contorno e do termo fonte por caminhos absolutos, já que cada caso roda no
+    seu proprio diretorio.
+
+    Parameters:
+        infos: Informações do arquivo de entrada.
+        base_dir: Diretorio do arquivo de entrada base.
+    """
+
+    specs = [spec for bc in ("lbc", "rbc") for spec in infos.get(bc, {}).get("params", {}).values()]
+    if (source := infos.get("source")) is not None:
+        specs += [source.get("params"), source.get("scale")]
+
+    for spec in specs:
+        if isinstance(spec, dict) and "file" in spec:
+            spec["file"] = str((base_dir / spec["file"]).absolute())
+
+
+def _run_case(input_file: Path) -> dict:
+    """
+    Roda um caso da varredura em um processo do pool. Qualquer erro fica no
+    resumo do caso, assim um caso inválido não interrompe a varredura.
+
+    Parameters:
+        input_file: Caminho do arquivo de entrada do caso.
+
+    Returns:
+        Retorna a situação e o tempo da simulação.
+    """
+
+    try:
+        run(input_file=input_file)
+    except Pyheat1ErrorsBase as e:
+        return {"status": "error", "error": str(e)}
+    except Exception as e:
+        return {"status": "error", "error": repr(e)}
+
+    return {"status": "ok", "edp": run_times.edp}
+
+
+def run_sweep(base_file: Path, axes: list[str], output_dir: Path, workers: int | None = None) -> list[dict]:
+    """
+    Controlador da varredura. Cada caso é escrito em `output_dir/case_NNNN/input.json`
+    e roda no seu proprio diretorio, como o comando `run`. Um resumo é escrito em
+    `output_dir/sweep.json`.
+
+    Parameters:
+        base_file: Caminho do arquivo de entrada base.
+        axes: Eixos da varredura no formato `chave=v1,v2,...`.
+        output_dir: Diretorio de saida.
+        workers: Número de processos. O padrão é o número de CPUs.
+
+    Raises:
+        InputFileNotFoundError: Arquivo de entrada base não achado.
+        SweepAxisError: Eixo da varredura inválido.
+
+    Returns:
+        Retorna o resumo da varredura.
+    """
+
+    try:
+        with open(base_file, encoding="utf-8") as fp:
+            base = json.load(fp)
+    except FileNotFoundError as e:
+        raise InputFileNotFoundError(f"O arquivo de entrada não foi achado: {base_file}.") from e
+
+    _absolute_series_files(base, base_file.parent)
+
+    cases = expand_grid(base, [parse_axis(axis) for axis in axes])
+
+    input_files = []
+    summary = []
+    for i, (params, infos) in enumerate(cases):
+        case_dir = output_dir / f"case_{i:04d}"
+        case_dir.mkdir(parents=True, exist_ok=True)
+        input_file = case_dir / "input.json"
+        with open(input_file, mode="w", encoding="utf-8") as fp:
+            json.dump(infos, fp, indent=4)
+        input_files.append(input_file)
+        summary.append({"case": case_dir.name, "params": params})
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for case, status in zip(summary, executor.map(_run_case, input_files)):
+            case.update(status)
+
+    with open(output_dir / "sweep.json", mode="w", encoding="utf-8") as fp:
+        json.dump(summary, fp, indent=4)
+
+    return summary
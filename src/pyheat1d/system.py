@@ -7,6 +7,7 @@ class System:
 
     Parameters:
         neq (int): Numero de equações.
+        nbatch (int | None): Numero de sistemas independentes resolvidos juntos.
         a (ndarray): Matriz de coeficientes.
         b (ndarray): Vetor de forças.
 
@@ -16,18 +17,25 @@ class System:
         * a[:,0] - diagonal inferior
         * a[:,1] - diagonal princial
         * a[:,2] - diagonal princial
+
+        Com `nbatch` os arrays ganham um eixo inicial, `a` tem a forma
+        `(nbatch, neq, 3)` e `b` a forma `(nbatch, neq)`.
     """
 
     neq: int
+    nbatch: int | None
     a: np.ndarray
     b: np.ndarray
 
-    def __init__(self, neq: int) -> None:
+    def __init__(self, neq: int, nbatch: int | None = None) -> None:
         """
         Parameters:
             neq (int): Numero de equações.
+            nbatch (int | None): Numero de sistemas independentes.
         """
 
         self.neq = neq
-        self.a = np.zeros((self.neq, 3), dtype=float)
-        self.b = np.zeros(self.neq, dtype=float)
+        self.nbatch = nbatch
+        shape = (neq,) if nbatch is None else (nbatch, neq)
+        self.a = np.zeros((*shape, 3), dtype=float)
+        self.b = np.zeros(shape, dtype=float)
@@ -0,0 +1,137 @@
+"""
+Módulo das séries temporais dos parametros das condições de contorno e do
+fator de escala do termo fonte. Uma série é uma tabela de tempos e valores,
+escrita no arquivo de entrada ou lida de um arquivo `.csv` ou `.npy`. Com o
+passo de tempo fixo as séries são avaliadas uma única vez em todos os tempos
+dos passos antes do loop temporal, que apenas indexa as tabelas.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from pyheat1d.errors import BoundarySeriesError
+
+SERIES_KINDS = ("linear", "step")
+
+
+@dataclass
+class TimeSeries:
+    """
+    Parametro de uma condição de contorno que depende do tempo.
+
+    Parameters:
+        t (np.ndarray): Tempos da tabela, crescentes.
+        values (np.ndarray): Valores em cada tempo, com a forma `(tempos,)` ou
+            `(tempos, n_batch)` em um ensemble.
+        kind (str): Interpolação entre os tempos da tabela.
+
+    Info:
+        Interpolações disponiveis, fora da tabela os valores das pontas são usados:
+
+        * `linear` - Interpolação linear.
+        * `step` - Valor constante até o próximo tempo da tabela.
+    """
+
+    t: np.ndarray
+    values: np.ndarray
+    kind: str = "linear"
+
+    def __call__(self, t: np.ndarray | float) -> np.ndarray:
+        """
+        Avalia a série em muitos tempos de uma vez.
+
+        Parameters:
+            t: Tempos.
+
+        Returns:
+            Retorna os valores com a forma `t.shape + values.shape[1:]`.
+        """
+
+        t = np.asarray(t, dtype=float)
+        last = len(self.t) - 1
+
+        i = np.clip(np.searchsorted(self.t, t, side="right") - 1, 0, last)
+        if self.kind == "step":
+            return np.asarray(self.values[i])
+
+        j = np.minimum(i + 1, last)
+        span = np.where(j > i, self.t[j] - self.t[i], 1.0)
+        w = np.clip((t - self.t[i]) / span, 0.0, 1.0)
+        w = w.reshape(w.shape + (1,) * (self.values.ndim - 1))
+
+        return np.asarray(self.values[i] + w * (self.values[j] - self.values[i]))
+
+
+def _read_table(path: Path) -> np.ndarray:
+    """Lê a tabela `(tempos, 2)` de um arquivo `.npy` ou `.csv`. As linhas não numéricas do `.csv` são ignoradas."""
+
+    if not path.exists():
+        raise BoundarySeriesError(f"O arquivo da série temporal não foi achado: {path}.")
+
+    if path.suffix == ".npy":
+        return np.asarray(np.load(path), dtype=float)
+
+    table = np.genfromtxt(path, delimiter=",", ndmin=2)
+    return np.asarray(table[~np.isnan(table).any(axis=1)])
+
+
+def time_series(spec: dict, base_dir: Path | None = None) -> TimeSeries:
+    """
+    Lê a série temporal de um parametro de condição de contorno.
+
+    Parameters:
+        spec: Série no formato `{"t": [...], "values": [...]}` ou `{"file": "serie.csv"}`,
+            com a chave opcional `kind`.
+        base_dir: Diretorio dos arquivos com caminho relativo.
+
+    Raises:
+        BoundarySeriesError: Série temporal inválida.
+
+    Returns:
+        Retorna a série temporal.
+    """
+
+    if (kind := spec.get("kind", "linear")) not in SERIES_KINDS:
+        raise BoundarySeriesError(f"A interpolação '{kind}' da série temporal não existe.")
+
+    if "file" in spec:
+        path = Path(spec["file"])
+        if base_dir is not None and not path.is_absolute():
+            path = base_dir / path
+        table = _read_table(path)
+        if table.ndim != 2 or table.shape[1] != 2:
+            raise BoundarySeriesError(f"O arquivo da série temporal precisa de duas colunas, tempo e valor: {path}.")
+        t, values = table[:, 0], table[:, 1]
+    elif {"t", "values"} <= spec.keys():
+        t, values = np.asarray(spec["t"], dtype=float), np.asarray(spec["values"], dtype=float)
+    else:
+        raise BoundarySeriesError("A série temporal precisa de 'file' ou de 't' e 'values'.")
+
+    if t.ndim != 1 or t.shape != values.shape or t.size == 0 or np.any(np.diff(t) <= 0.0):
+        raise BoundarySeriesError("A série temporal precisa de tempos crescentes e um valor por tempo.")
+
+    return TimeSeries(t=t.astype(float), values=values.astype(float), kind=kind)
+
+
+def batch_time_series(values: list[float | TimeSeries]) -> TimeSeries:
+    """
+    Junta o parametro de cada membro do ensemble em uma única série. A tabela
+    conjunta usa todos os tempos das séries dos membros, então a interpolação
+    de cada membro não muda. Os parametros constantes viram séries constantes.
+
+    Parameters:
+        values: Valor constante ou série de cada membro, todas as séries com a mesma interpolação.
+
+    Returns:
+        Retorna a série com os valores na forma `(tempos, n_batch)`.
+    """
+
+    series = [value for value in values if isinstance(value, TimeSeries)]
+    kind = series[0].kind
+
+    t = np.unique(np.concatenate([s.t for s in series]))
+    columns = [value(t) if isinstance(value, TimeSeries) else np.full(t.shape, float(value)) for value in values]
+
+    return TimeSeries(t=t, values=np.stack(columns, axis=-1), kind=kind)
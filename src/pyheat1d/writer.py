@@ -1,9 +1,16 @@
 import json
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
+from threading import Thread
 
 import numpy as np
 
+from pyheat1d.chunked import CHUNKS_FILE, INDEX_FILE, encode_chunk
+from pyheat1d.errors import ResultsFormatNotFoundError
 from pyheat1d.jsonencoder import JSONEncoderNumpy
 
 
@@ -31,6 +38,21 @@ class WriterBase(ABC):
     def append_in_buffer(self):
         ...
 
+    def must_write(self, istep: int) -> bool:
+        """
+        Verifica se o passo deve ser guardado.
+
+        Parameters:
+            istep: passo de tempo
+        """
+        return True
+
+    def _append_in_buffer(self, istep: int, t: float, u: np.ndarray, x: np.ndarray | None = None) -> None:
+        dict_ = {"istep": istep, "t": t, "u": u.copy()}
+        if x is not None:
+            dict_["x"] = x.copy()
+        self.buffer.append(dict_)
+
     def dump(self) -> None:
         """Tranfere os resultados do buffer para a memória para o arquivo."""
         json.dump(self.buffer, self.fp, cls=JSONEncoderNumpy, indent=self.indent)
@@ -38,7 +60,9 @@ class WriterBase(ABC):
 
 
 class ResultsWriterEveryTime(WriterBase):
-    def append_in_buffer(self, istep: int, t: float, u: np.ndarray) -> None:  # type: ignore
+    def append_in_buffer(  # type: ignore
+        self, istep: int, t: float, u: np.ndarray, force: bool = False, x: np.ndarray | None = None
+    ) -> None:
         """
         Guarda os resultados no buffer em memória.
 
@@ -46,10 +70,11 @@ class ResultsWriterEveryTime(WriterBase):
             istep: passo de tempo
             t: tempo
             u: valor do campo
+            force: Guarda o passo mesmo fora do intervalo de escrita.
+            x: Coordenadas nodais da malha adaptativa do passo.
         """
 
-        dict_ = {"istep": istep, "t": t, "u": u.copy()}
-        self.buffer.append(dict_)
+        self._append_in_buffer(istep, t, u, x)
 
 
 class ResultsWriterEveryNSteps(WriterBase):
@@ -64,7 +89,9 @@ class ResultsWriterEveryNSteps(WriterBase):
         self.writer_count = 1
         self.write_every_steps = write_every_steps
 
-    def append_in_buffer(self, istep: int, t: float, u: np.ndarray) -> None:  # type: ignore
+    def append_in_buffer(  # type: ignore
+        self, istep: int, t: float, u: np.ndarray, force: bool = False, x: np.ndarray | None = None
+    ) -> None:
         """
         Guarda os resultados no buffer acada n passos.
 
@@ -72,26 +99,394 @@ class ResultsWriterEveryNSteps(WriterBase):
             istep: passo de tempo
             t: tempo
             u: valor do campo
+            force: Guarda o passo mesmo fora do intervalo de escrita, como o último passo.
+            x: Coordenadas nodais da malha adaptativa do passo.
+        """
+
+        if self.must_write(istep) or force:
+            self._append_in_buffer(istep, t, u, x)
+
+    def must_write(self, istep: int) -> bool:
+        """
+        Verifica se o passo deve ser guardado. Deve ser chamado uma vez por passo.
+
+        Parameters:
+            istep: passo de tempo
         """
 
         if istep == 0:
-            self._append_in_buffer(istep, t, u)
-            return
+            return True
 
-        if not self.write_every_steps or self.writer_count == self.write_every_steps:
-            self._append_in_buffer(istep, t, u)
+        write = not self.write_every_steps or self.writer_count == self.write_every_steps
+        if write:
             self.writer_count = 0
 
         self.writer_count += 1
 
-    def _append_in_buffer(self, istep: int, t: float, u: np.ndarray) -> None:
-        dict_ = {"istep": istep, "t": t, "u": u.copy()}
-        self.buffer.append(dict_)
+        return write
+
+
+class ResultsWriterJsonLines(ResultsWriterEveryNSteps):
+    """
+    Escreve cada passo guardado como uma linha json assim que ele é produzido.
+    A memória usada não depende do número de passos e o arquivo parcial
+    sobrevive a uma interrupção da simulação.
+    """
+
+    def __init__(self, path: Path, write_every_steps: int | None = None) -> None:
+        """
+        Parameters:
+            path: Caminho do arquivo.
+            write_every_steps: Escrever a cada n passos.
+        """
+        super().__init__(path, None, write_every_steps)
+
+    def _append_in_buffer(self, istep: int, t: float, u: np.ndarray, x: np.ndarray | None = None) -> None:
+        dict_ = {"istep": istep, "t": t, "u": u.tolist()}
+        if x is not None:
+            dict_["x"] = x.tolist()
+        line = json.dumps(dict_)
+        self.fp.write(line + "\n")
+        self.fp.flush()
+
+    def dump(self) -> None:
+        """Os passos já foram escritos, apenas garante que tudo chegou ao arquivo."""
+        self.fp.flush()
+
+
+STEPS_DTYPE = np.dtype([("istep", "i8"), ("t", "f8")])
+
+
+def retained_steps(nstep: int, write_every_steps: int | None = None) -> int:
+    """
+    Calcula o número de passos guardados, incluindo a condição inicial.
+
+    Parameters:
+        nstep: Número de passos.
+        write_every_steps: Escrever a cada n passos.
+
+    Returns:
+        Retorna o número de passos guardados.
+    """
+
+    if not write_every_steps:
+        return nstep + 1
+
+    return nstep // write_every_steps + 1
+
+
+class ResultsWriterNpy(ResultsWriterEveryNSteps):
+    """
+    Escreve o histórico do campo em um array 2D `(passos guardados, células)`
+    mapeado em memória no arquivo `.npy`. O número de passos guardados é
+    calculado antes do loop temporal, assim cada passo é escrito diretamente
+    na sua linha do arquivo. O `istep` e o `t` de cada linha ficam no arquivo
+    `results_steps.npy`, linhas não escritas têm `istep = -1`.
+
+    Info:
+        Os arquivos podem ser lidos sem cópia com `np.load(path, mmap_mode="r")`.
+    """
+
+    def __init__(self, path: Path, nstep: int, write_every_steps: int | None = None) -> None:
+        """
+        Parameters:
+            path: Caminho do arquivo.
+            nstep: Número de passos.
+            write_every_steps: Escrever a cada n passos.
+        """
+        super().__init__(Path(path), None, write_every_steps)
+        self.steps_path = self.path.parent / "results_steps.npy"
+        self.nretained = retained_steps(nstep, write_every_steps)
+        self.irow = 0
+        self.u: np.ndarray | None = None
+        self.steps: np.ndarray | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.dump()
+        self.u = self.steps = None
+
+    def _open_memmap(self, n_cells: int, suffix: str = "") -> None:
+        """Cria os arquivos com o tamanho final do histórico."""
+        steps_path = self.steps_path.with_suffix(suffix + ".npy")
+        steps = np.lib.format.open_memmap(steps_path, mode="w+", dtype=STEPS_DTYPE, shape=(self.nretained,))
+        steps["istep"] = -1
+        steps["t"] = np.nan
+        self.steps = steps
+        u_path = self.path.with_suffix(suffix + ".npy")
+        self.u = np.lib.format.open_memmap(u_path, mode="w+", dtype=np.float64, shape=(self.nretained, n_cells))
+
+    def _grow(self) -> None:
+        """
+        Dobra o número de linhas dos arquivos. Só acontece quando o número de
+        passos não é conhecido antes do loop temporal, como no passo de tempo adaptativo.
+        """
+        u, steps = self.u, self.steps
+        self.nretained *= 2
+        self._open_memmap(u.shape[1], suffix=".grow")  # type: ignore
+        self.u[: len(u)] = u  # type: ignore
+        self.steps[: len(steps)] = steps  # type: ignore
+        self.dump()
+
+        # ... no Windows um arquivo mapeado não pode ser substituído, todos os mapas são fechados antes da troca
+        self.u = self.steps = None
+        del u, steps
+        os.replace(self.path.with_suffix(".grow.npy"), self.path)
+        os.replace(self.steps_path.with_suffix(".grow.npy"), self.steps_path)
+
+        self.u = np.load(self.path, mmap_mode="r+")
+        self.steps = np.load(self.steps_path, mmap_mode="r+")
+
+    def _append_in_buffer(self, istep: int, t: float, u: np.ndarray, x: np.ndarray | None = None) -> None:
+        # ... o array tem um número fixo de células, a malha adaptativa não é aceita
+        if self.u is None:
+            self._open_memmap(u.shape[-1])
+        elif self.irow == self.nretained:
+            self._grow()
+        self.u[self.irow] = u  # type: ignore
+        self.steps[self.irow] = (istep, t)  # type: ignore
+        self.irow += 1
+
+    def dump(self) -> None:
+        """Os passos já foram escritos, apenas garante que tudo chegou ao arquivo."""
+        if self.u is not None:
+            self.u.flush()  # type: ignore
+            self.steps.flush()  # type: ignore
+
+
+class ResultsWriterChunked(ResultsWriterEveryNSteps):
+    """
+    Escreve o histórico do campo em blocos 2D `(chunk_steps, chunk_cells)`
+    comprimidos. Os passos guardados são acumulados em um buffer de
+    `chunk_steps` linhas e, quando ele enche, os blocos são comprimidos em um
+    pool de threads enquanto a simulação continua. A posição de cada bloco no
+    arquivo fica em `results_index.json`, escrito no `dump`.
+
+    Info:
+        O `zlib` libera o GIL durante a compressão, por isso as threads do pool
+        comprimem em paralelo com o loop temporal.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        write_every_steps: int | None = None,
+        chunk_steps: int = 64,
+        chunk_cells: int = 4096,
+        tolerance: float | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            path: Caminho do arquivo.
+            write_every_steps: Escrever a cada n passos.
+            chunk_steps: Número de passos guardados em cada bloco.
+            chunk_cells: Número de células em cada bloco.
+            tolerance: Erro absoluto máximo da quantização. Sem quantização quando `None`.
+            workers: Número de threads da compressão.
+        """
+        super().__init__(Path(path), None, write_every_steps)
+        self.index_path = self.path.parent / INDEX_FILE
+        self.chunk_steps = chunk_steps
+        self.chunk_cells = chunk_cells
+        self.tolerance = tolerance
+        # ... número máximo de blocos esperando a compressão
+        self.max_pending = 4 * (workers or os.cpu_count() or 1)
+        self.rows: np.ndarray | None = None
+        self.nrows = 0
+        self.row = 0
+        self.istep: list[int] = []
+        self.t: list[float] = []
+        self.chunks: list[dict] = []
+        self.pending: deque[tuple[dict, Future]] = deque()
+
+    def __enter__(self):
+        self.fp = open(self.path, mode="wb")
+        self.executor = ThreadPoolExecutor(max_workers=self.max_pending // 4)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+        self.fp.close()
+
+    def _append_in_buffer(self, istep: int, t: float, u: np.ndarray, x: np.ndarray | None = None) -> None:
+        # ... os blocos têm um número fixo de células, a malha adaptativa não é aceita
+        if self.rows is None:
+            self.rows = np.empty((self.chunk_steps, u.shape[-1]))
+        self.rows[self.nrows] = u
+        self.nrows += 1
+        self.istep.append(istep)
+        self.t.append(t)
+
+        if self.nrows == self.chunk_steps:
+            self._submit()
+
+    def _submit(self) -> None:
+        """Envia os blocos do buffer para o pool e escreve os blocos já comprimidos."""
+
+        if self.rows is None or self.nrows == 0:
+            return
+
+        rows = self.rows[: self.nrows].copy()
+        for col in range(0, rows.shape[1], self.chunk_cells):
+            block = rows[:, col : col + self.chunk_cells]
+            entry = {"row": self.row, "col": col, "nrows": block.shape[0], "ncols": block.shape[1]}
+            self.pending.append((entry, self.executor.submit(encode_chunk, block, self.tolerance)))
+
+        self.row += self.nrows
+        self.nrows = 0
+
+        # ... limita a memória dos blocos esperando a compressão
+        while self.pending and (self.pending[0][1].done() or len(self.pending) > self.max_pending):
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        """Escreve o bloco mais antigo da fila, na ordem em que foi enviado."""
+
+        entry, future = self.pending.popleft()
+        raw, dtype, base = future.result()
+        entry.update(offset=self.fp.tell(), nbytes=len(raw), dtype=dtype, base=base)
+        self.fp.write(raw)
+        self.chunks.append(entry)
+
+    def dump(self) -> None:
+        """Comprime o bloco parcial, espera os blocos pendentes e escreve o índice."""
+
+        self._submit()
+        while self.pending:
+            self._write_chunk()
+        self.fp.flush()
+
+        n_cells = 0 if self.rows is None else self.rows.shape[1]
+        index = {
+            "n_cells": n_cells,
+            "chunk_steps": self.chunk_steps,
+            "chunk_cells": self.chunk_cells,
+            "tolerance": self.tolerance,
+            "istep": self.istep,
+            "t": self.t,
+            "chunks": self.chunks,
+        }
+        with open(self.index_path, mode="w", encoding="utf8") as fp:
+            json.dump(index, fp, indent=self.indent)
+
+
+class AsyncResultsWriter:
+    """
+    Escreve os resultados em uma thread em segundo plano. O loop temporal
+    apenas copia o campo para um slot pré-alocado e a serialização e a escrita
+    em disco acontecem em paralelo com os próximos passos. Quando todos os
+    slots estão ocupados o loop temporal espera a thread liberar um slot.
+
+    Info:
+        Apenas os escritores que escrevem cada passo no `_append_in_buffer`
+        (`jsonl`, `npy` e `chunked`) sobrepõem a escrita com o loop temporal.
+        O formato `json` serializa todos os passos no `dump`, então é recusado
+        na validação do arquivo de entrada.
+    """
+
+    def __init__(
+        self,
+        writer: ResultsWriterEveryTime | ResultsWriterEveryNSteps,
+        queue_size: int = 8,
+    ) -> None:
+        """
+        Parameters:
+            writer: Escritor dos resultados usado pela thread.
+            queue_size: Número de slots da fila.
+        """
+        self.writer = writer
+        self.queue_size = queue_size
+        self.slots: np.ndarray | None = None
+        self.error: BaseException | None = None
+        self.free: Queue[int] = Queue()
+        self.pending: Queue[tuple[int, float, int] | None] = Queue()
+
+    def __enter__(self):
+        self.writer.__enter__()
+        self.thread = Thread(target=self._drain, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.pending.put(None)
+        self.thread.join()
+        self.writer.__exit__(exc_type, exc_value, exc_traceback)
+        if exc_type is None:
+            self._raise_error()
+
+    def _drain(self) -> None:
+        """Loop da thread que escreve os slots da fila."""
+        while (item := self.pending.get()) is not None:
+            istep, t, slot = item
+            try:
+                if self.error is None:
+                    self.writer._append_in_buffer(istep, t, self.slots[slot])  # type: ignore
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.free.put(slot)
+                self.pending.task_done()
+        self.pending.task_done()
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def append_in_buffer(self, istep: int, t: float, u: np.ndarray, force: bool = False) -> None:
+        """
+        Copia o campo para um slot livre e o envia para a thread.
+
+        Parameters:
+            istep: passo de tempo
+            t: tempo
+            u: valor do campo
+            force: Guarda o passo mesmo fora do intervalo de escrita.
+        """
+
+        self._raise_error()
+
+        if not self.writer.must_write(istep) and not force:
+            return
+
+        if self.slots is None:
+            self.slots = np.empty((self.queue_size, *u.shape), dtype=u.dtype)
+            for slot in range(self.queue_size):
+                self.free.put(slot)
+
+        slot = self.free.get()
+        self.slots[slot][...] = u
+        self.pending.put((istep, t, slot))
+
+    def dump(self) -> None:
+        """Espera a thread escrever todos os slots e tranfere o buffer para o arquivo."""
+        self.pending.join()
+        self._raise_error()
+        self.writer.dump()
+
+
+RESULTS_FILES = {
+    "json": "results.json",
+    "jsonl": "results.jsonl",
+    "npy": "results.npy",
+    "chunked": CHUNKS_FILE,
+}
 
 
 def results_writer_strategy(
-    path: Path, indent: int | None = None, write_every_steps: int | None = None
-) -> ResultsWriterEveryTime | ResultsWriterEveryNSteps:
+    path: Path,
+    indent: int | None = None,
+    write_every_steps: int | None = None,
+    results_format: str = "json",
+    nstep: int | None = None,
+    chunk_steps: int = 64,
+    chunk_cells: int = 4096,
+    tolerance: float | None = None,
+) -> (
+    ResultsWriterEveryTime | ResultsWriterEveryNSteps | ResultsWriterJsonLines | ResultsWriterNpy | ResultsWriterChunked
+):
     """
     Seleciona a estrategia de escrita dos resuldos.
 
@@ -99,14 +494,77 @@ def results_writer_strategy(
         path: Caminho do arquivo.
         indent: Indentação do json.
         write_every_steps: Escrever a cada n passos.
+        results_format: Formato do arquivo de resultados (`json`, `jsonl`, `npy` ou `chunked`).
+        nstep: Número de passos, necessário para o formato `npy`.
+        chunk_steps: Número de passos guardados em cada bloco do formato `chunked`.
+        chunk_cells: Número de células em cada bloco do formato `chunked`.
+        tolerance: Erro absoluto máximo da quantização do formato `chunked`.
+
+    Raises:
+        ResultsFormatNotFoundError: Formato do arquivo de resultados não existe.
     """
 
+    if results_format not in RESULTS_FILES:
+        raise ResultsFormatNotFoundError(results_format)
+
+    if results_format == "jsonl":
+        return ResultsWriterJsonLines(path, write_every_steps)
+
+    if results_format == "npy":
+        return ResultsWriterNpy(path, nstep or 0, write_every_steps)
+
+    if results_format == "chunked":
+        return ResultsWriterChunked(path, write_every_steps, chunk_steps, chunk_cells, tolerance)
+
     if write_every_steps:
         return ResultsWriterEveryNSteps(path, indent, write_every_steps)
     else:
         return ResultsWriterEveryTime(path, indent)
 
 
+class EnsembleResultsWriter:
+    """
+    Escreve os resultados de cada membro do ensemble no seu próprio arquivo.
+
+    Info:
+        Os arquivos dos membros só são abertos no `dump`, um de cada vez,
+        evitando milhares de arquivos abertos ao mesmo tempo.
+    """
+
+    def __init__(self, writers: list[ResultsWriterEveryTime | ResultsWriterEveryNSteps]) -> None:
+        """
+        Parameters:
+            writers: Escritores de cada membro do ensemble.
+        """
+        self.writers = writers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        pass
+
+    def append_in_buffer(self, istep: int, t: float, u: np.ndarray, force: bool = False) -> None:
+        """
+        Guarda os resultados de cada membro no buffer.
+
+        Parameters:
+            istep: passo de tempo
+            t: tempo
+            u: valor do campo com a forma `(n_batch, n_cells)`
+            force: Guarda o passo mesmo fora do intervalo de escrita.
+        """
+
+        for writer, u_member in zip(self.writers, u):
+            writer.append_in_buffer(istep, t, u_member, force)
+
+    def dump(self) -> None:
+        """Tranfere os resultados do buffer de cada membro para o seu arquivo."""
+        for writer in self.writers:
+            with writer:
+                writer.dump()
+
+
 class MeshWriter:
     def __init__(self, path: Path, indent: int | None = None) -> None:
         """
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from pyheat1d.amr import AMR_INDICATORS, AmrCriterion, AmrTree, regrid
+from pyheat1d.mesh import BoundaryCondition, Mesh
+
+
+def _mesh(u: np.ndarray) -> Mesh:
+    lbc = BoundaryCondition(type=1, params={"value": 10.0})
+    rbc = BoundaryCondition(type=2, params={"value": 0.0})
+    mesh = Mesh(1.0, len(u), lbc, rbc)
+    mesh.mk_grid()
+
+    rng = np.random.default_rng(42)
+    mesh.cells.props.k[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.props.ro[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.props.cp[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.update_cells_results("u", u)
+
+    return mesh
+
+
+def _energy(mesh: Mesh) -> float:
+    props = mesh.cells.props
+    return float(np.sum(props.ro * props.cp * mesh.dx * mesh.cells.results.u))
+
+
+@pytest.mark.unitary
+def test_indicators():
+    u = np.array([0.0, 0.0, 1.0, 3.0, 3.0])
+
+    np.testing.assert_array_equal(AMR_INDICATORS["gradient"](u), [0.0, 1.0, 2.0, 2.0, 0.0])
+    np.testing.assert_array_equal(AMR_INDICATORS["curvature"](u), [1.0, 1.0, 1.0, 2.0, 2.0])
+
+
+@pytest.mark.unitary
+def test_amr_criterion_must_regrid():
+    criterion = AmrCriterion(every=4, refine_tol=1.0, coarsen_tol=0.1)
+
+    assert [step for step in range(1, 13) if criterion.must_regrid(step)] == [4, 8, 12]
+
+
+@pytest.mark.unitary
+def test_amr_tree_siblings():
+    tree = AmrTree(
+        base=np.array([0, 0, 0, 1, 1]),
+        level=np.array([1, 2, 2, 1, 1]),
+        path=np.array([0, 2, 3, 0, 1]),
+    )
+
+    assert [tree.are_siblings(i) for i in range(4)] == [False, True, False, True]
+    assert not AmrTree.from_base(3).are_siblings(0)
+
+
+@pytest.mark.unitary
+def test_regrid_refine_front():
+    mesh = _mesh(np.array([100.0] * 4 + [0.0] * 4))
+    tree = AmrTree.from_base(mesh.n_cells)
+    criterion = AmrCriterion(every=1, refine_tol=1.0, coarsen_tol=0.1, max_level=2)
+
+    for _ in range(3):
+        new_mesh, tree = regrid(mesh, tree, criterion)
+        assert _energy(new_mesh) == pytest.approx(_energy(mesh), rel=1.0e-14)
+        mesh = new_mesh
+
+    # ... apenas as duas células do salto chegam ao nível máximo
+    assert tree.level.max() == 2
+    assert np.all(np.abs(np.diff(tree.level)) <= 1)
+    assert mesh.n_cells == 12
+    assert mesh.nodes.x[-1] == 1.0
+    np.testing.assert_allclose(mesh.dx.sum(), 1.0)
+    np.testing.assert_allclose(np.diff(mesh.cells.centroids), mesh.dxf)
+
+
+@pytest.mark.unitary
+def test_regrid_coarsen_back_to_base():
+    mesh = _mesh(np.array([100.0] * 4 + [0.0] * 4))
+    tree = AmrTree.from_base(mesh.n_cells)
+    criterion = AmrCriterion(every=1, refine_tol=1.0, coarsen_tol=0.1, max_level=2)
+
+    mesh, tree = regrid(mesh, tree, criterion)
+    mesh, tree = regrid(mesh, tree, criterion)
+
+    mesh.update_cells_results("u", 50.0)
+    energy = _energy(mesh)
+
+    mesh, tree = regrid(mesh, tree, criterion)
+    mesh, tree = regrid(mesh, tree, criterion)
+
+    assert mesh.n_cells == 8
+    np.testing.assert_array_equal(tree.level, 0)
+    np.testing.assert_allclose(mesh.cells.results.u, 50.0)
+    assert _energy(mesh) == pytest.approx(energy, rel=1.0e-14)
+
+
+@pytest.mark.unitary
+def test_regrid_coarsen_conservative_props():
+    mesh = _mesh(np.array([0.0, 10.0]))
+    mesh.update_prop("ro", np.array([1.0, 3.0]))
+    mesh.update_prop("cp", np.array([2.0, 1.0]))
+    mesh.update_prop("k", np.array([1.0, 4.0]))
+    tree = AmrTree(base=np.array([0, 0]), level=np.array([1, 1]), path=np.array([0, 1]))
+    criterion = AmrCriterion(every=1, refine_tol=100.0, coarsen_tol=20.0)
+
+    mesh, tree = regrid(mesh, tree, criterion)
+
+    assert mesh.n_cells == 1
+    props = mesh.cells.props
+    assert props.ro[0] == pytest.approx(2.0)
+    assert props.cp[0] == pytest.approx(5.0 / 4.0)
+    assert props.k[0] == pytest.approx(1.0 / (0.5 / 1.0 + 0.5 / 4.0))
+    assert mesh.cells.results.u[0] == pytest.approx(30.0 / 5.0)
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from pyheat1d import animate
+from pyheat1d.animate import _batches, render_frames, write_gif
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "n_rows, n_batches, sizes",
+    [
+        (10, 3, [4, 4, 2]),
+        (2, 8, [1, 1]),
+        (0, 4, []),
+    ],
+)
+def test_batches(n_rows, n_batches, sizes):
+    batches = _batches(list(range(n_rows)), n_batches)
+
+    assert [len(b) for b in batches] == sizes
+    assert [i for b in batches for i in b] == list(range(n_rows))
+
+
+@pytest.mark.integration
+def test_render_frames_and_gif(tmpdir):
+    frames_dir = Path(tmpdir) / "frames"
+
+    frames = render_frames(Path("tests/files/output"), [0, 5, 10], frames_dir, workers=2, max_points=4)
+
+    assert frames == [frames_dir / f"frame_{i:06d}.png" for i in range(3)]
+    assert all(f.stat().st_size > 0 for f in frames)
+
+    gif = Path(tmpdir) / "anim.gif"
+    write_gif(frames, gif, fps=5.0)
+
+    with Image.open(gif) as image:
+        assert image.n_frames == 3
+
+
+@pytest.mark.integration
+def test_write_gif_closes_frames(tmpdir, monkeypatch):
+    frames = render_frames(Path("tests/files/output"), [0, 5, 10], Path(tmpdir) / "frames", workers=1, max_points=4)
+
+    opened, image_open = [], Image.open
+
+    def open_(path):
+        image = image_open(path)
+        opened.append(image)
+        return image
+
+    monkeypatch.setattr(animate.Image, "open", open_)
+
+    write_gif(frames, Path(tmpdir) / "anim.gif")
+
+    assert len(opened) == 3
+    assert all(image.fp is None for image in opened)
@@ -1,15 +1,22 @@
-from pyheat1d.cells_loop import loop_over_cells
+import numpy as np
+import pytest
+
+from pyheat1d.cells_loop import CELLS_LOOP_ENGINES, loop_over_cells, rhs_over_cells
+from pyheat1d.errors import CellsLoopEngineNotFoundError, FaceConductivityNotFoundError
+from pyheat1d.mesh import BoundaryCondition, Grading, Mesh
+from pyheat1d.source import SourceTerms
 from pyheat1d.system import System
 
 
-def test_assemble_system(mesh):
+@pytest.mark.parametrize("engine", CELLS_LOOP_ENGINES.keys())
+def test_assemble_system(mesh, engine):
     mesh.update_prop(prop_name="k", value=2.0)
     mesh.update_prop(prop_name="ro", value=2.0)
     mesh.update_prop(prop_name="cp", value=0.5)
 
     system = System(mesh.n_cells)
 
-    loop_over_cells(system, mesh, 1.0)
+    loop_over_cells(system, mesh, 1.0, engine)
 
     expeted = [400.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 27.272727272727273]
 
@@ -33,3 +40,168 @@ def test_assemble_system(mesh):
         assert system.a[i, 0] == expeted[i][0]
         assert system.a[i, 1] == expeted[i][1]
         assert system.a[i, 2] == expeted[i][2]
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("engine", CELLS_LOOP_ENGINES.keys())
+def test_engines_bit_for_bit(mesh, engine):
+    rng = np.random.default_rng(42)
+
+    mesh.cells.props.k[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.props.ro[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.props.cp[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.results.u[:] = rng.uniform(0.0, 100.0, mesh.n_cells)
+
+    expected = System(mesh.n_cells)
+    loop_over_cells(expected, mesh, 0.3, "python")
+
+    system = System(mesh.n_cells)
+    loop_over_cells(system, mesh, 0.3, engine)
+
+    assert np.array_equal(system.a, expected.a)
+    assert np.array_equal(system.b, expected.b)
+
+
+@pytest.mark.unitary
+def test_negative_engine_not_found(mesh):
+    system = System(mesh.n_cells)
+
+    with pytest.raises(CellsLoopEngineNotFoundError, match="A implementação 'fortran' do loop"):
+        loop_over_cells(system, mesh, 1.0, "fortran")
+
+
+@pytest.mark.unitary
+def test_rhs_over_cells(mesh):
+    mesh.update_prop(prop_name="k", value=2.0)
+    mesh.update_prop(prop_name="ro", value=2.0)
+    mesh.update_prop(prop_name="cp", value=0.5)
+    mesh.cells.results.u[:] = np.linspace(0.0, 10.0, mesh.n_cells)
+
+    expected = System(mesh.n_cells)
+    loop_over_cells(expected, mesh, 1.0)
+
+    system = System(mesh.n_cells)
+    rhs_over_cells(system, mesh, 1.0)
+
+    assert np.array_equal(system.b, expected.b)
+
+
+@pytest.fixture
+def graded_mesh():
+    lbc = BoundaryCondition(type=1, params={"value": 10.0})
+    rbc = BoundaryCondition(type=3, params={"value": 30.0, "h": 1.0})
+    mesh = Mesh(1.0, 10, lbc, rbc, grading=Grading(type="tanh", params={"beta": 2.0}))
+    mesh.mk_grid()
+
+    rng = np.random.default_rng(42)
+    mesh.cells.props.k[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.props.ro[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.props.cp[:] = rng.uniform(0.5, 2.0, mesh.n_cells)
+    mesh.cells.results.u[:] = rng.uniform(0.0, 100.0, mesh.n_cells)
+
+    return mesh
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("engine", CELLS_LOOP_ENGINES.keys())
+def test_engines_bit_for_bit_graded_mesh(graded_mesh, engine):
+    expected = System(graded_mesh.n_cells)
+    loop_over_cells(expected, graded_mesh, 0.3, "python")
+
+    system = System(graded_mesh.n_cells)
+    loop_over_cells(system, graded_mesh, 0.3, engine)
+
+    assert np.array_equal(system.a, expected.a)
+    assert np.array_equal(system.b, expected.b)
+
+    rhs_over_cells(system, graded_mesh, 0.3)
+
+    assert np.array_equal(system.b, expected.b)
+
+
+@pytest.mark.unitary
+def test_assemble_system_graded_mesh(graded_mesh):
+    graded_mesh.update_prop(prop_name="k", value=1.0)
+    graded_mesh.update_prop(prop_name="ro", value=1.0)
+    graded_mesh.update_prop(prop_name="cp", value=1.0)
+
+    system = System(graded_mesh.n_cells)
+    loop_over_cells(system, graded_mesh, np.inf, "python")
+
+    dx, dxc = graded_mesh.dx, np.diff(graded_mesh.cells.centroids)
+
+    np.testing.assert_allclose(system.a[1:, 0], -1.0 / dxc)
+    np.testing.assert_allclose(system.a[:-1, 2], -1.0 / dxc)
+    assert system.a[0, 1] == pytest.approx(1.0 / dxc[0] + 2.0 / dx[0])
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("engine", CELLS_LOOP_ENGINES.keys())
+def test_engines_bit_for_bit_harmonic(graded_mesh, engine):
+    expected = System(graded_mesh.n_cells)
+    loop_over_cells(expected, graded_mesh, 0.3, "python", "harmonic")
+
+    system = System(graded_mesh.n_cells)
+    loop_over_cells(system, graded_mesh, 0.3, engine, "harmonic")
+
+    assert np.array_equal(system.a, expected.a)
+    assert np.array_equal(system.b, expected.b)
+
+
+@pytest.mark.unitary
+def test_assemble_system_harmonic(graded_mesh):
+    system = System(graded_mesh.n_cells)
+    loop_over_cells(system, graded_mesh, np.inf, "python", "harmonic")
+
+    k, dx = graded_mesh.cells.props.k, graded_mesh.dx
+    # ... as duas meias células em série
+    conductance = 1.0 / (0.5 * dx[:-1] / k[:-1] + 0.5 * dx[1:] / k[1:])
+
+    np.testing.assert_allclose(system.a[1:, 0], -conductance)
+    np.testing.assert_allclose(system.a[:-1, 2], -conductance)
+
+
+@pytest.mark.unitary
+def test_harmonic_same_as_arithmetic_with_constant_k(graded_mesh):
+    graded_mesh.update_prop(prop_name="k", value=3.0)
+
+    expected = System(graded_mesh.n_cells)
+    loop_over_cells(expected, graded_mesh, 0.3, "numpy", "arithmetic")
+
+    system = System(graded_mesh.n_cells)
+    loop_over_cells(system, graded_mesh, 0.3, "numpy", "harmonic")
+
+    np.testing.assert_allclose(system.a, expected.a, rtol=1.0e-14)
+
+
+@pytest.mark.unitary
+def test_negative_face_conductivity_not_found(mesh):
+    system = System(mesh.n_cells)
+
+    with pytest.raises(FaceConductivityNotFoundError, match="A média 'geometric' da condutividade nas faces"):
+        loop_over_cells(system, mesh, 1.0, "numpy", "geometric")
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("engine", ["python", "numpy", "numba"])
+def test_assemble_system_with_source(mesh, engine):
+    mesh.update_prop(prop_name="k", value=1.0)
+    mesh.update_prop(prop_name="ro", value=1.0)
+    mesh.update_prop(prop_name="cp", value=1.0)
+
+    expected = System(mesh.n_cells)
+    loop_over_cells(expected, mesh, 1.0, engine)
+
+    sc, sp = np.linspace(1.0, 10.0, mesh.n_cells), np.full(mesh.n_cells, -0.5)
+    mesh.source = SourceTerms(sc=sc, sp=sp, scale=2.0)
+    system = System(mesh.n_cells)
+    loop_over_cells(system, mesh, 1.0, engine)
+
+    np.testing.assert_allclose(system.b, expected.b + 2.0 * sc)
+    np.testing.assert_allclose(system.a[:, 1], expected.a[:, 1] + 1.0)
+    np.testing.assert_array_equal(system.a[:, [0, 2]], expected.a[:, [0, 2]])
+
+    rhs = System(mesh.n_cells)
+    rhs_over_cells(rhs, mesh, 1.0)
+
+    assert np.array_equal(rhs.b, system.b)
@@ -0,0 +1,84 @@
+import json
+
+import numpy as np
+import pytest
+
+from pyheat1d.chunked import INDEX_FILE, ChunkedResults, decode_chunk, encode_chunk
+from pyheat1d.writer import ResultsWriterChunked
+
+
+@pytest.mark.unitary
+def test_encode_decode_chunk_lossless():
+    block = np.random.default_rng(1).normal(size=(5, 7))
+
+    raw, dtype, base = encode_chunk(block)
+
+    entry = {"nrows": 5, "ncols": 7, "dtype": dtype, "base": base}
+
+    np.testing.assert_array_equal(decode_chunk(raw, entry), block)
+
+
+@pytest.mark.unitary
+def test_encode_decode_chunk_quantized():
+    block = 20.0 + np.random.default_rng(2).normal(size=(16, 32))
+    tolerance = 1e-3
+
+    raw, dtype, base = encode_chunk(block, tolerance)
+
+    assert dtype == "<i4"
+
+    entry = {"nrows": 16, "ncols": 32, "dtype": dtype, "base": base}
+
+    assert np.abs(decode_chunk(raw, entry, tolerance) - block).max() <= tolerance * (1.0 + 1e-9)
+    assert len(raw) < len(encode_chunk(block)[0])
+
+
+@pytest.mark.unitary
+def test_encode_chunk_quantized_range_too_large():
+    block = np.array([[0.0, 1.0e12]])
+
+    _, dtype, _ = encode_chunk(block, 1e-6)
+
+    assert dtype == "<f8"
+
+
+@pytest.mark.unitary
+def test_chunked_results_step_and_cell(tmpdir):
+    history = np.arange(7 * 5, dtype=float).reshape(7, 5)
+
+    with ResultsWriterChunked(tmpdir / "results.chunks", chunk_steps=3, chunk_cells=2, workers=2) as writer:
+        for istep, u in enumerate(history):
+            writer.append_in_buffer(istep, 0.5 * istep, u)
+        writer.dump()
+
+    index = json.load((tmpdir / INDEX_FILE).open())
+
+    # ... 3 blocos de passos (3, 3, 1) x 3 blocos de células (2, 2, 1)
+    assert len(index["chunks"]) == 9
+
+    results = ChunkedResults(tmpdir)
+
+    assert len(results) == 7
+    assert results.istep.tolist() == list(range(7))
+    assert results.t.tolist() == [0.5 * i for i in range(7)]
+
+    for i in range(7):
+        np.testing.assert_array_equal(results.step(i), history[i])
+
+    for j in range(5):
+        np.testing.assert_array_equal(results.cell(j), history[:, j])
+
+
+@pytest.mark.unitary
+def test_negative_chunked_results_out_of_range(tmpdir):
+    with ResultsWriterChunked(tmpdir / "results.chunks") as writer:
+        writer.append_in_buffer(0, 0.0, np.zeros(3))
+        writer.dump()
+
+    results = ChunkedResults(tmpdir)
+
+    with pytest.raises(IndexError):
+        results.step(1)
+
+    with pytest.raises(IndexError):
+        results.cell(3)
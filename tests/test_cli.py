@@ -1,10 +1,13 @@
+import json
 import shutil
 from pathlib import Path
 
+import numpy as np
 import pytest
 from typer.testing import CliRunner
 
 from pyheat1d.cli import app
+from pyheat1d.writer import ResultsWriterNpy
 
 runner = CliRunner()
 
@@ -41,6 +44,80 @@ def test_run(tmpdir):
     assert excepted_dir_files == {"results.json", "mesh.json", "newton.json", "time_log.json"}
 
 
+@pytest.mark.cli
+@pytest.mark.integration
+def test_run_with_solver(tmpdir):
+    case = Path("tests/files/input/newton.json")
+
+    shutil.copy(case, tmpdir)
+
+    input_case = str(tmpdir / "newton.json")
+
+    result = runner.invoke(app, ["run", input_case, "--solver", "cyclic_reduction"])
+
+    assert result.exit_code == 0
+
+    result = runner.invoke(app, ["run", input_case, "--solver", "gauss"])
+
+    assert result.exit_code == 1
+    assert "Error: O solver 'gauss' não existe." in result.stdout
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_ensemble(tmpdir):
+    case = Path("tests/files/input/newton.json")
+
+    infos = json.load(case.open())
+    infos["cells_loop_engine"] = "numpy"
+
+    input_files = []
+    for i, k in enumerate((1.0, 2.0)):
+        infos["prop"]["k"] = k
+        input_file = tmpdir / f"case_{i}.json"
+        json.dump(infos, input_file.open("w"))
+        input_files.append(str(input_file))
+
+    output_dir = tmpdir / "out"
+
+    result = runner.invoke(app, ["ensemble", *input_files, "--output-dir", str(output_dir)])
+
+    assert result.exit_code == 0
+
+    assert {f.basename for f in output_dir.listdir()} == {"case_0", "case_1", "time_log.json"}
+    assert {f.basename for f in (output_dir / "case_0").listdir()} == {"mesh.json", "results.json"}
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_sweep(tmpdir):
+    output_dir = tmpdir / "sweep"
+
+    result = runner.invoke(
+        app,
+        [
+            "sweep",
+            "tests/files/input/newton.json",
+            "--axis",
+            "ndiv=10,20",
+            "--axis",
+            "rbc.params.h=1.0,2.0",
+            "--workers",
+            "2",
+            "--output-dir",
+            str(output_dir),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Casos: 4, erros: 0." in result.stdout
+
+    result = runner.invoke(app, ["sweep", "tests/files/input/newton.json", "--axis", "ndiv"])
+
+    assert result.exit_code == 1
+    assert "Error: O eixo 'ndiv' da varredura é inválido." in result.stdout
+
+
 @pytest.mark.cli
 @pytest.mark.integration
 def test_plot(mocker):
@@ -57,6 +134,69 @@ def test_plot(mocker):
     assert show.call_count == 1
 
 
+@pytest.mark.cli
+@pytest.mark.integration
+def test_plot_results_npy(mocker, tmpdir):
+    shutil.copy(Path("tests/files/output/mesh.json"), tmpdir)
+    with ResultsWriterNpy(Path(tmpdir) / "results.npy", nstep=2) as writer:
+        for istep in range(3):
+            writer.append_in_buffer(istep, float(istep), np.full(10, istep, dtype=float))
+        writer.dump()
+
+    plot = mocker.patch("pyheat1d.cli.plt.plot")
+    show = mocker.patch("pyheat1d.cli.plt.show")
+
+    result = runner.invoke(app, ["plot", str(tmpdir), "--steps", "0, 2"])
+
+    assert result.exit_code == 0
+
+    assert plot.call_count == 2
+    assert plot.call_args.kwargs == {"label": "time = 2.0 s"}
+    assert show.call_count == 1
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_export(tmpdir):
+    figures_dir = Path(tmpdir) / "figures"
+
+    result = runner.invoke(
+        app, ["export", "tests/files/output", "--steps", "0, 10", "--figures-dir", str(figures_dir), "--format", "svg"]
+    )
+
+    assert result.exit_code == 0
+    assert [f.name for f in figures_dir.iterdir()] == ["output.svg"]
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_export_per_step(tmpdir):
+    figures_dir = Path(tmpdir) / "figures"
+
+    result = runner.invoke(
+        app, ["export", "tests/files/output", "--steps", "0:11:5", "--figures-dir", str(figures_dir), "--per-step"]
+    )
+
+    assert result.exit_code == 0
+    assert "3 figuras salvas" in result.stdout
+    assert sorted(f.name for f in figures_dir.iterdir()) == [
+        "output_step_000000.png",
+        "output_step_000005.png",
+        "output_step_000010.png",
+    ]
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_negative_export_results_not_found(tmpdir):
+    shutil.copy(Path("tests/files/output/mesh.json"), tmpdir)
+
+    result = runner.invoke(app, ["export", str(tmpdir), "--figures-dir", str(Path(tmpdir) / "figures")])
+
+    assert result.exit_code == 1
+    assert "Arquivo 'results.json' não achado." in " ".join(result.stdout.split())
+
+
 @pytest.mark.cli
 @pytest.mark.integration
 def test_positive_plot_step_beyond_the_last(mocker):
@@ -106,3 +246,39 @@ def test_negative_plot_results_json_not_found(mocker, tmpdir):
 
     assert plot.call_count == 0
     assert show.call_count == 0
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_animate(tmpdir):
+    frames_dir = Path(tmpdir) / "frames"
+    gif = Path(tmpdir) / "anim.gif"
+
+    result = runner.invoke(
+        app,
+        [
+            "animate",
+            "tests/files/output",
+            "--steps",
+            "0:11:2",
+            "--frames-dir",
+            str(frames_dir),
+            "--gif",
+            str(gif),
+            "--workers",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(list(frames_dir.iterdir())) == 6
+    assert gif.exists()
+
+
+@pytest.mark.cli
+@pytest.mark.integration
+def test_negative_animate_no_steps(tmpdir):
+    result = runner.invoke(app, ["animate", "tests/files/output", "--steps", "100", "--frames-dir", str(tmpdir)])
+
+    assert result.exit_code == 1
+    assert "Error: Nenhum passo selecionado." in result.stdout
@@ -1,4 +1,6 @@
+import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -23,3 +25,28 @@ def test_run(tmpdir):
     excepted_dir_files = {f.basename for f in tmpdir.listdir()}
 
     assert excepted_dir_files == {"results.json", "mesh.json", "newton.json", "time_log.json"}
+
+
+@pytest.mark.integration
+def test_run_many_meshes_in_one_process(tmpdir):
+    case = Path("tests/files/input/newton.json")
+    infos = json.load(case.open())
+
+    input_files = []
+    for ndiv in (10, 20, 30):
+        case_dir = Path(tmpdir.mkdir(f"ndiv_{ndiv}"))
+        infos["ndiv"] = ndiv
+        json.dump(infos, (case_dir / "input.json").open("w"))
+        input_files.append(case_dir / "input.json")
+
+    run(input_file=input_files[0])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda f: run(input_file=f), input_files[1:]))
+
+    for ndiv, input_file in zip((10, 20, 30), input_files):
+        mesh = json.load((input_file.parent / "mesh.json").open())
+        results = json.load((input_file.parent / "results.json").open())
+
+        assert len(mesh["xp"]) == ndiv
+        assert len(results[-1]["u"]) == ndiv
@@ -1,10 +1,20 @@
 import json
+from dataclasses import replace
+from pathlib import Path
 
+import numpy as np
 import pytest
 
+from pyheat1d.chunked import ChunkedResults
 from pyheat1d.edp import Edp
+from pyheat1d.errors import NonlinearConvergenceError, SteadySingularError
 from pyheat1d.input_files import Input
-from pyheat1d.mesh import BoundaryCondition, MatPropsRef, init_mesh
+from pyheat1d.mesh import BoundaryCondition, Grading, Layer, MatPropsRef, init_mesh
+from pyheat1d.properties import PropertyLaw
+from pyheat1d.reader import open_results
+from pyheat1d.simulation_times import run_times
+from pyheat1d.source import Source
+from pyheat1d.timeseries import TimeSeries
 
 
 @pytest.mark.integration
@@ -162,3 +172,797 @@ def test_Edp_solver_bc_convection(tmpdir):
     ]
     for e, r in zip(excepted, read_results[500]["u"]):
         assert e == pytest.approx(r)
+
+
+@pytest.mark.integration
+def test_Edp_factorize_once_same_results(tmpdir):
+    results = []
+    for factorize_once in (True, False):
+        infos = Input(
+            length=1.0,
+            ndiv=7,
+            dt=2.0,
+            nstep=50,
+            lbc=BoundaryCondition(type=3, params={"value": 10.0, "h": 2.0}),
+            rbc=BoundaryCondition(type=2, params={"value": 1.0}),
+            initialt=20.0,
+            prop=MatPropsRef(k=2.0, ro=0.5, cp=2.0),
+            factorize_once=factorize_once,
+        )
+
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+        output_dir = tmpdir.mkdir(str(factorize_once))
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+
+        results.append(json.load(output_dir / "results.json"))
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.integration
+def test_Edp_results_jsonl(tmpdir):
+    infos = Input(
+        length=1.0,
+        ndiv=5,
+        dt=1.0,
+        nstep=100,
+        write_every_steps=25,
+        lbc=BoundaryCondition(type=1, params={"value": 10.0}),
+        rbc=BoundaryCondition(type=1, params={"value": 20.0}),
+        initialt=15.0,
+        prop=MatPropsRef(k=1.0, ro=2.0, cp=3.0),
+        results_format="jsonl",
+    )
+
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+    Edp(infos=infos, mesh=mesh, output_dir=tmpdir).resolve()
+
+    assert {f.basename for f in tmpdir.listdir()} == {"results.jsonl"}
+
+    read_results = [json.loads(line) for line in (tmpdir / "results.jsonl").open()]
+
+    assert [r["istep"] for r in read_results] == [0, 25, 50, 75, 100]
+
+    excepted = [11.0, 13.0, 15.0, 17.0, 19.0]
+    for e, r in zip(excepted, read_results[-1]["u"]):
+        assert e == pytest.approx(r)
+
+
+@pytest.mark.integration
+def test_Edp_async_writer_same_results(tmpdir):
+    results = []
+    for async_writer in (True, False):
+        infos = Input(
+            length=1.0,
+            ndiv=7,
+            dt=2.0,
+            nstep=50,
+            write_every_steps=3,
+            lbc=BoundaryCondition(type=3, params={"value": 10.0, "h": 2.0}),
+            rbc=BoundaryCondition(type=2, params={"value": 1.0}),
+            initialt=20.0,
+            prop=MatPropsRef(k=2.0, ro=0.5, cp=2.0),
+            results_format="jsonl",
+            async_writer=async_writer,
+            writer_queue_size=2,
+        )
+
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+        output_dir = tmpdir.mkdir(str(async_writer))
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+
+        results.append([json.loads(line) for line in (output_dir / "results.jsonl").open()])
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.integration
+def test_Edp_results_npy(tmpdir):
+    results = {}
+    for results_format in ("json", "npy"):
+        infos = Input(
+            length=1.0,
+            ndiv=5,
+            dt=1.0,
+            nstep=100,
+            write_every_steps=25,
+            lbc=BoundaryCondition(type=1, params={"value": 10.0}),
+            rbc=BoundaryCondition(type=3, params={"value": 20.0, "h": 2.0}),
+            initialt=15.0,
+            prop=MatPropsRef(k=1.0, ro=2.0, cp=3.0),
+            results_format=results_format,
+        )
+
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+        output_dir = tmpdir.mkdir(results_format)
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+        results[results_format] = Path(output_dir)
+
+    assert {f.name for f in results["npy"].iterdir()} == {"results.npy", "results_steps.npy"}
+
+    excepted = json.load((results["json"] / "results.json").open())
+    u = np.load(results["npy"] / "results.npy", mmap_mode="r")
+    steps = np.load(results["npy"] / "results_steps.npy")
+
+    assert steps["istep"].tolist() == [r["istep"] for r in excepted]
+    assert steps["t"].tolist() == [r["t"] for r in excepted]
+    np.testing.assert_array_equal(u, [r["u"] for r in excepted])
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("tolerance", [None, 1e-4])
+def test_Edp_results_chunked(tmpdir, tolerance):
+    results = {}
+    for results_format in ("json", "chunked"):
+        infos = Input(
+            length=1.0,
+            ndiv=9,
+            dt=1.0,
+            nstep=100,
+            write_every_steps=3,
+            lbc=BoundaryCondition(type=1, params={"value": 10.0}),
+            rbc=BoundaryCondition(type=3, params={"value": 20.0, "h": 2.0}),
+            initialt=15.0,
+            prop=MatPropsRef(k=1.0, ro=2.0, cp=3.0),
+            results_format=results_format,
+            chunk_steps=8,
+            chunk_cells=4,
+            results_tolerance=tolerance,
+        )
+
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+        output_dir = tmpdir.mkdir(results_format)
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+        results[results_format] = output_dir
+
+    excepted = json.load((results["json"] / "results.json").open())
+    chunked = ChunkedResults(results["chunked"])
+
+    assert chunked.istep.tolist() == [r["istep"] for r in excepted]
+    assert chunked.t.tolist() == [r["t"] for r in excepted]
+
+    u = np.array([r["u"] for r in excepted])
+    for i in (0, 17, len(excepted) - 1):
+        np.testing.assert_allclose(chunked.step(i), u[i], rtol=0.0, atol=tolerance or 0.0)
+    np.testing.assert_allclose(chunked.cell(8), u[:, 8], rtol=0.0, atol=tolerance or 0.0)
+
+
+def _adaptive_infos(ndiv=20, **kwargs) -> Input:
+    return Input(
+        length=1.0,
+        ndiv=ndiv,
+        lbc=BoundaryCondition(type=1, params={"value": 100.0}),
+        rbc=BoundaryCondition(type=3, params={"value": 20.0, "h": 2.0}),
+        initialt=20.0,
+        prop=MatPropsRef(k=1.0, ro=1.0, cp=1.0),
+        **kwargs,
+    )
+
+
+def _run(tmpdir, name: str, infos: Input) -> tuple[Edp, np.ndarray]:
+    mesh = init_mesh(
+        infos.length,
+        infos.ndiv,
+        infos.lbc,
+        infos.rbc,
+        infos.prop,
+        infos.initialt,
+        grading=infos.grading,
+        layers=infos.layers,
+        source=infos.source,
+    )
+    output_dir = Path(tmpdir.mkdir(name))
+    edp = Edp(infos=infos, mesh=mesh, output_dir=output_dir)
+    edp.resolve()
+    with open_results(output_dir) as reader:
+        return edp, np.asarray(reader.step(-1))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("results_format", ["json", "npy"])
+def test_Edp_adaptive_time_step(tmpdir, results_format):
+    run_times.reset()
+
+    results = {}
+    for name, kwargs in {
+        "fixed": {"dt": 1.0e-5, "nstep": 20_000, "write_every_steps": 1000},
+        "adaptive": {"dt": 1.0e-5, "nstep": 20_000, "adaptive_tol": 1.0e-3, "results_format": results_format},
+    }.items():
+        infos = _adaptive_infos(**kwargs)
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        output_dir = Path(tmpdir.mkdir(name))
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+        results[name] = open_results(output_dir)
+
+    adaptive = results["adaptive"]
+
+    assert adaptive.t[-1] == pytest.approx(0.2)
+    assert np.all(np.diff(adaptive.t) > 0.0)
+    assert adaptive.istep.tolist() == list(range(len(adaptive)))
+    # ... o passo cresce durante o relaxamento, muito menos passos que o passo fixo
+    assert len(adaptive) < 2_000
+    assert np.diff(adaptive.t)[-1] > 100 * np.diff(adaptive.t)[0]
+
+    assert run_times.stats["accepted_steps"] == len(adaptive) - 1
+    assert "rejected_steps" in run_times.stats
+
+    np.testing.assert_allclose(adaptive.step(-1), results["fixed"].step(-1), atol=5.0e-2)
+
+
+@pytest.mark.integration
+def test_Edp_adaptive_time_step_dt_max(tmpdir):
+    infos = _adaptive_infos(dt=1.0e-3, nstep=100, adaptive_tol=1.0, dt_max=2.0e-3)
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir)).resolve()
+
+    with open_results(Path(tmpdir)) as reader:
+        assert np.diff(reader.t).max() == pytest.approx(2.0e-3)
+        assert reader.t[-1] == pytest.approx(0.1)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("adaptive_tol", [None, 1.0e-2])
+def test_Edp_steady_state_early_termination(tmpdir, adaptive_tol):
+    run_times.reset()
+
+    infos = _adaptive_infos(
+        dt=1.0e-2,
+        nstep=1_000_000,
+        write_every_steps=7,
+        adaptive_tol=adaptive_tol,
+        steady_tol=1.0e-8,
+        steady_norm="l2",
+        steady_check_every=5,
+    )
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir)).resolve()
+
+    steady_step = run_times.stats["steady_step"]
+
+    assert steady_step % 5 == 0
+    assert steady_step < 100_000
+    assert run_times.stats["steady_residual"] <= 1.0e-8
+
+    with open_results(Path(tmpdir)) as reader:
+        # ... o último passo é escrito mesmo fora do intervalo de escrita
+        assert reader.istep[-1] == steady_step
+        assert reader.istep[-2] < steady_step
+
+        # ... solução do regime permanente: T(x) linear entre 100 e a convecção
+        u = reader.step(-1)
+        assert np.all(np.diff(u) < 0.0)
+        np.testing.assert_allclose(np.diff(u, 2), 0.0, atol=1.0e-4)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("engine", ["python", "numpy", "numba"])
+@pytest.mark.parametrize("results_format", ["json", "npy"])
+def test_Edp_steady_analysis(tmpdir, engine, results_format):
+    run_times.reset()
+
+    infos = _adaptive_infos(
+        dt=1.0, nstep=1000, analysis="steady", cells_loop_engine=engine, results_format=results_format
+    )
+    infos.rbc = BoundaryCondition(type=1, params={"value": 20.0})
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir)).resolve()
+
+    with open_results(Path(tmpdir)) as reader:
+        assert len(reader) == 1
+        u = reader.step(0)
+
+    np.testing.assert_allclose(u, 100.0 - 80.0 * mesh.cells.centroids, rtol=1.0e-12)
+
+
+@pytest.mark.integration
+def test_Edp_steady_analysis_same_as_transient_limit(tmpdir):
+    results = {}
+    for analysis in ("steady", "transient"):
+        infos = _adaptive_infos(dt=10.0, nstep=500, analysis=analysis)
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        output_dir = Path(tmpdir.mkdir(analysis))
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+        results[analysis] = open_results(output_dir).step(-1)
+
+    np.testing.assert_allclose(results["steady"], results["transient"], rtol=1.0e-10)
+
+
+@pytest.mark.integration
+def test_negative_Edp_steady_analysis_flux_both_sides(tmpdir):
+    infos = _adaptive_infos(dt=1.0, nstep=1, analysis="steady")
+    infos.lbc = infos.rbc = BoundaryCondition(type=2, params={"value": 1.0})
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+
+    with pytest.raises(SteadySingularError):
+        Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir)).resolve()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("solver", ["tdma", "lapack"])
+def test_Edp_theta_one_is_backward_euler(tmpdir, solver):
+    _, backward = _run(tmpdir, "backward", _adaptive_infos(dt=1.0e-3, nstep=50, solver=solver))
+    _, theta = _run(tmpdir, "theta", _adaptive_infos(dt=1.0e-3, nstep=50, solver=solver, theta=1.0))
+
+    np.testing.assert_array_equal(backward, theta)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("engine", ["python", "numpy", "numba"])
+def test_Edp_crank_nicolson_second_order(tmpdir, engine):
+    _, reference = _run(
+        tmpdir, "reference", _adaptive_infos(dt=1.0e-5, nstep=10_000, write_every_steps=10_000, theta=0.5)
+    )
+
+    errors = {}
+    for theta in (0.5, 1.0):
+        for nstep in (100, 200):
+            infos = _adaptive_infos(dt=0.1 / nstep, nstep=nstep, theta=theta, cells_loop_engine=engine)
+            _, u = _run(tmpdir, f"{theta}_{nstep}", infos)
+            errors[theta, nstep] = np.abs(u - reference).max()
+
+    # ... dividir o passo por dois divide o erro por quatro no Crank–Nicolson e por dois no Euler implícito
+    assert errors[0.5, 100] / errors[0.5, 200] == pytest.approx(4.0, rel=0.05)
+    assert errors[1.0, 100] / errors[1.0, 200] == pytest.approx(2.0, rel=0.05)
+    assert errors[0.5, 200] < errors[1.0, 200] / 100
+
+
+@pytest.mark.integration
+def test_Edp_theta_factorized_same_as_assembled(tmpdir):
+    _, factorized = _run(tmpdir, "factorized", _adaptive_infos(dt=1.0e-3, nstep=50, theta=0.5))
+    _, assembled = _run(tmpdir, "assembled", _adaptive_infos(dt=1.0e-3, nstep=50, theta=0.5, factorize_once=False))
+
+    np.testing.assert_allclose(factorized, assembled, rtol=1.0e-12)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("engine", ["python", "numpy", "numba"])
+@pytest.mark.parametrize("results_format", ["json", "npy", "chunked"])
+def test_Edp_eigen_analysis(tmpdir, engine, results_format):
+    kwargs = {"dt": 1.0e-4, "nstep": 1000, "write_every_steps": 100, "results_format": results_format}
+
+    infos = _adaptive_infos(theta=0.5, **kwargs)
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir.mkdir("transient"))).resolve()
+
+    infos = _adaptive_infos(analysis="eigen", cells_loop_engine=engine, **kwargs)
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir.mkdir("eigen"))).resolve()
+
+    with open_results(Path(tmpdir) / "transient") as transient, open_results(Path(tmpdir) / "eigen") as eigen:
+        assert eigen.istep.tolist() == transient.istep.tolist() == list(range(0, 1001, 100))
+        np.testing.assert_allclose(eigen.t, transient.t)
+        np.testing.assert_allclose(eigen.steps(), transient.steps(), atol=1.0e-3)
+        np.testing.assert_allclose(mesh.cells.results.u, eigen.step(-1))
+
+
+@pytest.mark.integration
+def test_Edp_eigen_analysis_flux_both_sides(tmpdir):
+    results = {}
+    for name, kwargs in {"transient": {"theta": 0.5}, "eigen": {"analysis": "eigen"}}.items():
+        infos = _adaptive_infos(dt=1.0e-3, nstep=200, write_every_steps=200, **kwargs)
+        infos.lbc = BoundaryCondition(type=2, params={"value": 10.0})
+        infos.rbc = BoundaryCondition(type=2, params={"value": -5.0})
+        _, results[name] = _run(tmpdir, name, infos)
+
+    np.testing.assert_allclose(results["eigen"], results["transient"], atol=1.0e-4)
+
+
+@pytest.mark.integration
+def test_Edp_eigen_analysis_leading_modes(tmpdir):
+    results = {}
+    for name, kwargs in {"all": {}, "leading": {"eigen_modes": 5}}.items():
+        infos = _adaptive_infos(ndiv=200, dt=1.0e-3, nstep=100, write_every_steps=50, analysis="eigen", **kwargs)
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        output_dir = Path(tmpdir.mkdir(name))
+        Edp(infos=infos, mesh=mesh, output_dir=output_dir).resolve()
+        with open_results(output_dir) as reader:
+            results[name] = reader.steps()
+
+    # ... os modos rápidos descartados já decaíram no fim
+    assert np.abs(results["leading"][0] - results["all"][0]).max() > 1.0
+    np.testing.assert_allclose(results["leading"][-1], results["all"][-1], atol=1.0e-6)
+
+
+GRADED_INPUT = replace(
+    _adaptive_infos(dt=1.0e-3, nstep=10, write_every_steps=10, analysis="eigen"),
+    rbc=BoundaryCondition(type=1, params={"value": 20.0}),
+)
+
+
+@pytest.mark.integration
+def test_Edp_graded_mesh_boundary_layer(tmpdir):
+    edp, u_ref = _run(tmpdir, "reference", replace(GRADED_INPUT, ndiv=2000))
+    x_ref = edp.mesh.cells.centroids
+
+    errors = {}
+    for name, grading in {
+        "uniform": None,
+        "geometric": Grading(type="geometric", params={"ratio": 1.2, "symmetric": True}),
+        "tanh": Grading(type="tanh", params={"beta": 2.0}),
+    }.items():
+        edp, u = _run(tmpdir, name, replace(GRADED_INPUT, grading=grading))
+        errors[name] = np.abs(u - np.interp(edp.mesh.cells.centroids, x_ref, u_ref)).max()
+
+    # ... as células pequenas nos contornos resolvem as camadas limites
+    assert errors["geometric"] < errors["uniform"] / 3
+    assert errors["tanh"] < errors["uniform"] / 2
+
+
+@pytest.mark.integration
+def test_Edp_uniform_grading_same_as_default(tmpdir):
+    _, u = _run(tmpdir, "default", GRADED_INPUT)
+    _, u_uniform = _run(tmpdir, "uniform", replace(GRADED_INPUT, grading=Grading(type="uniform", params={})))
+
+    np.testing.assert_array_equal(u, u_uniform)
+
+
+def _amr_infos(ndiv, **kwargs) -> Input:
+    return Input(
+        length=1.0,
+        ndiv=ndiv,
+        dt=1.0e-4,
+        nstep=1000,
+        write_every_steps=100,
+        lbc=BoundaryCondition(type=1, params={"value": 500.0}),
+        rbc=BoundaryCondition(type=2, params={"value": 0.0}),
+        initialt=20.0,
+        prop=MatPropsRef(k=1.0, ro=1.0, cp=1.0),
+        **kwargs,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("results_format", ["json", "jsonl"])
+@pytest.mark.parametrize("factorize_once", [True, False])
+def test_Edp_amr(tmpdir, results_format, factorize_once):
+    run_times.reset()
+
+    infos = _amr_infos(
+        20,
+        amr_every=5,
+        amr_refine_tol=10.0,
+        results_format=results_format,
+        factorize_once=factorize_once,
+    )
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+    edp = Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir.mkdir("amr")))
+    edp.resolve()
+
+    infos = _amr_infos(640)
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir.mkdir("fine"))).resolve()
+
+    infos = _amr_infos(20)
+    mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+    Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir.mkdir("coarse"))).resolve()
+
+    with (
+        open_results(Path(tmpdir) / "amr") as amr,
+        open_results(Path(tmpdir) / "fine") as fine,
+        open_results(Path(tmpdir) / "coarse") as coarse,
+    ):
+        xp_fine = fine.centroids(-1, (np.arange(640) + 0.5) / 640)
+        xp_coarse = coarse.centroids(-1, (np.arange(20) + 0.5) / 20)
+        xp_amr = amr.centroids(-1, xp_coarse)
+
+        assert amr.istep.tolist() == list(range(0, 1001, 100))
+        for i in range(len(amr)):
+            assert amr.centroids(i, xp_coarse).shape == amr.step(i).shape
+        assert len(xp_amr) == edp.mesh.n_cells > 20
+
+        error_amr = np.abs(amr.step(-1) - np.interp(xp_amr, xp_fine, fine.step(-1))).max()
+        error_coarse = np.abs(coarse.step(-1) - np.interp(xp_coarse, xp_fine, fine.step(-1))).max()
+
+    assert error_amr < error_coarse / 3
+    assert run_times.stats["amr_regrids"] == 199
+    assert run_times.stats["amr_max_cells"] < 160
+
+
+@pytest.mark.integration
+def test_Edp_amr_conserves_energy(tmpdir):
+    energy = {}
+    for name, kwargs in {"amr": {"amr_every": 1, "amr_refine_tol": 10.0}, "uniform": {}}.items():
+        infos = _amr_infos(20, **kwargs)
+        infos.lbc = BoundaryCondition(type=2, params={"value": -100.0})
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        edp = Edp(infos=infos, mesh=mesh, output_dir=Path(tmpdir.mkdir(name)))
+        edp.resolve()
+        props = edp.mesh.cells.props
+        energy[name] = np.sum(props.ro * props.cp * edp.mesh.dx * edp.mesh.cells.results.u)
+
+    assert energy["amr"] == pytest.approx(energy["uniform"], rel=1.0e-12)
+
+
+NONLINEAR_INPUT = Input(
+    length=1.0,
+    ndiv=50,
+    dt=1.0e-3,
+    nstep=500,
+    write_every_steps=500,
+    lbc=BoundaryCondition(type=1, params={"value": 1000.0}),
+    rbc=BoundaryCondition(type=1, params={"value": 20.0}),
+    initialt=20.0,
+    prop=MatPropsRef(k=1.0, ro=1.0, cp=1.0),
+)
+
+
+@pytest.mark.integration
+def test_Edp_constant_law_same_as_constant_props(tmpdir):
+    _, u = _run(tmpdir, "constant", replace(NONLINEAR_INPUT, prop=MatPropsRef(k=1.0, ro=1.0, cp=2.0)))
+    k = PropertyLaw(type="poly", params={"coefs": [1.0]})
+    cp = PropertyLaw(type="table", params={"T": [0.0, 2000.0], "values": [2.0, 2.0]})
+    _, u_law = _run(tmpdir, "law", replace(NONLINEAR_INPUT, prop=MatPropsRef(k=k, ro=1.0, cp=cp)))
+
+    np.testing.assert_allclose(u_law, u, rtol=1.0e-10)
+
+
+@pytest.mark.integration
+def test_Edp_nonlinear_steady_analysis(tmpdir):
+    run_times.reset()
+
+    beta = 1.0e-2
+    k = PropertyLaw(type="poly", params={"coefs": [1.0, beta]})
+    edp, u = _run(tmpdir, "steady", replace(NONLINEAR_INPUT, prop=MatPropsRef(k=k, ro=1.0, cp=1.0), analysis="steady"))
+
+    # ... transformada de Kirchhoff, phi = T + beta T**2 / 2 é linear em x
+    x = edp.mesh.cells.centroids
+    phi_l, phi_r = 1000.0 + 0.5 * beta * 1000.0**2, 20.0 + 0.5 * beta * 20.0**2
+    phi = phi_l + (phi_r - phi_l) * x
+    u_exact = (np.sqrt(1.0 + 2.0 * beta * phi) - 1.0) / beta
+
+    np.testing.assert_allclose(u, u_exact, atol=5.0)
+    assert run_times.stats["nonlinear_steps"] == 1
+    assert run_times.stats["nonlinear_iterations"] > 1
+
+
+@pytest.mark.integration
+def test_Edp_nonlinear_lagged_properties(tmpdir):
+    k = PropertyLaw(type="poly", params={"coefs": [1.0, 1.0e-2]})
+    cp = PropertyLaw(type="table", params={"T": [0.0, 500.0, 1000.0], "values": [1.0, 1.5, 1.2]})
+    infos = replace(NONLINEAR_INPUT, prop=MatPropsRef(k=k, ro=1.0, cp=cp))
+
+    run_times.reset()
+    _, u = _run(tmpdir, "picard", infos)
+    assert run_times.stats["nonlinear_steps"] == 500
+    assert "lagged_steps" not in run_times.stats
+    iterations = run_times.stats["nonlinear_iterations"]
+
+    run_times.reset()
+    _, u_lagged = _run(tmpdir, "lagged", replace(infos, nonlinear_lag_tol=1.0e-3))
+    assert run_times.stats["lagged_steps"] > 0
+    assert run_times.stats["nonlinear_steps"] + run_times.stats["lagged_steps"] == 500
+    assert run_times.stats["nonlinear_iterations"] < iterations
+
+    np.testing.assert_allclose(u_lagged, u, atol=1.0)
+
+
+@pytest.mark.integration
+def test_Edp_nonlinear_adaptive_time_step(tmpdir):
+    k = PropertyLaw(type="poly", params={"coefs": [1.0, 1.0e-2]})
+    infos = replace(NONLINEAR_INPUT, prop=MatPropsRef(k=k, ro=1.0, cp=1.0))
+
+    _, u = _run(tmpdir, "fixed", infos)
+
+    run_times.reset()
+    _, u_adaptive = _run(tmpdir, "adaptive", replace(infos, adaptive_tol=1.0e-2, write_every_steps=1))
+
+    assert run_times.stats["accepted_steps"] > 0
+    assert run_times.stats["nonlinear_iterations"] > 0
+    np.testing.assert_allclose(u_adaptive, u, atol=1.0)
+
+
+@pytest.mark.integration
+def test_negative_Edp_nonlinear_not_converged(tmpdir):
+    k = PropertyLaw(type="poly", params={"coefs": [1.0, 1.0e-2]})
+    infos = replace(NONLINEAR_INPUT, prop=MatPropsRef(k=k, ro=1.0, cp=1.0), nonlinear_max_iter=1)
+
+    with pytest.raises(NonlinearConvergenceError):
+        _run(tmpdir, "max_iter", infos)
+
+
+LAYERED_INPUT = Input(
+    length=1.0,
+    ndiv=10,
+    dt=1.0,
+    nstep=1,
+    lbc=BoundaryCondition(type=1, params={"value": 100.0}),
+    rbc=BoundaryCondition(type=1, params={"value": 0.0}),
+    initialt=0.0,
+    prop=MatPropsRef(k=1.0, ro=1.0, cp=1.0),
+    analysis="steady",
+    layers=[Layer(start=0.5, end=1.0, prop=MatPropsRef(k=10.0, ro=1.0, cp=1.0))],
+    face_conductivity="harmonic",
+)
+
+
+@pytest.mark.integration
+def test_Edp_layers_harmonic_face_conductivity(tmpdir):
+    # ... parede composta, o perfil é linear em cada camada
+    q = 100.0 / (0.5 / 1.0 + 0.5 / 10.0)
+
+    errors = {}
+    for mean in ("arithmetic", "harmonic"):
+        edp, u = _run(tmpdir, mean, replace(LAYERED_INPUT, face_conductivity=mean))
+        x = edp.mesh.cells.centroids
+        u_exact = np.where(x < 0.5, 100.0 - q * x, 100.0 - 0.5 * q - 0.1 * q * (x - 0.5))
+        errors[mean] = np.abs(u - u_exact).max()
+
+    assert errors["harmonic"] < 1.0e-10
+    assert errors["arithmetic"] > 1.0
+
+
+@pytest.mark.integration
+def test_Edp_layers_interface_inside_cell(tmpdir):
+    errors = []
+    for ndiv in (11, 41, 161):
+        edp, u = _run(tmpdir, f"ndiv_{ndiv}", replace(LAYERED_INPUT, ndiv=ndiv))
+        q = 100.0 / (0.5 / 1.0 + 0.5 / 10.0)
+        x = edp.mesh.cells.centroids
+        u_exact = np.where(x < 0.5, 100.0 - q * x, 100.0 - 0.5 * q - 0.1 * q * (x - 0.5))
+        errors.append(np.abs(u - u_exact).max())
+
+    # ... a célula cortada pela interface dá um erro de primeira ordem
+    assert errors[1] < errors[0] / 3
+    assert errors[2] < errors[1] / 3
+
+
+TRANSIENT_INPUT = Input(
+    length=1.0,
+    ndiv=20,
+    dt=1.0e-3,
+    nstep=200,
+    write_every_steps=100,
+    lbc=BoundaryCondition(type=2, params={"value": 0.0}),
+    rbc=BoundaryCondition(type=2, params={"value": 0.0}),
+    initialt=20.0,
+    prop=MatPropsRef(k=1.0, ro=1.0, cp=1.0),
+)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("factorize_once", [True, False])
+def test_Edp_constant_bc_series_same_as_constant_bc(tmpdir, factorize_once):
+    series = TimeSeries(t=np.array([0.0, 1.0]), values=np.array([100.0, 100.0]))
+    infos = replace(
+        TRANSIENT_INPUT, rbc=BoundaryCondition(type=3, params={"value": 50.0, "h": 2.0}), factorize_once=factorize_once
+    )
+
+    _, u = _run(tmpdir, "constant", replace(infos, lbc=BoundaryCondition(type=1, params={"value": 100.0})))
+    edp, u_series = _run(tmpdir, "series", replace(infos, lbc=BoundaryCondition(type=1, params={"value": series})))
+
+    np.testing.assert_array_equal(u_series, u)
+    assert edp.is_operator_constant()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("theta", [1.0, 0.5])
+def test_Edp_flux_series_energy_balance(tmpdir, theta):
+    # ... fluxo que entra pela esquerda cresce linearmente, a direita é isolada
+    flux = TimeSeries(t=np.array([0.0, 1.0]), values=np.array([0.0, -100.0]))
+    lbc = BoundaryCondition(type=2, params={"value": flux})
+
+    edp, u = _run(tmpdir, "flux", replace(TRANSIENT_INPUT, lbc=lbc, theta=theta))
+
+    dt = 1.0e-3
+    times = dt * np.arange(200) + theta * dt
+    energy = np.sum(edp.mesh.dx * (u - 20.0))
+
+    assert energy == pytest.approx(-dt * np.sum(flux(times)), rel=1.0e-10)
+    assert lbc.params["value"] is flux
+
+
+@pytest.mark.integration
+def test_Edp_convection_series_factorize_once(tmpdir):
+    h = TimeSeries(t=np.array([0.0, 0.1, 0.2]), values=np.array([1.0, 10.0, 1.0]), kind="step")
+    value = TimeSeries(t=np.array([0.0, 0.2]), values=np.array([100.0, 300.0]))
+    infos = replace(
+        TRANSIENT_INPUT,
+        lbc=BoundaryCondition(type=3, params={"value": value, "h": h}),
+        rbc=BoundaryCondition(type=1, params={"value": 20.0}),
+    )
+
+    edp, u = _run(tmpdir, "factorized", replace(infos, factorize_once=True))
+    _, u_assembled = _run(tmpdir, "assembled", replace(infos, factorize_once=False))
+
+    assert not edp.is_operator_constant()
+    np.testing.assert_array_equal(u, u_assembled)
+
+
+@pytest.mark.integration
+def test_Edp_bc_series_adaptive_time_step(tmpdir):
+    value = TimeSeries(t=np.array([0.0, 0.2]), values=np.array([20.0, 500.0]))
+    infos = replace(TRANSIENT_INPUT, lbc=BoundaryCondition(type=1, params={"value": value}), dt=1.0e-5, nstep=20_000)
+
+    _, u = _run(tmpdir, "fixed", replace(infos, write_every_steps=20_000))
+    _, u_adaptive = _run(tmpdir, "adaptive", replace(infos, adaptive_tol=1.0e-2, write_every_steps=None))
+
+    np.testing.assert_allclose(u_adaptive, u, atol=0.5)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("engine", ["python", "numpy", "numba"])
+def test_Edp_uniform_source_steady_parabola(tmpdir, engine):
+    source = Source(type="uniform", params={"value": 1000.0})
+    bc = BoundaryCondition(type=1, params={"value": 0.0})
+
+    infos = replace(
+        TRANSIENT_INPUT, source=source, lbc=bc, rbc=bc, ndiv=200, analysis="steady", cells_loop_engine=engine
+    )
+
+    edp, u = _run(tmpdir, "steady", infos)
+
+    x = edp.mesh.cells.centroids
+    np.testing.assert_allclose(u, 500.0 * x * (1.0 - x), atol=1.0e-2 * u.max())
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("theta", [1.0, 0.5])
+def test_Edp_scaled_source_energy_balance(tmpdir, theta):
+    # ... domínio isolado, toda a energia gerada fica nas células
+    scale = TimeSeries(t=np.array([0.0, 0.1, 0.2]), values=np.array([0.0, 1.0, 0.5]))
+    source = Source(
+        type="regions",
+        params={"regions": [{"start": 0.0, "end": 0.33, "value": 300.0}, {"start": 0.5, "end": 0.8, "value": 100.0}]},
+        scale=scale,
+    )
+
+    edp, u = _run(tmpdir, "energy", replace(TRANSIENT_INPUT, source=source, theta=theta))
+
+    dt = 1.0e-3
+    times = dt * np.arange(200) + theta * dt
+    energy = np.sum(edp.mesh.dx * (u - 20.0))
+
+    assert energy == pytest.approx(dt * np.sum(scale(times)) * (300.0 * 0.33 + 100.0 * 0.3), rel=1.0e-10)
+    assert edp.is_operator_constant()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("factorize_once", [True, False])
+def test_Edp_linear_source_decay(tmpdir, factorize_once):
+    source = Source(type="uniform", params={"value": 0.0, "sp": -1.0})
+
+    _, u = _run(tmpdir, "decay", replace(TRANSIENT_INPUT, source=source, factorize_once=factorize_once))
+
+    np.testing.assert_allclose(u, 20.0 / (1.0 + 1.0e-3) ** 200, rtol=1.0e-12)
+
+
+@pytest.mark.integration
+def test_Edp_scaled_linear_source_factorize_once(tmpdir):
+    scale = TimeSeries(t=np.array([0.0, 0.1]), values=np.array([1.0, 3.0]), kind="step")
+    source = Source(type="cells", params={"values": np.linspace(0.0, 100.0, 20), "sp": -2.0}, scale=scale)
+    infos = replace(
+        TRANSIENT_INPUT,
+        source=source,
+        lbc=BoundaryCondition(type=1, params={"value": 20.0}),
+        rbc=BoundaryCondition(type=3, params={"value": 0.0, "h": 1.0}),
+    )
+
+    edp, u = _run(tmpdir, "factorized", replace(infos, factorize_once=True))
+    _, u_assembled = _run(tmpdir, "assembled", replace(infos, factorize_once=False))
+
+    assert not edp.is_operator_constant()
+    np.testing.assert_array_equal(u, u_assembled)
+
+
+@pytest.mark.integration
+def test_Edp_amr_source_conserves_energy(tmpdir):
+    source = Source(type="regions", params={"regions": [{"start": 0.2, "end": 0.27, "value": 500.0}]})
+    infos = replace(TRANSIENT_INPUT, source=source, write_every_steps=None)
+    run_times.reset()
+
+    energy = {}
+    for name, kwargs in {"amr": {"amr_every": 1, "amr_refine_tol": 0.5}, "uniform": {}}.items():
+        edp, _ = _run(tmpdir, name, replace(infos, **kwargs))
+        energy[name] = np.sum(edp.mesh.dx * (edp.mesh.cells.results.u - 20.0))
+
+    assert energy["amr"] == pytest.approx(1.0e-3 * 200 * 500.0 * 0.07, rel=1.0e-10)
+    assert energy["uniform"] == pytest.approx(energy["amr"], rel=1.0e-10)
+    assert run_times.stats["amr_max_cells"] > 20
@@ -0,0 +1,298 @@
+import json
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from pyheat1d.edp import Edp
+from pyheat1d.ensemble import EnsembleEdp, init_ensemble_mesh
+from pyheat1d.errors import (
+    AmrNotSupportedError,
+    EnsembleInputMismatchError,
+    EnsembleNotSupportedError,
+)
+from pyheat1d.input_files import Input
+from pyheat1d.mesh import BoundaryCondition, Layer, MatPropsRef, init_mesh
+from pyheat1d.properties import PropertyLaw
+from pyheat1d.source import Source
+from pyheat1d.timeseries import TimeSeries
+
+INPUT = Input(
+    length=1.0,
+    ndiv=6,
+    dt=2.0,
+    nstep=30,
+    write_every_steps=10,
+    lbc=BoundaryCondition(type=3, params={"value": 10.0, "h": 2.0}),
+    rbc=BoundaryCondition(type=1, params={"value": 20.0}),
+    initialt=20.0,
+    prop=MatPropsRef(k=2.0, ro=0.5, cp=2.0),
+    cells_loop_engine="numpy",
+)
+
+MEMBERS = [
+    INPUT,
+    replace(
+        INPUT,
+        lbc=BoundaryCondition(type=3, params={"value": 5.0, "h": 1.0}),
+        initialt=0.0,
+        prop=MatPropsRef(k=1.0, ro=2.0, cp=1.5),
+    ),
+    replace(INPUT, rbc=BoundaryCondition(type=1, params={"value": 50.0}), prop=MatPropsRef(k=4.0, ro=1.0, cp=1.0)),
+]
+
+
+@pytest.mark.unitary
+def test_init_ensemble_mesh():
+    mesh = init_ensemble_mesh(MEMBERS)
+
+    assert mesh.n_batch == 3
+    assert mesh.cells.props.k.shape == (3, 6)
+    assert mesh.cells.results.u.shape == (3, 6)
+
+    assert mesh.cells.props.k[1, 0] == 1.0
+    assert mesh.cells.results.u[1, 5] == 0.0
+    assert mesh.rbc.params["value"].tolist() == [20.0, 20.0, 50.0]
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "member, key",
+    [
+        (replace(INPUT, ndiv=7), "ndiv"),
+        (replace(INPUT, dt=1.0), "dt"),
+        (replace(INPUT, face_conductivity="harmonic"), "face_conductivity"),
+        (replace(INPUT, nonlinear_tol=0.1, nonlinear_max_iter=1), "nonlinear_tol"),
+        (replace(INPUT, nonlinear_max_iter=1), "nonlinear_max_iter"),
+        (replace(INPUT, nonlinear_lag_tol=1.0e-3), "nonlinear_lag_tol"),
+        (replace(INPUT, solver="lapack", factorize_once=False), "solver"),
+        (replace(INPUT, factorize_once=False), "factorize_once"),
+        (replace(INPUT, cells_loop_engine="python"), "cells_loop_engine"),
+        (replace(INPUT, results_format="jsonl"), "results_format"),
+        (replace(INPUT, chunk_steps=8), "chunk_steps"),
+        (replace(INPUT, lbc=BoundaryCondition(type=1, params={"value": 10.0})), "lbc.type"),
+        (replace(INPUT, prop=MatPropsRef(k=PropertyLaw(type="poly", params={"coefs": [1.0]}), ro=1.0, cp=1.0)), "prop"),
+    ],
+)
+def test_negative_ensemble_mismatch(member, key):
+    msg = f"O valor '{key}' deve ser o mesmo em todos os membros do ensemble."
+
+    with pytest.raises(EnsembleInputMismatchError, match=msg):
+        init_ensemble_mesh([INPUT, member])
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("factorize_once", [True, False])
+def test_ensemble_same_results_as_single_runs(tmpdir, factorize_once):
+    members = [replace(m, factorize_once=factorize_once) for m in MEMBERS]
+
+    mesh = init_ensemble_mesh(members)
+    member_dirs = [tmpdir.mkdir(f"member_{i}") for i in range(len(members))]
+
+    EnsembleEdp(members[0], mesh, tmpdir, member_dirs).resolve()
+
+    for infos, member_dir in zip(members, member_dirs):
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        single_dir = member_dir.mkdir("single")
+        Edp(infos=infos, mesh=mesh, output_dir=single_dir).resolve()
+
+        expected = json.load(single_dir / "results.json")
+        results = json.load(member_dir / "results.json")
+
+        assert len(results) == len(expected) == 4
+        for e, r in zip(expected, results):
+            assert e["istep"] == r["istep"]
+            assert e["t"] == r["t"]
+            assert e["u"] == pytest.approx(r["u"])
+
+
+@pytest.mark.integration
+def test_ensemble_eigen_analysis(tmpdir):
+    members = [replace(m, analysis="eigen") for m in MEMBERS]
+
+    mesh = init_ensemble_mesh(members)
+    member_dirs = [tmpdir.mkdir(f"member_{i}") for i in range(len(members))]
+
+    EnsembleEdp(members[0], mesh, tmpdir, member_dirs).resolve()
+
+    for infos, member_dir in zip(members, member_dirs):
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        single_dir = member_dir.mkdir("single")
+        Edp(infos=infos, mesh=mesh, output_dir=single_dir).resolve()
+
+        expected = json.load(single_dir / "results.json")
+        results = json.load(member_dir / "results.json")
+
+        assert len(results) == len(expected) == 4
+        for e, r in zip(expected, results):
+            assert e["istep"] == r["istep"]
+            assert e["t"] == r["t"]
+            assert e["u"] == pytest.approx(r["u"])
+
+
+@pytest.mark.integration
+def test_ensemble_prop_laws(tmpdir):
+    k = PropertyLaw(type="poly", params={"coefs": [1.0, 0.05]})
+    cp = PropertyLaw(type="table", params={"T": [0.0, 50.0], "values": [1.0, 3.0]})
+    members = [replace(m, prop=MatPropsRef(k=k, ro=m.prop.ro, cp=cp), nonlinear_tol=1.0e-10) for m in MEMBERS]
+
+    mesh = init_ensemble_mesh(members)
+    member_dirs = [tmpdir.mkdir(f"member_{i}") for i in range(len(members))]
+
+    EnsembleEdp(members[0], mesh, tmpdir, member_dirs).resolve()
+
+    for infos, member_dir in zip(members, member_dirs):
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        single_dir = member_dir.mkdir("single")
+        Edp(infos=infos, mesh=mesh, output_dir=single_dir).resolve()
+
+        expected = json.load(single_dir / "results.json")
+        results = json.load(member_dir / "results.json")
+
+        assert len(results) == len(expected) == 4
+        for e, r in zip(expected, results):
+            assert e["u"] == pytest.approx(r["u"])
+
+
+@pytest.mark.integration
+def test_ensemble_layers(tmpdir):
+    members = [replace(m, face_conductivity="harmonic") for m in MEMBERS]
+    members[1] = replace(members[1], layers=[Layer(start=0.5, end=1.0, prop=MatPropsRef(k=8.0, ro=1.0, cp=1.0))])
+
+    mesh = init_ensemble_mesh(members)
+    member_dirs = [tmpdir.mkdir(f"member_{i}") for i in range(len(members))]
+
+    EnsembleEdp(members[0], mesh, tmpdir, member_dirs).resolve()
+
+    for infos, member_dir in zip(members, member_dirs):
+        mesh = init_mesh(
+            infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt, layers=infos.layers
+        )
+        single_dir = member_dir.mkdir("single")
+        Edp(infos=infos, mesh=mesh, output_dir=single_dir).resolve()
+
+        expected = json.load(single_dir / "results.json")
+        results = json.load(member_dir / "results.json")
+
+        assert len(results) == len(expected) == 4
+        for e, r in zip(expected, results):
+            assert e["u"] == pytest.approx(r["u"])
+
+
+@pytest.mark.integration
+def test_ensemble_bc_series(tmpdir):
+    members = list(MEMBERS)
+    members[0] = replace(
+        members[0],
+        lbc=BoundaryCondition(
+            type=3, params={"value": TimeSeries(t=np.array([0.0, 60.0]), values=np.array([10.0, 40.0])), "h": 2.0}
+        ),
+    )
+    members[2] = replace(
+        members[2],
+        lbc=BoundaryCondition(
+            type=3,
+            params={"value": 10.0, "h": TimeSeries(t=np.array([0.0, 20.0, 40.0]), values=np.array([2.0, 8.0, 1.0]))},
+        ),
+    )
+
+    mesh = init_ensemble_mesh(members)
+    member_dirs = [tmpdir.mkdir(f"member_{i}") for i in range(len(members))]
+
+    EnsembleEdp(members[0], mesh, tmpdir, member_dirs).resolve()
+
+    for infos, member_dir in zip(members, member_dirs):
+        mesh = init_mesh(infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt)
+        single_dir = member_dir.mkdir("single")
+        Edp(infos=infos, mesh=mesh, output_dir=single_dir).resolve()
+
+        expected = json.load(single_dir / "results.json")
+        results = json.load(member_dir / "results.json")
+
+        assert len(results) == len(expected) == 4
+        for e, r in zip(expected, results):
+            assert e["u"] == pytest.approx(r["u"])
+
+
+@pytest.mark.unitary
+def test_negative_ensemble_bc_series_kind():
+    step = TimeSeries(t=np.array([0.0, 60.0]), values=np.array([10.0, 40.0]), kind="step")
+    linear = TimeSeries(t=np.array([0.0, 60.0]), values=np.array([10.0, 40.0]))
+    members = [
+        replace(MEMBERS[0], lbc=BoundaryCondition(type=3, params={"value": step, "h": 2.0})),
+        replace(MEMBERS[1], lbc=BoundaryCondition(type=3, params={"value": linear, "h": 2.0})),
+    ]
+
+    with pytest.raises(EnsembleInputMismatchError, match="lbc.params.value.kind"):
+        init_ensemble_mesh(members)
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "options, msg",
+    [
+        ({"results_format": "jsonl"}, "O ensemble não aceita o formato de resultados 'jsonl'."),
+        ({"results_format": "npy"}, "O ensemble não aceita o formato de resultados 'npy'."),
+        ({"results_format": "jsonl", "async_writer": True}, "O ensemble não aceita o formato de resultados 'jsonl'."),
+        ({"async_writer": True}, "O ensemble não aceita a escrita em segundo plano."),
+        ({"cells_loop_engine": "numba"}, "O ensemble não aceita o loop sobre as células 'numba'."),
+    ],
+)
+def test_negative_ensemble_options(options, msg):
+    members = [replace(m, **options) for m in MEMBERS]
+
+    with pytest.raises(EnsembleNotSupportedError, match=msg):
+        init_ensemble_mesh(members)
+
+
+@pytest.mark.unitary
+def test_negative_ensemble_amr():
+    members = [replace(m, amr_every=10, amr_refine_tol=1.0) for m in MEMBERS]
+
+    with pytest.raises(AmrNotSupportedError, match="A malha adaptativa não aceita o ensemble."):
+        init_ensemble_mesh(members)
+
+
+@pytest.mark.integration
+def test_ensemble_source(tmpdir):
+    scale = TimeSeries(t=np.array([0.0, 30.0, 60.0]), values=np.array([1.0, 2.0, 0.0]))
+    members = list(MEMBERS)
+    members[0] = replace(members[0], source=Source(type="uniform", params={"value": 5.0, "sp": -0.5}))
+    members[1] = replace(
+        members[1],
+        source=Source(type="regions", params={"regions": [{"start": 0.2, "end": 0.6, "value": 40.0}]}, scale=scale),
+    )
+
+    mesh = init_ensemble_mesh(members)
+    member_dirs = [tmpdir.mkdir(f"member_{i}") for i in range(len(members))]
+
+    assert mesh.source is not None and mesh.source.sc.shape == (3, 6)
+
+    EnsembleEdp(members[0], mesh, tmpdir, member_dirs).resolve()
+
+    for infos, member_dir in zip(members, member_dirs):
+        mesh = init_mesh(
+            infos.length, infos.ndiv, infos.lbc, infos.rbc, infos.prop, infos.initialt, source=infos.source
+        )
+        single_dir = member_dir.mkdir("single")
+        Edp(infos=infos, mesh=mesh, output_dir=single_dir).resolve()
+
+        expected = json.load(single_dir / "results.json")
+        results = json.load(member_dir / "results.json")
+
+        assert len(results) == len(expected) == 4
+        for e, r in zip(expected, results):
+            assert e["u"] == pytest.approx(r["u"])
+
+
+@pytest.mark.unitary
+def test_negative_ensemble_source_scale_kind():
+    step = TimeSeries(t=np.array([0.0, 60.0]), values=np.array([1.0, 2.0]), kind="step")
+    linear = TimeSeries(t=np.array([0.0, 60.0]), values=np.array([1.0, 2.0]))
+    members = [
+        replace(MEMBERS[0], source=Source(type="uniform", params={"value": 1.0}, scale=step)),
+        replace(MEMBERS[1], source=Source(type="uniform", params={"value": 1.0}, scale=linear)),
+    ]
+
+    with pytest.raises(EnsembleInputMismatchError, match="source.scale.kind"):
+        init_ensemble_mesh(members)
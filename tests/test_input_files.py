@@ -1,19 +1,42 @@
+import json
 import os
 from copy import deepcopy
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from pyheat1d.errors import (
+    AmrIndicatorNotFoundError,
+    AmrNotSupportedError,
+    AsyncWriterNotSupportedError,
+    BoundarySeriesError,
+    EigenAnalysisError,
+    FaceConductivityNotFoundError,
+    GradingNotFoundError,
+    LayerError,
+    MeshNodesError,
+    PropertyLawError,
+    SourceError,
+    SteadySingularError,
+)
 from pyheat1d.input_files import (
+    AnalysisTypeNotFoundError,
     BoundaryConditionMissingKeyError,
+    CellsLoopEngineNotFoundError,
     Input,
     InputFileNotFoundError,
     MatPropsMissingKeyError,
     MissingInputInfoError,
+    SolverBackendNotFoundError,
+    SteadyNormNotFoundError,
+    ThetaOutOfRangeError,
     load_input_file,
     validated,
 )
-from pyheat1d.mesh import BoundaryCondition, MatPropsRef
+from pyheat1d.mesh import BoundaryCondition, Grading, Layer, MatPropsRef
+from pyheat1d.properties import PropertyLaw
+from pyheat1d.timeseries import TimeSeries
 
 INPUT = Input(
     length=50.0,
@@ -129,3 +152,392 @@ def test_negative_prop_missing_keys(key):
 
     with pytest.raises(MatPropsMissingKeyError, match=msg):
         validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_cells_loop_engine_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["cells_loop_engine"] = "fortran"
+
+    msg = "A implementação 'fortran' do loop sobre as células não existe."
+
+    with pytest.raises(CellsLoopEngineNotFoundError, match=msg):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_solver_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["solver"] = "gauss"
+
+    with pytest.raises(SolverBackendNotFoundError, match="O solver 'gauss' não existe."):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_steady_norm_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["steady_norm"] = "l3"
+
+    with pytest.raises(SteadyNormNotFoundError, match="A norma 'l3' do critério de regime permanente não existe."):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_analysis_type_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["analysis"] = "modal"
+
+    with pytest.raises(AnalysisTypeNotFoundError, match="O tipo de analise 'modal' não existe."):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_steady_analysis_flux_both_sides():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["analysis"] = "steady"
+    dict_["lbc"] = {"type": 2, "params": {"value": 1.0}}
+    dict_["rbc"] = {"type": 2, "params": {"value": 1.0}}
+
+    with pytest.raises(SteadySingularError):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("theta", [0.0, -0.5, 1.5])
+def test_negative_theta_out_of_range(theta):
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["theta"] = theta
+
+    with pytest.raises(ThetaOutOfRangeError, match="O peso do método θ deve estar no intervalo"):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_grading_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["grading"] = {"type": "cosine", "params": {}}
+
+    with pytest.raises(GradingNotFoundError, match="A distribuição 'cosine' dos tamanhos das células não existe."):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_grading_nodes():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["grading"] = {"type": "nodes", "params": {"x": [0.0, 1.0]}}
+
+    with pytest.raises(MeshNodesError, match="São necessárias 101 coordenadas nodais, foram dadas 2."):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_positive_read_json_with_grading(tmpdir):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["grading"] = {"type": "tanh", "params": {"beta": 2.0}}
+
+    path = Path(tmpdir) / "input.json"
+    path.write_text(json.dumps(dict_), encoding="utf-8")
+
+    infos = load_input_file(path)
+
+    assert infos.grading == Grading(type="tanh", params={"beta": 2.0})
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "values, error, msg",
+    [
+        ({}, MissingInputInfoError, "O valor 'amr_refine_tol' é necessário no arquivo de entrada."),
+        (
+            {"amr_refine_tol": 1.0, "amr_indicator": "laplace"},
+            AmrIndicatorNotFoundError,
+            "O indicador 'laplace' do refinamento adaptativo não existe.",
+        ),
+        (
+            {"amr_refine_tol": 1.0, "results_format": "npy"},
+            AmrNotSupportedError,
+            "A malha adaptativa não aceita o formato de resultados 'npy'.",
+        ),
+        (
+            {"amr_refine_tol": 1.0, "async_writer": True, "results_format": "jsonl"},
+            AmrNotSupportedError,
+            "A malha adaptativa não aceita a escrita em segundo plano.",
+        ),
+        (
+            {"amr_refine_tol": 1.0, "analysis": "eigen"},
+            AmrNotSupportedError,
+            "A malha adaptativa não aceita a analise 'eigen'.",
+        ),
+        (
+            {"amr_refine_tol": 1.0, "adaptive_tol": 1.0e-3},
+            AmrNotSupportedError,
+            "A malha adaptativa não aceita o passo de tempo adaptativo.",
+        ),
+    ],
+)
+def test_negative_amr_options(values, error, msg):
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["amr_every"] = 10
+    dict_.update(values)
+
+    with pytest.raises(error, match=msg):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_positive_read_json_with_prop_laws(tmpdir):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["prop"]["k"] = {"type": "poly", "params": {"coefs": [1.0, 0.01]}}
+    dict_["prop"]["cp"] = {"type": "table", "params": {"T": [0.0, 100.0], "values": [1.0, 2.0]}}
+
+    path = Path(tmpdir) / "input.json"
+    path.write_text(json.dumps(dict_), encoding="utf-8")
+
+    infos = load_input_file(path)
+
+    assert infos.prop.k == PropertyLaw(type="poly", params={"coefs": [1.0, 0.01]})
+    assert infos.prop.cp == PropertyLaw(type="table", params={"T": [0.0, 100.0], "values": [1.0, 2.0]})
+    assert infos.prop_laws == {"k": infos.prop.k, "cp": infos.prop.cp}
+
+
+@pytest.mark.unitary
+def test_negative_prop_law_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["prop"]["k"] = {"type": "spline", "params": {}}
+
+    with pytest.raises(PropertyLawError, match="A lei 'spline' da propriedade 'k' não existe."):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_eigen_analysis_prop_laws():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["analysis"] = "eigen"
+    dict_["prop"]["k"] = {"type": "poly", "params": {"coefs": [1.0, 0.01]}}
+
+    with pytest.raises(
+        EigenAnalysisError, match="A analise 'eigen' não aceita propriedades dependentes da temperatura."
+    ):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_positive_read_json_with_layers(tmpdir):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["layers"] = [{"start": 0.2, "end": 0.6, "prop": {"k": 5.0, "ro": 1.0, "cp": 2.0}}]
+    dict_["face_conductivity"] = "harmonic"
+
+    path = Path(tmpdir) / "input.json"
+    path.write_text(json.dumps(dict_), encoding="utf-8")
+
+    infos = load_input_file(path)
+
+    assert infos.layers == [Layer(start=0.2, end=0.6, prop=MatPropsRef(k=5.0, ro=1.0, cp=2.0))]
+    assert infos.face_conductivity == "harmonic"
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "layer, prop, msg",
+    [
+        ({"start": 0.2, "prop": {"k": 5.0, "ro": 1.0, "cp": 2.0}}, None, "A camada 0 precisa de"),
+        ({"start": 0.6, "end": 0.2, "prop": {"k": 5.0, "ro": 1.0, "cp": 2.0}}, None, "A camada 0 deve ter"),
+        ({"start": 0.2, "end": 60.0, "prop": {"k": 5.0, "ro": 1.0, "cp": 2.0}}, None, "A camada 0 deve ter"),
+        (
+            {
+                "start": 0.2,
+                "end": 0.6,
+                "prop": {"k": {"type": "poly", "params": {"coefs": [1.0]}}, "ro": 1.0, "cp": 2.0},
+            },
+            None,
+            "As camadas não aceitam propriedades dependentes da temperatura.",
+        ),
+        (
+            {"start": 0.2, "end": 0.6, "prop": {"k": 5.0, "ro": 1.0, "cp": 2.0}},
+            {"k": 1.0, "ro": 2.0, "cp": {"type": "poly", "params": {"coefs": [1.0]}}},
+            "As camadas não aceitam propriedades dependentes da temperatura.",
+        ),
+    ],
+)
+def test_negative_layers(layer, prop, msg):
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["layers"] = [layer]
+    if prop is not None:
+        dict_["prop"] = prop
+
+    with pytest.raises(LayerError, match=msg):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_face_conductivity_not_found():
+    dict_ = deepcopy(DICT_INPUT)
+
+    dict_["face_conductivity"] = "geometric"
+
+    with pytest.raises(
+        FaceConductivityNotFoundError, match="A média 'geometric' da condutividade nas faces não existe."
+    ):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_positive_read_json_with_bc_series(tmpdir):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["lbc"]["params"]["value"] = {"file": "plant.csv", "kind": "step"}
+    dict_["rbc"]["params"]["h"] = {"t": [0.0, 100.0], "values": [1.0, 5.0]}
+
+    base_dir = Path(tmpdir)
+    (base_dir / "plant.csv").write_text("t,value\n0.0,10.0\n60.0,30.0\n", encoding="utf-8")
+    path = base_dir / "input.json"
+    path.write_text(json.dumps(dict_), encoding="utf-8")
+
+    infos = load_input_file(path)
+
+    value, h = infos.lbc.params["value"], infos.rbc.params["h"]
+    assert isinstance(value, TimeSeries) and isinstance(h, TimeSeries)
+    assert value.kind == "step"
+    assert value.values.tolist() == [10.0, 30.0]
+    assert h.t.tolist() == [0.0, 100.0]
+    assert infos.rbc.params["value"] == 30.0
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "values, error, msg",
+    [
+        ({"kind": "cubic"}, BoundarySeriesError, "A interpolação 'cubic' da série temporal não existe."),
+        ({"t": [1.0, 0.0]}, BoundarySeriesError, "A série temporal precisa de tempos crescentes"),
+        ({"analysis": "steady"}, BoundarySeriesError, "A analise 'steady' não aceita condições de contorno"),
+        ({"analysis": "eigen"}, EigenAnalysisError, "A analise 'eigen' não aceita condições de contorno"),
+    ],
+)
+def test_negative_bc_series(values, error, msg):
+    dict_ = deepcopy(DICT_INPUT)
+
+    series = {"t": [0.0, 1.0], "values": [10.0, 20.0]}
+    series.update({key: value for key, value in values.items() if key != "analysis"})
+    dict_["lbc"]["params"]["value"] = series
+    if "analysis" in values:
+        dict_["analysis"] = values["analysis"]
+
+    with pytest.raises(error, match=msg):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_bc_series_file_not_found(tmpdir):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["lbc"]["params"]["value"] = {"file": "plant.csv"}
+
+    path = Path(tmpdir) / "input.json"
+    path.write_text(json.dumps(dict_), encoding="utf-8")
+
+    with pytest.raises(BoundarySeriesError, match="O arquivo da série temporal não foi achado"):
+        load_input_file(path)
+
+
+@pytest.mark.unitary
+def test_positive_read_json_with_source(tmpdir):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["source"] = {
+        "type": "cells",
+        "params": {"file": "q.npy", "sp": -1.0},
+        "scale": {"t": [0.0, 100.0], "values": [1.0, 0.0], "kind": "step"},
+    }
+
+    base_dir = Path(tmpdir)
+    np.save(base_dir / "q.npy", np.linspace(0.0, 1.0, 100))
+    path = base_dir / "input.json"
+    path.write_text(json.dumps(dict_), encoding="utf-8")
+
+    infos = load_input_file(path)
+
+    assert infos.source is not None
+    assert infos.source.type == "cells"
+    assert infos.source.params["values"].tolist() == np.linspace(0.0, 1.0, 100).tolist()
+    assert infos.source.params["sp"] == -1.0
+    assert isinstance(infos.source.scale, TimeSeries)
+    assert infos.source.scale.kind == "step"
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "values, error, msg",
+    [
+        ({"type": "joule"}, SourceError, "O tipo 'joule' do termo fonte não existe."),
+        ({"params": {"value": 1.0, "sp": 2.0}}, SourceError, "O coeficiente 'sp' do termo fonte linearizado"),
+        ({"analysis": "steady"}, SourceError, "A analise 'steady' não aceita termo fonte que depende do tempo."),
+        ({"analysis": "eigen"}, EigenAnalysisError, "A analise 'eigen' não aceita termo fonte que depende do tempo"),
+    ],
+)
+def test_negative_source(values, error, msg):
+    dict_ = deepcopy(DICT_INPUT)
+
+    source = {"type": "uniform", "params": {"value": 1.0}, "scale": {"t": [0.0, 1.0], "values": [0.0, 1.0]}}
+    source.update({key: value for key, value in values.items() if key != "analysis"})
+    dict_["source"] = source
+    if "analysis" in values:
+        dict_["analysis"] = values["analysis"]
+
+    with pytest.raises(error, match=msg):
+        validated(dict_)
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("analysis", ["steady", "eigen"])
+def test_positive_constant_source_steady_and_eigen(analysis):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["source"] = {"type": "regions", "params": {"regions": [{"start": 10.0, "end": 20.0, "value": 5.0}]}}
+    dict_["analysis"] = analysis
+
+    validated(dict_)
+
+
+@pytest.mark.unitary
+def test_negative_async_writer_json():
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["async_writer"] = True
+
+    with pytest.raises(AsyncWriterNotSupportedError, match="A escrita em segundo plano não aceita o formato"):
+        validated(dict_)
+
+    dict_["results_format"] = "jsonl"
+    validated(dict_)
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "values, msg",
+    [
+        ({"eigen_modes": 0}, "A analise 'eigen' não aceita 'eigen_modes' menor que 1."),
+        (
+            {
+                "eigen_modes": 5,
+                "rbc": {"type": 2, "params": {"value": 0.0}},
+                "lbc": {"type": 2, "params": {"value": 1.0}},
+            },
+            "A analise 'eigen' não aceita 'eigen_modes' com fluxo prescrito nos dois contornos.",
+        ),
+    ],
+)
+def test_negative_eigen_modes(values, msg):
+    dict_ = deepcopy(DICT_INPUT)
+    dict_["analysis"] = "eigen"
+    dict_.update(values)
+
+    with pytest.raises(EigenAnalysisError, match=msg):
+        validated(dict_)
@@ -0,0 +1,22 @@
+import pytest
+
+from pyheat1d import jit
+from pyheat1d.jit import compile_kernel
+
+
+def _add(x, y):
+    return x + y
+
+
+@pytest.mark.unitary
+def test_compile_kernel():
+    kernel = compile_kernel(_add)
+
+    assert kernel(1.0, 2.0) == 3.0
+
+
+@pytest.mark.unitary
+def test_compile_kernel_without_numba(monkeypatch):
+    monkeypatch.setattr(jit, "numba", None)
+
+    assert compile_kernel(_add) is _add
@@ -1,17 +1,22 @@
 import numpy as np
 import pytest
 
-from pyheat1d.mesh import BoundaryCondition, MatProps, Mesh
+from pyheat1d.errors import GradingNotFoundError, MeshNodesError
+from pyheat1d.mesh import BoundaryCondition, Grading, Layer, MatProps, MatPropsRef, Mesh, cell_widths, init_mesh
 
 
-def test_mesh_must_be_a_single_instance():
+@pytest.mark.unitary
+def test_meshes_are_independent_instances():
     lbc = BoundaryCondition(type=1, params={"value": 10.0})
     rbc = BoundaryCondition(type=3, params={"value": 30.0, "h": 1.0})
 
     m1 = Mesh(1.0, 10, lbc, rbc)
-    m2 = Mesh(1.0, 10, lbc, rbc)
+    m2 = Mesh(2.0, 20, lbc, rbc)
 
-    assert id(m1) == id(m2)
+    assert m1 is not m2
+    assert m1.n_cells == 10
+    assert m2.n_cells == 20
+    assert m2.cells.results.u.shape == (20,)
 
 
 @pytest.mark.unitary
@@ -213,3 +218,120 @@ def test_update_results_cells_by_arary_values(mesh):
 
     for i in range(mesh.n_cells):
         assert mesh.cells.results.u[i] == new_u[i]
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "grading",
+    [
+        Grading(type="geometric", params={"ratio": 1.2}),
+        Grading(type="geometric", params={"ratio": 1.2, "symmetric": True}),
+        Grading(type="tanh", params={"beta": 2.0}),
+        Grading(type="nodes", params={"x": [0.0, 0.1, 0.3, 0.6, 1.0]}),
+    ],
+)
+def test_cell_widths_graded(grading):
+    dx = cell_widths(1.0, 4, grading)
+
+    assert dx.shape == (4,)
+    assert np.all(dx > 0.0)
+    assert dx.sum() == pytest.approx(1.0)
+
+
+@pytest.mark.unitary
+def test_cell_widths_geometric():
+    dx = cell_widths(1.0, 3, Grading(type="geometric", params={"ratio": 2.0}))
+
+    np.testing.assert_allclose(dx, [1.0 / 7.0, 2.0 / 7.0, 4.0 / 7.0])
+
+    dx = cell_widths(1.0, 5, Grading(type="geometric", params={"ratio": 2.0, "symmetric": True}))
+
+    np.testing.assert_allclose(dx, np.array([1.0, 2.0, 4.0, 2.0, 1.0]) / 10.0)
+
+
+@pytest.mark.unitary
+def test_cell_widths_tanh_is_fine_at_both_boundaries():
+    dx = cell_widths(1.0, 20, Grading(type="tanh", params={"beta": 2.0}))
+
+    np.testing.assert_allclose(dx, dx[::-1])
+    assert dx[0] < dx[10] / 5
+
+
+@pytest.mark.unitary
+def test_cell_widths_uniform():
+    expected = np.full(10, 0.1)
+
+    np.testing.assert_array_equal(cell_widths(1.0, 10), expected)
+    np.testing.assert_array_equal(cell_widths(1.0, 10, Grading(type="uniform", params={})), expected)
+
+
+@pytest.mark.unitary
+def test_graded_grid():
+    mesh = Mesh(
+        1.0,
+        3,
+        lbc=BoundaryCondition(type=1, params={"value": 10.0}),
+        rbc=BoundaryCondition(type=1, params={"value": 10.0}),
+        grading=Grading(type="nodes", params={"x": [0.0, 0.2, 0.6, 1.0]}),
+    )
+
+    mesh.mk_grid()
+
+    np.testing.assert_allclose(mesh.nodes.x, [0.0, 0.2, 0.6, 1.0])
+    np.testing.assert_allclose(mesh.dx, [0.2, 0.4, 0.4])
+    np.testing.assert_allclose(mesh.cells.centroids, [0.1, 0.4, 0.8])
+    np.testing.assert_allclose(mesh.dxf, np.diff(mesh.cells.centroids))
+    assert mesh.infos["dx"] == pytest.approx(0.2)
+
+
+@pytest.mark.unitary
+def test_negative_grading_not_found():
+    with pytest.raises(GradingNotFoundError, match="A distribuição 'cosine' dos tamanhos das células não existe."):
+        cell_widths(1.0, 10, Grading(type="cosine", params={}))
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "x, msg",
+    [
+        ([0.0, 0.5, 1.0], "São necessárias 4 coordenadas nodais, foram dadas 3."),
+        ([0.1, 0.2, 0.5, 1.0], "As coordenadas nodais devem ir de 0 até 1.0."),
+        ([0.0, 0.5, 0.4, 1.0], "As coordenadas nodais devem ser crescentes."),
+    ],
+)
+def test_negative_grading_nodes(x, msg):
+    with pytest.raises(MeshNodesError, match=msg):
+        cell_widths(1.0, 3, Grading(type="nodes", params={"x": x}))
+
+
+@pytest.mark.unitary
+def test_init_mesh_layers():
+    lbc = BoundaryCondition(type=1, params={"value": 10.0})
+    rbc = BoundaryCondition(type=1, params={"value": 30.0})
+    layers = [Layer(start=0.35, end=1.0, prop=MatPropsRef(k=4.0, ro=3.0, cp=2.0))]
+
+    mesh = init_mesh(1.0, 10, lbc, rbc, MatPropsRef(k=1.0, ro=1.0, cp=1.0), 0.0, layers=layers)
+    props = mesh.cells.props
+
+    assert props.k[:3].tolist() == props.ro[:3].tolist() == props.cp[:3].tolist() == [1.0] * 3
+    assert props.k[4:].tolist() == [4.0] * 6
+    assert props.ro[4:].tolist() == [3.0] * 6
+    assert props.cp[4:].tolist() == [2.0] * 6
+    # ... metade da célula 3 está na camada
+    assert props.ro[3] == pytest.approx(2.0)
+    assert props.ro[3] * props.cp[3] == pytest.approx(0.5 * 1.0 + 0.5 * 6.0)
+    assert props.k[3] == pytest.approx(1.0 / (0.5 / 1.0 + 0.5 / 4.0))
+
+
+@pytest.mark.unitary
+def test_update_layers_ensemble_member():
+    lbc = BoundaryCondition(type=1, params={"value": 10.0})
+    rbc = BoundaryCondition(type=1, params={"value": 30.0})
+    mesh = Mesh(1.0, 4, lbc, rbc, n_batch=2)
+    mesh.mk_grid()
+    for name in ("k", "ro", "cp"):
+        mesh.update_prop(prop_name=name, value=1.0)
+
+    mesh.update_layers([Layer(start=0.5, end=1.0, prop=MatPropsRef(k=2.0, ro=1.0, cp=1.0))], member=1)
+
+    assert mesh.cells.props.k.tolist() == [[1.0, 1.0, 1.0, 1.0], [1.0, 1.0, 2.0, 2.0]]
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from pyheat1d import modal
+from pyheat1d.errors import EigenAnalysisError
+from pyheat1d.modal import modal_decomposition, tridiagonal_to_dense
+
+
+@pytest.mark.unitary
+def test_tridiagonal_to_dense():
+    a = np.array(
+        [
+            [0.0, 2.0, -1.0],
+            [-1.0, 2.0, -1.0],
+            [-1.0, 3.0, 0.0],
+        ]
+    )
+
+    expected = np.array(
+        [
+            [2.0, -1.0, 0.0],
+            [-1.0, 2.0, -1.0],
+            [0.0, -1.0, 3.0],
+        ]
+    )
+
+    np.testing.assert_array_equal(tridiagonal_to_dense(a), expected)
+    np.testing.assert_array_equal(tridiagonal_to_dense(np.stack([a, a])), np.stack([expected, expected]))
+
+
+@pytest.mark.unitary
+def test_modal_decomposition_limits():
+    a = np.array(
+        [
+            [0.0, 3.0, -1.0],
+            [-1.0, 2.0, -1.0],
+            [-1.0, 3.0, 0.0],
+        ]
+    )
+    b = np.array([20.0, 0.0, 4.0])
+    mass = np.array([1.0, 2.0, 0.5])
+    u0 = np.array([1.0, 2.0, 3.0])
+
+    modes = modal_decomposition(a, b, mass, u0)
+
+    np.testing.assert_allclose(modes.field(0.0), u0)
+    np.testing.assert_allclose(modes.field(1.0e3), np.linalg.solve(tridiagonal_to_dense(a), b))
+
+
+@pytest.mark.unitary
+def test_modal_decomposition_null_mode():
+    # ... fluxo prescrito nos dois contornos, a energia cresce linearmente
+    a = np.array(
+        [
+            [0.0, 1.0, -1.0],
+            [-1.0, 2.0, -1.0],
+            [-1.0, 1.0, 0.0],
+        ]
+    )
+    b = np.array([1.0, 0.0, 2.0])
+    mass = np.array([1.0, 1.0, 1.0])
+    u0 = np.zeros(3)
+
+    modes = modal_decomposition(a, b, mass, u0)
+
+    for t in (0.5, 10.0):
+        assert np.sum(mass * modes.field(t)) == pytest.approx(b.sum() * t)
+
+
+def _heat_system(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    a = np.zeros((n, 3))
+    a[:, 0], a[:, 1], a[:, 2] = -1.0, 2.0, -1.0
+    a[0, 0] = a[-1, 2] = 0.0
+    a[0, 1] = a[-1, 1] = 3.0
+    b = np.zeros(n)
+    b[0] = 40.0
+    return a, b, np.linspace(1.0, 2.0, n), np.zeros(n)
+
+
+@pytest.mark.unitary
+def test_modal_decomposition_leading_modes():
+    a, b, mass, u0 = _heat_system(50)
+    steady = np.linalg.solve(tridiagonal_to_dense(a), b)
+
+    full = modal_decomposition(a, b, mass, u0)
+    leading = modal_decomposition(a, b, mass, u0, n_modes=5, steady=steady)
+
+    assert leading.eigenvectors.shape == (50, 5)
+    np.testing.assert_allclose(leading.eigenvalues, full.eigenvalues[:5])
+    np.testing.assert_allclose(leading.field(500.0), full.field(500.0), atol=1.0e-8)
+
+
+@pytest.mark.unitary
+def test_modal_decomposition_dense_without_scipy(monkeypatch):
+    a, b, mass, u0 = _heat_system(6)
+    expected = modal_decomposition(a, b, mass, u0).field(0.5)
+
+    monkeypatch.setattr(modal, "eigh_tridiagonal", None)
+    np.testing.assert_allclose(modal_decomposition(a, b, mass, u0).field(0.5), expected)
+
+    monkeypatch.setattr(modal, "DENSE_MAX_CELLS", 5)
+    with pytest.raises(EigenAnalysisError, match="A analise 'eigen' não aceita malhas com mais de 5 células"):
+        modal_decomposition(a, b, mass, u0)
@@ -0,0 +1,117 @@
+import json
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from pyheat1d.errors import FileMeshNotFoundError
+from pyheat1d.plotting import downsample, load_xp, parse_steps, render_steps, style_axes
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "steps, n, expected",
+    [
+        ("0, 10", None, [0, 10]),
+        ("0, -1", 5, [0, -1]),
+        (":", 4, [0, 1, 2, 3]),
+        ("0:10:4", 20, [0, 4, 8]),
+        ("8:, 0", 10, [8, 9, 0]),
+    ],
+)
+def test_parse_steps(steps, n, expected):
+    assert parse_steps(steps, n) == expected
+
+
+@pytest.mark.unitary
+def test_downsample_keeps_small_curves():
+    x, y = np.arange(10.0), np.arange(10.0)
+
+    xd, yd = downsample(x, y, max_points=10)
+
+    assert xd is x
+    assert yd is y
+
+
+@pytest.mark.unitary
+def test_downsample_preserves_extremes():
+    x = np.linspace(0.0, 1.0, 100_001)
+    y = np.sin(20 * x)
+    y[12_345] = 50.0
+    y[67_890] = -50.0
+
+    xd, yd = downsample(x, y, max_points=200)
+
+    assert len(xd) == len(yd) == 200
+    assert np.all(np.diff(xd) >= 0.0)
+    assert yd.max() == 50.0
+    assert yd.min() == -50.0
+    assert xd[0] == 0.0
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("fmt", ["png", "svg"])
+def test_render_steps(tmpdir, fmt):
+    path = Path(tmpdir) / f"fig.{fmt}"
+    xp = np.linspace(0.0, 1.0, 50)
+
+    render_steps(xp, ((t, np.full(50, t)) for t in (0.0, 1.0)), path, max_points=10)
+
+    assert path.stat().st_size > 0
+
+
+@pytest.mark.unitary
+def test_load_xp_reads_only_xp(monkeypatch):
+    path = Path("tests/files/output")
+    expected = json.loads((path / "mesh.json").read_text())["xp"]
+
+    parsed = []
+    loads = json.loads
+
+    def loads_(doc, *args, **kwargs):
+        parsed.append(bytes(doc))
+        return loads(doc, *args, **kwargs)
+
+    monkeypatch.setattr(json, "load", lambda *args, **kwargs: pytest.fail("mesh.json lido inteiro"))
+    monkeypatch.setattr(json, "loads", loads_)
+
+    xp = load_xp(path)
+
+    np.testing.assert_array_equal(xp, expected)
+    assert len(parsed) == 1
+    assert parsed[0].startswith(b"[") and b"cell_nodes" not in parsed[0]
+
+
+@pytest.mark.unitary
+def test_negative_load_xp_mesh_not_found(tmpdir):
+    with pytest.raises(FileMeshNotFoundError):
+        load_xp(Path(tmpdir))
+
+
+@pytest.mark.unitary
+def test_render_steps_with_step_centroids(tmpdir):
+    path = Path(tmpdir) / "fig.png"
+    xp = np.linspace(0.0, 1.0, 50)
+
+    fields = [(0.0, np.zeros(50)), (1.0, np.ones(80), np.linspace(0.0, 1.0, 80))]
+    render_steps(xp, fields, path)
+
+    assert path.stat().st_size > 0
+
+
+@pytest.mark.unitary
+def test_style_axes_legend_only_with_labels():
+    ax = Figure().subplots()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        style_axes(ax)
+
+    assert ax.get_legend() is None
+
+    ax.plot([0.0, 1.0], [0.0, 1.0], label="t = 0")
+    style_axes(ax)
+
+    assert ax.get_legend() is not None
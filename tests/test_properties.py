@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pyheat1d.errors import PropertyLawError
+from pyheat1d.properties import PropertyLaw, property_law
+
+
+@pytest.mark.unitary
+def test_property_law_table():
+    law = PropertyLaw(type="table", params={"T": [0.0, 100.0, 200.0], "values": [1.0, 2.0, 4.0]})
+
+    np.testing.assert_allclose(law(np.array([-10.0, 50.0, 150.0, 300.0])), [1.0, 1.5, 3.0, 4.0])
+    assert law(np.ones((2, 3)) * 100.0).shape == (2, 3)
+
+
+@pytest.mark.unitary
+def test_property_law_poly():
+    law = PropertyLaw(type="poly", params={"coefs": [1.0, 0.5, 0.25]})
+
+    np.testing.assert_allclose(law(np.array([0.0, 2.0])), [1.0, 3.0])
+    assert law(20.0) == pytest.approx(111.0)
+
+
+@pytest.mark.unitary
+def test_property_law_constant_value():
+    assert property_law("k", 2.0) == 2.0
+    assert property_law("k", {"type": "poly", "params": {"coefs": [1.0]}}) == PropertyLaw(
+        type="poly", params={"coefs": [1.0]}
+    )
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "name, value, msg",
+    [
+        (
+            "ro",
+            {"type": "poly", "params": {"coefs": [1.0]}},
+            "A propriedade 'ro' não aceita leis dependentes da temperatura.",
+        ),
+        ("k", {"type": "spline", "params": {}}, "A lei 'spline' da propriedade 'k' não existe."),
+        ("cp", {"params": {}}, "A lei da propriedade 'cp' precisa de 'type' e 'params'."),
+        (
+            "k",
+            {"type": "table", "params": {"T": [0.0, 0.0], "values": [1.0, 2.0]}},
+            "A tabela da propriedade 'k' precisa de temperaturas crescentes e um valor por temperatura.",
+        ),
+        (
+            "k",
+            {"type": "table", "params": {"T": [0.0, 1.0], "values": [1.0]}},
+            "A tabela da propriedade 'k' precisa de temperaturas crescentes e um valor por temperatura.",
+        ),
+    ],
+)
+def test_negative_property_law(name, value, msg):
+    with pytest.raises(PropertyLawError, match=msg):
+        property_law(name, value)
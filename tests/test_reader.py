@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyheat1d.errors import FileResultshNotFoundError
+from pyheat1d.reader import (
+    ChunkedResultsReader,
+    JsonLinesResultsReader,
+    JsonResultsReader,
+    NpyResultsReader,
+    open_results,
+)
+from pyheat1d.writer import RESULTS_FILES, results_writer_strategy
+
+READERS = {
+    "json": JsonResultsReader,
+    "jsonl": JsonLinesResultsReader,
+    "npy": NpyResultsReader,
+    "chunked": ChunkedResultsReader,
+}
+
+NSTEP = 10
+
+HISTORY = np.arange((NSTEP + 1) * 4, dtype=float).reshape(NSTEP + 1, 4) / 3.0
+
+
+def _write(output_dir: Path, results_format: str) -> None:
+    path = output_dir / RESULTS_FILES[results_format]
+    writer = results_writer_strategy(
+        path, write_every_steps=2, results_format=results_format, nstep=NSTEP, chunk_steps=2, chunk_cells=3
+    )
+    with writer:
+        for istep, u in enumerate(HISTORY):
+            writer.append_in_buffer(istep, 0.5 * istep, u)
+        writer.dump()
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("results_format", READERS)
+def test_results_reader(tmpdir, results_format):
+    output_dir = Path(tmpdir)
+    _write(output_dir, results_format)
+
+    with open_results(output_dir) as reader:
+        assert isinstance(reader, READERS[results_format])
+
+        assert len(reader) == 6
+        assert reader.istep.tolist() == [0, 2, 4, 6, 8, 10]
+        assert reader.t.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+        np.testing.assert_array_equal(reader.step(1), HISTORY[2])
+        np.testing.assert_array_equal(reader.step(-1), HISTORY[10])
+        np.testing.assert_array_equal(reader.steps(1, 3), HISTORY[2:6:2])
+        np.testing.assert_array_equal(reader.cell(2), HISTORY[::2, 2])
+
+        assert reader.index_of(4) == 2
+        assert reader.nearest(2.4) == 2
+        assert reader.nearest(2.6) == 3
+        assert reader.nearest(-1.0) == 0
+        assert reader.nearest(100.0) == 5
+        np.testing.assert_array_equal(reader.at_time(0.9), HISTORY[2])
+
+        with pytest.raises(IndexError):
+            reader.step(6)
+
+        with pytest.raises(IndexError):
+            reader.index_of(3)
+
+
+@pytest.mark.unitary
+def test_results_reader_json_without_istep():
+    with open_results(Path("tests/files/output/")) as reader:
+        results = json.load(Path("tests/files/output/results.json").open())
+
+        assert len(reader) == len(results)
+        assert reader.istep.tolist() == list(range(len(results)))
+        assert reader.t.tolist() == [r["t"] for r in results]
+        np.testing.assert_array_equal(reader.step(10), results[10]["u"])
+
+
+@pytest.mark.unitary
+def test_negative_open_results_not_found(tmpdir):
+    with pytest.raises(FileResultshNotFoundError):
+        open_results(Path(tmpdir))
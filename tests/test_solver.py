@@ -1,8 +1,31 @@
+import numpy as np
 import pytest
 
-from pyheat1d.solver import Solver
+from pyheat1d.errors import SolverBackendNotAvailableError, SolverBackendNotFoundError
+from pyheat1d.solver import (
+    SOLVER_BACKENDS,
+    Solver,
+    _tdma,
+    _tdma_compiled,
+    _tdma_factorize,
+    _tdma_factorize_compiled,
+    _tdma_substitution,
+    _tdma_substitution_compiled,
+)
 from pyheat1d.system import System
 
+try:
+    import scipy  # type: ignore # noqa: F401
+
+    HAS_SCIPY = True
+except ImportError:  # pragma: no cover
+    HAS_SCIPY = False
+
+BACKENDS = [
+    pytest.param(name, marks=pytest.mark.skipif(name == "lapack" and not HAS_SCIPY, reason="scipy não instalado"))
+    for name in SOLVER_BACKENDS
+]
+
 
 @pytest.mark.unitary
 def test_solver():
@@ -46,7 +69,8 @@ def test_solver():
         "neq=4",
     ],
 )
-def test_solver_tdma(lower, diag, upper, b, e_x):
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_solver_tdma(lower, diag, upper, b, e_x, backend):
     neq = len(e_x)
     system = System(neq)
 
@@ -56,7 +80,70 @@ def test_solver_tdma(lower, diag, upper, b, e_x):
         system.a[i, 2] = upper[i]
         system.b[i] = b[i]
 
-    x = Solver(system=system).solver()
+    x = Solver(system=system, backend=backend).solver()
 
     for i in range(neq):
         assert x[i] == pytest.approx(e_x[i])
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_solver_factorized(backend):
+    neq = 4
+    system = System(neq)
+
+    system.a[:, 0] = [0.0, -1.0, -1.0, -1.0]
+    system.a[:, 1] = [5.0, 5.0, 5.0, 5.0]
+    system.a[:, 2] = [-1.0, -1.0, -1.0, 0.0]
+    a = system.a.copy()
+
+    solv = Solver(system=system, backend=backend)
+    solv.factorize()
+
+    assert (system.a == a).all()
+
+    for b, e_x in (
+        ([5.5, 5.0, 11.5, 16.5], [1.5, 2.0, 3.5, 4]),
+        ([4.0, 3.0, 3.0, 4.0], [1.0, 1.0, 1.0, 1.0]),
+    ):
+        system.b[:] = b
+        x = solv.solver_factorized()
+
+        for i in range(neq):
+            assert x[i] == pytest.approx(e_x[i])
+
+
+@pytest.mark.unitary
+def test_compiled_kernels_match_python():
+    rng = np.random.default_rng(7)
+
+    neq = 50
+    a = np.empty((neq, 3))
+    a[:, 0] = -rng.uniform(0.5, 1.0, neq)
+    a[:, 2] = -rng.uniform(0.5, 1.0, neq)
+    a[:, 1] = 3.0
+    a[0, 0] = a[-1, 2] = 0.0
+    b = rng.uniform(-1.0, 1.0, neq)
+
+    assert np.array_equal(_tdma_compiled(a.copy(), b), _tdma(a.copy(), b))
+
+    factors = _tdma_factorize(a)
+    factors_compiled = _tdma_factorize_compiled(a)
+    for e, r in zip(factors, factors_compiled):
+        assert np.array_equal(e, r)
+
+    assert np.array_equal(_tdma_substitution_compiled(*factors, b), _tdma_substitution(*factors, b))
+
+
+@pytest.mark.unitary
+def test_negative_solver_backend_not_found():
+    with pytest.raises(SolverBackendNotFoundError, match="O solver 'gauss' não existe."):
+        Solver(system=System(neq=3), backend="gauss")
+
+
+@pytest.mark.unitary
+def test_negative_solver_backend_not_available(monkeypatch):
+    monkeypatch.setattr("pyheat1d.solver.lapack", None)
+
+    with pytest.raises(SolverBackendNotAvailableError, match="O solver 'lapack' precisa do pacote 'scipy'"):
+        Solver(system=System(neq=3), backend="lapack")
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyheat1d.errors import BoundarySeriesError, SourceError
+from pyheat1d.source import Source, check_source, load_source, source_profile, source_terms
+from pyheat1d.timeseries import TimeSeries
+
+
+@pytest.mark.unitary
+def test_source_terms_uniform():
+    x = np.array([0.0, 0.1, 0.3, 0.6, 1.0])
+
+    terms = source_terms(Source(type="uniform", params={"value": 10.0, "sp": -2.0}), x)
+
+    np.testing.assert_array_equal(terms.sc, 10.0 * np.diff(x))
+    np.testing.assert_array_equal(terms.sp, -2.0 * np.diff(x))
+    assert terms.scale == 1.0
+
+
+@pytest.mark.unitary
+def test_source_terms_regions():
+    x = np.linspace(0.0, 1.0, 11)
+    source = Source(
+        type="regions",
+        params={
+            "regions": [
+                {"start": 0.25, "end": 0.55, "value": 2.0},
+                {"start": 0.5, "end": 1.0, "value": 1.0, "sp": -1.0},
+            ]
+        },
+    )
+
+    terms = source_terms(source, x)
+
+    np.testing.assert_allclose(terms.sc, [0.0, 0.0, 0.1, 0.2, 0.2, 0.2, 0.1, 0.1, 0.1, 0.1], atol=1.0e-15)
+    np.testing.assert_allclose(terms.sp, [0.0] * 5 + [-0.1] * 5, atol=1.0e-15)
+
+
+@pytest.mark.unitary
+def test_source_profile_cells_on_other_mesh():
+    x = np.linspace(0.0, 1.0, 11)
+    profile = source_profile(Source(type="cells", params={"values": np.arange(10.0)}), x)
+
+    sc, _ = profile.integrate(x)
+    np.testing.assert_array_equal(sc, np.arange(10.0) * np.diff(x))
+
+    # ... a integral em uma malha diferente conserva a energia gerada
+    coarse, _ = profile.integrate(np.array([0.0, 0.25, 0.5, 1.0]))
+    np.testing.assert_allclose(
+        coarse, [0.1 * (0 + 1) + 0.05 * 2, 0.05 * 2 + 0.1 * (3 + 4), 0.1 * np.arange(5, 10).sum()]
+    )
+
+
+@pytest.mark.unitary
+def test_load_source_files(tmpdir):
+    base_dir = Path(tmpdir)
+    (base_dir / "q.csv").write_text("q\n1.0\n2.0\n3.0\n", encoding="utf-8")
+    np.save(base_dir / "q.npy", np.array([1.0, 2.0, 3.0]))
+    (base_dir / "scale.csv").write_text("t,value\n0.0,0.0\n10.0,1.0\n", encoding="utf-8")
+
+    csv = load_source({"type": "cells", "params": {"file": "q.csv"}}, 1.0, 3, base_dir)
+    npy = load_source(
+        {"type": "cells", "params": {"file": str(base_dir / "q.npy")}, "scale": {"file": "scale.csv"}}, 1.0, 3, base_dir
+    )
+
+    assert csv.params["values"].tolist() == npy.params["values"].tolist() == [1.0, 2.0, 3.0]
+    assert csv.scale is None
+    assert isinstance(npy.scale, TimeSeries)
+    assert npy.scale.values.tolist() == [0.0, 1.0]
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "spec, msg",
+    [
+        ({"type": "uniform"}, "O termo fonte precisa de 'type' e 'params'."),
+        ({"type": "joule", "params": {}}, "O tipo 'joule' do termo fonte não existe."),
+        ({"type": "uniform", "params": {}}, "O termo fonte 'uniform' precisa de 'value'."),
+        ({"type": "uniform", "params": {"value": 1.0, "sp": 1.0}}, "O coeficiente 'sp' do termo fonte linearizado"),
+        ({"type": "regions", "params": {"regions": [{"start": 0.0, "value": 1.0}]}}, "A região 0 do termo fonte"),
+        (
+            {"type": "regions", "params": {"regions": [{"start": 0.5, "end": 2.0, "value": 1.0}]}},
+            "A região 0 do termo fonte deve ter 0 <= start < end <= 1.0.",
+        ),
+        ({"type": "cells", "params": {}}, "O termo fonte 'cells' precisa de 'values' ou 'file'."),
+        ({"type": "cells", "params": {"values": [1.0, 2.0]}}, "O termo fonte 'cells' precisa de 3 valores em 'values'"),
+        ({"type": "cells", "params": {"values": [1.0] * 3, "sp": [0.0, -1.0, 1.0]}}, "O coeficiente 'sp'"),
+    ],
+)
+def test_negative_check_source(spec, msg):
+    with pytest.raises(SourceError, match=msg):
+        check_source(spec, 1.0, 3)
+
+
+@pytest.mark.unitary
+def test_negative_source_scale():
+    spec = {"type": "uniform", "params": {"value": 1.0}, "scale": {"file": "scale.csv", "kind": "cubic"}}
+
+    with pytest.raises(BoundarySeriesError, match="A interpolação 'cubic' da série temporal não existe."):
+        check_source(spec, 1.0, 3)
+
+
+@pytest.mark.unitary
+def test_negative_load_source_file(tmpdir):
+    base_dir = Path(tmpdir)
+    np.save(base_dir / "q.npy", np.array([1.0, 2.0]))
+
+    with pytest.raises(SourceError, match="O arquivo do termo fonte não foi achado"):
+        load_source({"type": "cells", "params": {"file": "missing.csv"}}, 1.0, 3, base_dir)
+
+    with pytest.raises(SourceError, match="O termo fonte 'cells' precisa de 3 valores em 'file', foram dados 2."):
+        load_source({"type": "cells", "params": {"file": "q.npy"}}, 1.0, 3, base_dir)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from pyheat1d.steady import SteadyCriterion
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "norm, expected",
+    [
+        ("inf", 4.0),
+        ("l2", np.sqrt(24.0 / 4.0)),
+        ("l1", 2.0),
+    ],
+)
+def test_steady_criterion_residual(norm, expected):
+    criterion = SteadyCriterion(tol=1.0, norm=norm)
+
+    u_prev = np.zeros(4)
+    u = np.array([0.0, -2.0, 2.0, 4.0])
+
+    assert criterion.residual(u, u_prev) == pytest.approx(expected)
+
+
+@pytest.mark.unitary
+def test_steady_criterion_must_check():
+    criterion = SteadyCriterion(tol=1.0, check_every=3)
+
+    assert [step for step in range(1, 10) if criterion.must_check(step)] == [3, 6, 9]
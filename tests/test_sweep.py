@@ -0,0 +1,123 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyheat1d.errors import InputFileNotFoundError, SweepAxisError
+from pyheat1d.sweep import expand_grid, parse_axis, run_sweep
+
+BASE = {
+    "ndiv": 10,
+    "prop": {"k": 1.0, "ro": 2.0, "cp": 3.0},
+    "rbc": {"type": 3, "params": {"value": 30.0, "h": 1.0}},
+}
+
+
+@pytest.mark.unitary
+def test_parse_axis():
+    assert parse_axis("ndiv=10,20") == ("ndiv", [10, 20])
+    assert parse_axis("prop.k = 1.0, 2.5") == ("prop.k", [1.0, 2.5])
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("axis", ["ndiv", "ndiv=", "=1,2", "ndiv=a,b"])
+def test_negative_parse_axis(axis):
+    with pytest.raises(SweepAxisError, match="da varredura é inválido."):
+        parse_axis(axis)
+
+
+@pytest.mark.unitary
+def test_expand_grid():
+    cases = expand_grid(BASE, [("ndiv", [10, 20]), ("rbc.params.h", [1.0, 2.0, 3.0])])
+
+    assert len(cases) == 6
+
+    params, infos = cases[5]
+    assert params == {"ndiv": 20, "rbc.params.h": 3.0}
+    assert infos["ndiv"] == 20
+    assert infos["rbc"]["params"] == {"value": 30.0, "h": 3.0}
+
+    assert BASE["rbc"]["params"]["h"] == 1.0
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize("key", ["lbc.params.h", "prop.kk", "rbc.params.hh", "nsteps"])
+def test_negative_expand_grid_wrong_key(key):
+    with pytest.raises(SweepAxisError, match=f"O eixo '{key}' da varredura é inválido."):
+        expand_grid(BASE, [(key, [1.0])])
+
+
+@pytest.mark.unitary
+def test_expand_grid_optional_key():
+    (_, infos), *_ = expand_grid(BASE, [("theta", [0.5])])
+
+    assert infos["theta"] == 0.5
+
+
+@pytest.mark.unitary
+def test_negative_run_sweep_base_file_not_found(tmpdir):
+    with pytest.raises(InputFileNotFoundError, match="O arquivo de entrada não foi achado: missing.json."):
+        run_sweep(Path("missing.json"), ["ndiv=10"], Path(tmpdir))
+
+
+@pytest.mark.integration
+def test_run_sweep(tmpdir):
+    base_file = Path("tests/files/input/newton.json")
+    output_dir = Path(tmpdir)
+
+    summary = run_sweep(base_file, ["ndiv=10,20", "prop.k=1.0,2.0"], output_dir, workers=2)
+
+    assert len(summary) == 4
+    assert all(case["status"] == "ok" for case in summary)
+
+    assert json.load((output_dir / "sweep.json").open()) == summary
+
+    case_dir = output_dir / "case_0002"
+    assert {f.name for f in case_dir.iterdir()} == {"input.json", "mesh.json", "results.json", "time_log.json"}
+
+    mesh = json.load((case_dir / "mesh.json").open())
+    assert len(mesh["xp"]) == 20
+
+
+@pytest.mark.integration
+def test_run_sweep_unexpected_error_does_not_abort(tmpdir):
+    output_dir = Path(tmpdir)
+
+    summary = run_sweep(Path("tests/files/input/newton.json"), ['ndiv="x",10'], output_dir, workers=1)
+
+    assert [case["status"] for case in summary] == ["error", "ok"]
+    assert "TypeError" in summary[0]["error"]
+    assert json.load((output_dir / "sweep.json").open()) == summary
+
+
+@pytest.mark.integration
+def test_run_sweep_bc_series_file(tmpdir):
+    base_dir = Path(tmpdir.mkdir("base"))
+    (base_dir / "plant.csv").write_text("t,value\n0.0,10.0\n5000.0,50.0\n", encoding="utf-8")
+
+    base = json.load(open("tests/files/input/newton.json", encoding="utf-8"))
+    base["lbc"]["params"]["value"] = {"file": "plant.csv"}
+    base_file = base_dir / "input.json"
+    base_file.write_text(json.dumps(base), encoding="utf-8")
+
+    summary = run_sweep(base_file, ["ndiv=10,20"], Path(tmpdir.mkdir("sweep")), workers=1)
+
+    assert all(case["status"] == "ok" for case in summary)
+
+
+@pytest.mark.integration
+def test_run_sweep_source_files(tmpdir):
+    base_dir = Path(tmpdir.mkdir("base"))
+    np.save(base_dir / "q.npy", np.linspace(0.0, 1.0, 10))
+    (base_dir / "scale.csv").write_text("t,value\n0.0,1.0\n5000.0,0.0\n", encoding="utf-8")
+
+    base = json.load(open("tests/files/input/newton.json", encoding="utf-8"))
+    base["ndiv"] = 10
+    base["source"] = {"type": "cells", "params": {"file": "q.npy"}, "scale": {"file": "scale.csv"}}
+    base_file = base_dir / "input.json"
+    base_file.write_text(json.dumps(base), encoding="utf-8")
+
+    summary = run_sweep(base_file, ["dt=1.0,2.0"], Path(tmpdir.mkdir("sweep")), workers=1)
+
+    assert all(case["status"] == "ok" for case in summary)
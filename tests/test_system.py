@@ -6,3 +6,10 @@ def test_system():
 
     assert system.a.shape == (10, 3)
     assert system.b.shape == (10,)
+
+
+def test_system_batch():
+    system = System(neq=10, nbatch=4)
+
+    assert system.a.shape == (4, 10, 3)
+    assert system.b.shape == (4, 10)
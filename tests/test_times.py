@@ -85,3 +85,26 @@ def test_write_times_simulation(tmp_path):
 def test_negative_write_times_simulation_wrong_path():
     with pytest.raises(TimeLogWriteFileError, match="O arquivo 'wrong/time_log.json' não pode ser escrito."):
         run_times.write_log_simulation_times(folder=Path("wrong"))
+
+
+@pytest.mark.unitary
+def test_write_times_simulation_with_stats(tmp_path):
+    run_times.edp = 2.0
+    run_times.stats["accepted_steps"] = 10
+
+    folder = Path(tmp_path)
+
+    run_times.write_log_simulation_times(folder=folder)
+
+    data_read = json.load((folder / "time_log.json").open(mode="r", encoding="utf8"))
+
+    assert data_read == {
+        "edp": 2.000,
+        "solver": 0.000,
+        "cell_loop": 0.000,
+        "accepted_steps": 10,
+    }
+
+    run_times.reset()
+
+    assert run_times.stats == {}
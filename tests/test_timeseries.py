@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyheat1d.errors import BoundarySeriesError
+from pyheat1d.timeseries import TimeSeries, batch_time_series, time_series
+
+
+@pytest.mark.unitary
+def test_time_series_linear():
+    series = time_series({"t": [0.0, 1.0, 3.0], "values": [10.0, 20.0, 0.0]})
+
+    np.testing.assert_allclose(series(np.array([-1.0, 0.5, 1.0, 2.0, 5.0])), [10.0, 15.0, 20.0, 10.0, 0.0])
+    np.testing.assert_allclose(series(np.array([0.5, 2.0])), np.interp([0.5, 2.0], series.t, series.values))
+
+
+@pytest.mark.unitary
+def test_time_series_step():
+    series = time_series({"t": [0.0, 1.0, 3.0], "values": [10.0, 20.0, 0.0], "kind": "step"})
+
+    np.testing.assert_allclose(series(np.array([-1.0, 0.5, 1.0, 2.9, 5.0])), [10.0, 10.0, 20.0, 20.0, 0.0])
+
+
+@pytest.mark.unitary
+def test_time_series_single_value():
+    series = time_series({"t": [1.0], "values": [7.0]})
+
+    np.testing.assert_allclose(series(np.array([0.0, 1.0, 2.0])), [7.0, 7.0, 7.0])
+
+
+@pytest.mark.unitary
+def test_time_series_files(tmpdir):
+    base_dir = Path(tmpdir)
+    (base_dir / "plant.csv").write_text("t,value\n0.0,10.0\n2.0,30.0\n", encoding="utf-8")
+    np.save(base_dir / "plant.npy", np.array([[0.0, 10.0], [2.0, 30.0]]))
+
+    csv = time_series({"file": "plant.csv"}, base_dir)
+    npy = time_series({"file": str(base_dir / "plant.npy")})
+
+    assert csv.t.tolist() == npy.t.tolist() == [0.0, 2.0]
+    assert csv.values.tolist() == npy.values.tolist() == [10.0, 30.0]
+
+
+@pytest.mark.unitary
+def test_batch_time_series():
+    a = TimeSeries(t=np.array([0.0, 2.0]), values=np.array([0.0, 2.0]))
+    b = TimeSeries(t=np.array([1.0, 3.0]), values=np.array([5.0, 1.0]))
+
+    batch = batch_time_series([a, 4.0, b])
+
+    assert batch.values.shape == (4, 3)
+    times = np.array([0.5, 1.5, 2.5])
+    np.testing.assert_allclose(batch(times), np.stack([a(times), np.full(3, 4.0), b(times)], axis=-1))
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "spec, msg",
+    [
+        (
+            {"t": [0.0, 1.0], "values": [1.0, 2.0], "kind": "cubic"},
+            "A interpolação 'cubic' da série temporal não existe.",
+        ),
+        ({"t": [0.0, 1.0]}, "A série temporal precisa de 'file' ou de 't' e 'values'."),
+        ({"t": [1.0, 0.0], "values": [1.0, 2.0]}, "A série temporal precisa de tempos crescentes"),
+        ({"t": [0.0, 1.0], "values": [1.0]}, "A série temporal precisa de tempos crescentes"),
+        ({"file": "missing.csv"}, "O arquivo da série temporal não foi achado"),
+    ],
+)
+def test_negative_time_series(tmpdir, spec, msg):
+    with pytest.raises(BoundarySeriesError, match=msg):
+        time_series(spec, Path(tmpdir))
@@ -4,11 +4,18 @@ from pathlib import Path
 import numpy as np
 import pytest
 
+from pyheat1d.errors import ResultsFormatNotFoundError
+from pyheat1d.reader import open_results
 from pyheat1d.writer import (
+    AsyncResultsWriter,
     MeshWriter,
+    ResultsWriterChunked,
     ResultsWriterEveryNSteps,
     ResultsWriterEveryTime,
+    ResultsWriterJsonLines,
+    ResultsWriterNpy,
     results_writer_strategy,
+    retained_steps,
 )
 
 
@@ -105,3 +112,184 @@ def test_writer_mesh(tmpdir, mesh):
 
     for e, r in zip(expected_x, read_mesh["xp"]):
         assert e == pytest.approx(r)
+
+
+@pytest.mark.unitary
+def test_results_writer_strategy_jsonl():
+    path = Path("results.jsonl")
+
+    writer = results_writer_strategy(path, write_every_steps=4, results_format="jsonl")
+
+    assert isinstance(writer, ResultsWriterJsonLines)
+
+
+@pytest.mark.unitary
+def test_negative_results_writer_strategy_format_not_found():
+    with pytest.raises(ResultsFormatNotFoundError, match="O formato de resultados 'xml' não existe."):
+        results_writer_strategy(Path("results.xml"), results_format="xml")
+
+
+@pytest.mark.unitary
+def test_results_writer_json_lines(tmpdir):
+    path = tmpdir / "results.jsonl"
+
+    with ResultsWriterJsonLines(path, write_every_steps=2) as writer:
+        writer.append_in_buffer(0, 0.0, np.array([0.0, 0.0]))
+        writer.append_in_buffer(1, 1.0, np.array([1.0, 1.0]))
+        writer.append_in_buffer(2, 2.0, np.array([1.0, 2.0]))
+
+        # ... os passos já estão no arquivo antes do dump
+        lines = path.open().readlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1]) == {"istep": 2, "t": 2.0, "u": [1.0, 2.0]}
+
+        assert writer.buffer == []
+
+        writer.append_in_buffer(3, 3.0, np.array([1.0, 3.0]))
+        writer.append_in_buffer(4, 4.0, np.array([1.0, 4.0]))
+
+        writer.dump()
+
+    read_results = [json.loads(line) for line in path.open()]
+
+    assert [r["istep"] for r in read_results] == [0, 2, 4]
+    assert read_results[2] == {"istep": 4, "t": 4.0, "u": [1.0, 4.0]}
+
+
+@pytest.mark.unitary
+def test_async_results_writer(tmpdir):
+    path = tmpdir / "results.json"
+
+    u = np.zeros(2)
+    with AsyncResultsWriter(ResultsWriterEveryNSteps(path, indent=4, write_every_steps=2), queue_size=2) as writer:
+        for istep in range(7):
+            # ... o mesmo array é reutilizado pelo loop temporal
+            u[:] = istep
+            writer.append_in_buffer(istep, float(istep), u)
+
+        writer.dump()
+
+    read_results = json.load(path.open())
+
+    assert [r["istep"] for r in read_results] == [0, 2, 4, 6]
+    assert read_results[3] == {"istep": 6, "t": 6.0, "u": [6.0, 6.0]}
+
+
+@pytest.mark.unitary
+def test_async_results_writer_json_lines(tmpdir):
+    path = tmpdir / "results.jsonl"
+
+    with AsyncResultsWriter(ResultsWriterJsonLines(path), queue_size=1) as writer:
+        writer.append_in_buffer(0, 0.0, np.array([0.0, 0.0]))
+        writer.append_in_buffer(1, 1.0, np.array([1.0, 1.0]))
+        writer.dump()
+
+    read_results = [json.loads(line) for line in path.open()]
+
+    assert read_results == [{"istep": 0, "t": 0.0, "u": [0.0, 0.0]}, {"istep": 1, "t": 1.0, "u": [1.0, 1.0]}]
+
+
+@pytest.mark.unitary
+def test_async_results_writer_raises_thread_error(tmpdir):
+    class BrokenWriter(ResultsWriterEveryTime):
+        def _append_in_buffer(self, istep, t, u):
+            raise OSError("disco cheio")
+
+    with pytest.raises(OSError, match="disco cheio"):
+        with AsyncResultsWriter(BrokenWriter(tmpdir / "results.json")) as writer:
+            writer.append_in_buffer(0, 0.0, np.array([0.0, 0.0]))
+            writer.dump()
+
+
+@pytest.mark.unitary
+@pytest.mark.parametrize(
+    "nstep, write_every_steps, expected",
+    [
+        (8, None, 9),
+        (8, 1, 9),
+        (8, 4, 3),
+        (9, 4, 3),
+        (3, 4, 1),
+    ],
+)
+def test_retained_steps(nstep, write_every_steps, expected):
+    assert retained_steps(nstep, write_every_steps) == expected
+
+
+@pytest.mark.unitary
+def test_results_writer_strategy_npy():
+    writer = results_writer_strategy(Path("results.npy"), write_every_steps=4, results_format="npy", nstep=8)
+
+    assert isinstance(writer, ResultsWriterNpy)
+    assert writer.nretained == 3
+
+
+@pytest.mark.unitary
+def test_results_writer_npy(tmpdir):
+    path = Path(tmpdir) / "results.npy"
+
+    with ResultsWriterNpy(path, nstep=5, write_every_steps=2) as writer:
+        for istep in range(4):
+            writer.append_in_buffer(istep, float(istep), np.array([1.0, istep]))
+        writer.dump()
+
+    u = np.load(path, mmap_mode="r")
+    steps = np.load(path.parent / "results_steps.npy", mmap_mode="r")
+
+    assert isinstance(u, np.memmap)
+    np.testing.assert_array_equal(u[:2], [[1.0, 0.0], [1.0, 2.0]])
+    # ... o passo 4 não foi calculado, a linha fica marcada com istep = -1
+    assert steps["istep"].tolist() == [0, 2, -1]
+    assert steps["t"][:2].tolist() == [0.0, 2.0]
+
+
+@pytest.mark.unitary
+def test_results_writer_strategy_chunked():
+    writer = results_writer_strategy(
+        Path("results.chunks"), results_format="chunked", chunk_steps=16, chunk_cells=128, tolerance=1e-3
+    )
+
+    assert isinstance(writer, ResultsWriterChunked)
+    assert writer.chunk_steps == 16
+    assert writer.chunk_cells == 128
+    assert writer.tolerance == 1e-3
+
+
+@pytest.mark.unitary
+def test_results_writer_npy_grow(tmpdir):
+    path = Path(tmpdir) / "results.npy"
+
+    with ResultsWriterNpy(path, nstep=1) as writer:
+        for istep in range(5):
+            writer.append_in_buffer(istep, float(istep), np.array([istep, 1.0]))
+        writer.dump()
+
+    assert {f.name for f in Path(tmpdir).iterdir()} == {"results.npy", "results_steps.npy"}
+
+    u = np.load(path)
+    steps = np.load(path.parent / "results_steps.npy")
+
+    assert writer.nretained == len(u) == 8
+    np.testing.assert_array_equal(u[:5, 0], [0.0, 1.0, 2.0, 3.0, 4.0])
+    assert steps["istep"].tolist() == [0, 1, 2, 3, 4, -1, -1, -1]
+
+
+@pytest.mark.unitary
+def test_results_writer_npy_grow_many_times(tmpdir):
+    path = Path(tmpdir) / "results.npy"
+
+    with ResultsWriterNpy(path, nstep=1) as writer:
+        for istep in range(10):
+            writer.append_in_buffer(istep, 0.5 * istep, np.array([istep, -istep, 1.0]))
+            # ... depois de crescer o mapa aponta para o arquivo final, não para o temporário
+            assert Path(writer.u.filename).name == "results.npy"
+            assert Path(writer.steps.filename).name == "results_steps.npy"
+
+    assert writer.nretained == 16
+    assert {f.name for f in Path(tmpdir).iterdir()} == {"results.npy", "results_steps.npy"}
+
+    with open_results(Path(tmpdir)) as reader:
+        assert reader.istep.tolist() == list(range(10))
+        np.testing.assert_array_equal(reader.t, 0.5 * np.arange(10))
+        np.testing.assert_array_equal(reader.steps()[:, 0], np.arange(10))
+        np.testing.assert_array_equal(reader.step(-1), [9.0, -9.0, 1.0])